@@ -9,6 +9,7 @@ from yescieval.base.rubric import Rubric
 
 # Scikg_Extract Utility Imports
 from scikg_extract.utils.log_handler import LogHandler
+from scikg_extract.utils.json_utils import dumps_schema
 
 # Scikg_Extract Config Imports
 from scikg_extract.config.agents.orchestrator import OrchestratorConfig
@@ -169,28 +170,17 @@ def refine_extracted_knowledge_termination(state: ExtractionState) -> str:
     # Terminate the refinement loop if no retries left
     return END
 
-def orchestrate_extraction_workflow(orchestrator_config: OrchestratorConfig, workflow_config: WorkflowConfig) -> ExtractionState:
+def initialize_extraction_state(orchestrator_config: OrchestratorConfig, workflow_config: WorkflowConfig) -> ExtractionState:
     """
-    Orchestrates the overall extraction workflow containing structured knowledge extraction, LLM-as-a-Judge validation and reflection, and finally exporting the final structured knowledge.
+    Initializes the state object for the extraction workflow from the orchestrator and workflow configurations.
     Args:
         orchestrator_config (OrchestratorConfig): Configuration for the Orchestrator Agent.
         workflow_config (WorkflowConfig): Configuration for the overall extraction workflow.
     Returns:
-        ExtractionState: The final state containing the extracted and validated structured knowledge.
+        ExtractionState: The initial state of the extraction workflow.
     """
 
-    # Initialize the logger
-    logger = LogHandler.get_logger(__name__)
-    logger.info("Starting Orchestrator Agent for extraction workflow...")
-
-    # Validate the orchestrator configuration parameters upfront
-    validate_orchestrator_config_params(orchestrator_config, workflow_config)
-
-    # Create the state graph
-    graph = StateGraph(ExtractionState)
-    logger.debug("Created StateGraph for the Orchestractor Agent.")
-
-    # Step 1: Initialize the state object for the extraction workflow
+    # Initialize the state object for the extraction workflow
     state = {
         "extraction_llm": orchestrator_config.extraction_llm,
         "data_model": orchestrator_config.extraction_data_model,
@@ -198,6 +188,7 @@ def orchestrate_extraction_workflow(orchestrator_config: OrchestratorConfig, wor
         "process_description": ProcessConfig.Process_description,
         "process_property_constraints": ProcessConfig.Process_property_constraints,
         "process_schema": orchestrator_config.process_schema,
+        "process_schema_json": dumps_schema(orchestrator_config.process_schema),
         "process_instances_key": "processes",
         "scientific_document": orchestrator_config.scientific_document,
         "cleaned_extracted_json": workflow_config.clean_extracted_data,
@@ -208,7 +199,7 @@ def orchestrate_extraction_workflow(orchestrator_config: OrchestratorConfig, wor
     }
     state = ExtractionState(**state)
 
-    # Step 2: Extract structured knowledge using Extraction Agent
+    # Setup Normalization Config for the Extraction Agent if enabled in workflowConfig
     if workflow_config.normalize_extracted_data:
         state.normalization_llm = orchestrator_config.normalization_llm
         state.pubchem_lmdb_path = orchestrator_config.pubchem_lmdb_path
@@ -216,18 +207,8 @@ def orchestrate_extraction_workflow(orchestrator_config: OrchestratorConfig, wor
         state.normalization_properties_to_include = NormalizationConfig.include_paths
         state.normalization_properties_to_exclude = NormalizationConfig.exclude_paths
 
-    # Add the node for extraction agent
-    graph.add_node("extract_knowledge", extract_knowledge)
-    logger.debug("Added extract_knowledge node to the graph.")
-
-    # Add the edge from START to extraction agent
-    graph.add_edge(START, "extract_knowledge")
-    logger.debug("Added edge from START node to extract_knowledge node.")
-
-    # Step 3: Validate the extracted structured knowledge using Reflection Agent and feedback agent if enabled in workflowConfig
+    # Setup Reflection Config if validation is enabled in workflowConfig
     if workflow_config.validate_extracted_data:
-        
-        # Setup Reflection Config
         state.reflection_mode = workflow_config.reflection_mode
         state.reflection_llm = orchestrator_config.reflection_llm
         state.summarizer_llm = orchestrator_config.summarizer_llm
@@ -236,13 +217,46 @@ def orchestrate_extraction_workflow(orchestrator_config: OrchestratorConfig, wor
         state.rubric_names = orchestrator_config.rubrics
         state.debate_max_iterations = workflow_config.debate_max_iterations
 
-    # Step 4: Refine the extracted knowledge based on evaluation results using feedback agent if enabled in workflowConfig
+    # Setup Feedback Config if refinement is enabled in workflowConfig
     if workflow_config.refine_extracted_data:
-        
-        # Setup Feedback Config
         state.feedback_llm = orchestrator_config.feedback_llm
         state.total_validation_retries = workflow_config.total_validation_retries
 
+    # Return the initialized state
+    return state
+
+def orchestrate_extraction_workflow(orchestrator_config: OrchestratorConfig, workflow_config: WorkflowConfig) -> ExtractionState:
+    """
+    Orchestrates the overall extraction workflow containing structured knowledge extraction, LLM-as-a-Judge validation and reflection, and finally exporting the final structured knowledge.
+    Args:
+        orchestrator_config (OrchestratorConfig): Configuration for the Orchestrator Agent.
+        workflow_config (WorkflowConfig): Configuration for the overall extraction workflow.
+    Returns:
+        ExtractionState: The final state containing the extracted and validated structured knowledge.
+    """
+
+    # Initialize the logger
+    logger = LogHandler.get_logger(__name__)
+    logger.info("Starting Orchestrator Agent for extraction workflow...")
+
+    # Validate the orchestrator configuration parameters upfront
+    validate_orchestrator_config_params(orchestrator_config, workflow_config)
+
+    # Create the state graph
+    graph = StateGraph(ExtractionState)
+    logger.debug("Created StateGraph for the Orchestractor Agent.")
+
+    # Step 1: Initialize the state object for the extraction, reflection and feedback agents
+    state = initialize_extraction_state(orchestrator_config, workflow_config)
+
+    # Add the node for extraction agent
+    graph.add_node("extract_knowledge", extract_knowledge)
+    logger.debug("Added extract_knowledge node to the graph.")
+
+    # Add the edge from START to extraction agent
+    graph.add_edge(START, "extract_knowledge")
+    logger.debug("Added edge from START node to extract_knowledge node.")
+
     # Add the node for reflection agent
     graph.add_node("validate_extracted_processes", validate_extracted_processes)
     logger.debug("Added validate_extracted_processes node to the graph.")
@@ -282,5 +296,5 @@ def orchestrate_extraction_workflow(orchestrator_config: OrchestratorConfig, wor
     # Log the iteration durations for each iteration of the workflow
     timing_callback.log_summary()
 
-    # Step 5: Return the final extracted and validated structured knowledge
+    # Step 2: Return the final extracted and validated structured knowledge
     return final_state
\ No newline at end of file
@@ -33,6 +33,9 @@ class ExtractionState(BaseModel):
     # Process Schema
     process_schema: dict
 
+    # Process Schema serialized for the extraction prompt, serialized from the process schema if empty
+    process_schema_json: str = ""
+
     # Key containing process instances
     process_instances_key: str
 
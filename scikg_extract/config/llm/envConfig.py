@@ -65,6 +65,7 @@ class EnvConfig:
     REFLECTION_MODE = os.getenv("REFLECTION_MODE", "single")
     DEBATE_MAX_ITERATIONS = int(os.getenv("DEBATE_MAX_ITERATIONS", 3))
     JUDGE_num_retry = int(os.getenv("JUDGE_NUM_RETRY", 2))
+    JUDGE_max_concurrency = int(os.getenv("JUDGE_MAX_CONCURRENCY", 8))
 
     # Data Path Configuration
     SCHEMA_PATH = os.getenv("SCHEMA_PATH") or None
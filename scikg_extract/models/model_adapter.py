@@ -8,6 +8,7 @@ import json
 import logging
 from typing import Any, get_origin
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 # Pydantic Imports
 from pydantic import BaseModel
@@ -166,6 +167,29 @@ class ModelAdapter(ABC):
         self.logger.debug(f"Maximum retries exhausted. No response obtained from the model: {self.model_name}")
         raise RuntimeError(f"Maximum retries exhausted. No response obtained from the model: {self.model_name}")
 
+    def structured_batch_completion(self, prompt_template, var_dicts: list[dict], data_model, max_concurrency: int = 8) -> list[Any | None]:
+        """
+        Calls the structured completion API for a batch of prompts concurrently through this adapter, so all requests share one model client and its connection pool. Each prompt keeps the retry and fallback handling of `structured_completion`, and a failed prompt does not discard the outputs of the others.
+        Args:
+            prompt_template: The prompt template containing placeholders for dynamic values.
+            var_dicts (list[dict]): One dictionary of prompt variables per request in the batch.
+            data_model: The Pydantic BaseModel class that defines the structure of the expected output.
+            max_concurrency (int, optional): Maximum number of requests in flight. Defaults to 8.
+        Returns:
+            list[Any | None]: The structured outputs in the order of `var_dicts`, with None for failed requests.
+        """
+        if not var_dicts: return []
+
+        def complete(var_dict: dict) -> Any | None:
+            try:
+                return self.structured_completion(prompt_template, var_dict, data_model)
+            except Exception as e:
+                self.logger.warning(f"Structured completion failed for a batch request to model {self.model_name}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(var_dicts)))) as executor:
+            return list(executor.map(complete, var_dicts))
+
     @abstractmethod
     def completion(self, prompt_template, var_dict) -> Any | None:
         pass
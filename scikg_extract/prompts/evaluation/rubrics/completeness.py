@@ -1,26 +1,11 @@
-system_prompt = """
-Context: 
-Scientific structured knowledge extraction involves converting information from scientific articles into a structured knowledge representation that adheres to a predefined process schema. Structured extraction is rigorous and schema-dependent and requires:
-- Schema-Guided Extraction: The extraction must follow a process schema that defines all valid properties, data types, constraints, and valid values. Each process instance extracted from the document must strictly comply with the schema contraints. But since scientific articles may not report all the required properties, some properties may be missing or null. So as long as the extraction adheres to the schema contraints for the reported properties, it is considered valid. 
-- Extraction of Multiple Processes: A scientific article may describe one or more experimental processes. The extraction must identify and represent each distinct process as a separate structured object. The final output should therefore be a list of processes, containing one process if only a single experiment is reported, or multiple processes when several are described.
-- Semantic Coherence of Each Process: Each extracted process, when viewed as a whole, must form a coherent, scientifically plausible unit that a domain expert would recognize as a valid representation of the experiment reported by the authors. The combination of all property values within a process should reflect their relationships as described in the article.
-- Factual Alignment: The value for each property must accurately reflect the information in the scientific document. This includes verifying factual consistency, identifying anomalies, and ensuring complete interpretation of textual and numerical information.
-- Unit and Numerical Validity: All numerical values must be valid, correctly extracted, complete and paired with QUDT-compliant units as required by the schema.
-- Traceability: Every extracted property-value pair must be traceable to the source text, ensuring grounding, verifiability, and transparency.
-- Quality Evaluation: The extracted data should be evaluable using a completeness characteristic, ensuring that the extraction accurately captures the processes described by the authors and can in principle support replication of the experiment.
+# Scikg_extract Prompt Imports
+from scikg_extract.prompts.evaluation.rubrics import shared
 
-In essence, structured scientific knowledge extraction is a schema-driven transformation task that requires careful interpretation, accurate extraction, and valid structuring of experimental information so that each extracted process reflects the procedure carried out in the scientific article.
-
-Process Definition:
-The scientific articles are related to the following process:
-- Process Name: {process_name}
-- Process Description: {process_description}
-
-Role:
-You are tasked as a scientific structured knowledge quality evaluator.
+system_prompt = shared.system_prompt
 
+user_prompt = shared.evaluation_input + """
 Task Description:
-A user will provide you with a scientific article, a process schema in JSON format, and an extracted structured output in JSON format. Your task is to evaluate whether the extracted structured data completely represents the processes described in the scientific article while fully adhering to the constraints of the provided schema. The evaluation should determine if each extracted process accurately reflects the information in the article and is traceable to the source text while also complying with the schema constraints. Also enure that the extraction is coherent and scientifically valid process consistent with the author's reported procedures.
+Your task is to evaluate whether the extracted structured data completely represents the processes described in the scientific article while fully adhering to the constraints of the provided schema. The evaluation should determine if each extracted process accurately reflects the information in the article and is traceable to the source text while also complying with the schema constraints. Also enure that the extraction is coherent and scientifically valid process consistent with the author's reported procedures.
 
 Your evaluation should be based solely on the article, the schema, and the extracted JSON data. The overall objective is to assess the completeness of the extraction with respect to both the source content and the schema.
 
@@ -49,20 +34,4 @@ Example Response:
 {{
   "Completeness": {{"rating": "4", "rationale": "All processes are included and required properties are present, but the article reports a substrate that is not included in the extraction. This property should be added to ensure completeness."}}
 }}
-
-Note:
-Your evaluation should be based solely on the content of the provided scientific article, process schema and the extracted data. Ensure your rationale is objective and backed by specific examples from the provided material.
 """
-
-user_prompt = """
-Evaluate the extracted structured data against the scientific article and process schema based on the completeness characteristic as defined in the system prompt.
-
-Scientific Article:
-{scientific_article}
-
-Process Schema:
-{process_schema}
-
-Extracted Structured Data:
-{extracted_data}
-"""
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+OpenAI Batch Service for SciKGExtract.
+
+Provides the shared OpenAI Batch API workflow of the batch judge and batch extractor services. Requests are uploaded as one JSONL file per batch, and each submitted batch is persisted with the destination of its results in a `.batches` directory of the results directory, so a later poll can download the completed batches and dispatch their outputs by custom_id.
+"""
+# Python imports
+import os
+import json
+import hashlib
+import logging
+from typing import Iterator
+
+# External imports
+from openai import OpenAI
+from pydantic import BaseModel
+from langchain_core.messages import convert_to_openai_messages
+
+# Scikg_extract Config Imports
+from scikg_extract.config.llm.envConfig import EnvConfig
+from scikg_extract.config.llm.llmConfig import ProviderRegistry
+
+class OpenAIBatchService:
+    """
+    Submits chat completion requests to the OpenAI Batch API and collects the outputs of the completed batches.
+    """
+
+    # Directory within the results directory in which submitted batches are persisted
+    BATCHES_DIR = ".batches"
+
+    # Batch API endpoint and completion window
+    ENDPOINT = "/v1/chat/completions"
+    COMPLETION_WINDOW = "24h"
+
+    # Batch statuses after which a batch makes no further progress
+    TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+    def __init__(self, llm_model: str, results_dir: str, temperature: float, data_model: type[BaseModel]) -> None:
+        """
+        Initializes the batch service with the OpenAI client and the directory of persisted batches.
+        Args:
+            llm_model (str): The OpenAI model, optionally prefixed with its provider (e.g., "OPENAI:gpt-5").
+            results_dir (str): The results directory, in which submitted batches are persisted.
+            temperature (float): Sampling temperature of the model. Not sent to reasoning models.
+            data_model (type[BaseModel]): The Pydantic data model of a response.
+        """
+        self.model = ProviderRegistry.parse_llm_string(llm_model)[0]
+        self.temperature = temperature
+        self.data_model = data_model
+        self.batches_dir = os.path.join(results_dir, self.BATCHES_DIR)
+        self.client = OpenAI(api_key=EnvConfig.OPENAI_api_key, organization=EnvConfig.OPENAI_organization_id)
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def build_custom_id(filepath: str) -> str:
+        """
+        Builds the stable identifier of a file used in the batch request custom_ids.
+        Args:
+            filepath (str): Path to the file whose results are requested.
+        Returns:
+            str: The SHA-256 hex digest of the filepath.
+        """
+        return hashlib.sha256(filepath.encode("utf-8")).hexdigest()
+
+    def response_format(self) -> dict:
+        """
+        Builds the JSON schema response format of a response from the data model.
+        Returns:
+            dict: The response_format parameter of the chat completion request.
+        """
+        return {"type": "json_schema", "json_schema": {"name": self.data_model.__name__, "schema": self.data_model.model_json_schema()}}
+
+    def build_request(self, custom_id: str, messages: list) -> dict:
+        """
+        Builds one Batch API chat completion request.
+        Args:
+            custom_id (str): The identifier of the request.
+            messages (list): The Langchain messages of the prompt.
+        Returns:
+            dict: The Batch API request.
+        """
+        # Reasoning models only support the default temperature
+        body = {
+            "model": self.model,
+            "messages": convert_to_openai_messages(messages),
+            "max_completion_tokens": EnvConfig.OPENAI_max_tokens,
+            "response_format": self.response_format()
+        }
+        if not self.model.startswith(("gpt-5", "o1", "o3", "o4")): body["temperature"] = self.temperature
+        return {"custom_id": custom_id, "method": "POST", "url": self.ENDPOINT, "body": body}
+
+    def submit(self, requests: list[dict], jobs: dict[str, list[str]], record_fields: dict | None = None) -> str:
+        """
+        Uploads the requests as a JSONL file, creates the batch and persists it in the batches directory.
+        Args:
+            requests (list[dict]): The Batch API requests.
+            jobs (dict[str, list[str]]): The destination of the results of each file, keyed by its custom_id.
+            record_fields (dict | None, optional): Additional fields persisted in the batch record for collecting its outputs. Defaults to None.
+        Returns:
+            str: The ID of the created batch.
+        """
+        # Upload the requests and create the batch
+        payload = "\n".join(json.dumps(request, ensure_ascii=False) for request in requests).encode("utf-8")
+        batch_file = self.client.files.create(file=("batch_requests.jsonl", payload), purpose="batch")
+        batch = self.client.batches.create(input_file_id=batch_file.id, endpoint=self.ENDPOINT, completion_window=self.COMPLETION_WINDOW)
+        self.logger.info(f"Submitted batch {batch.id} with {len(requests)} requests.")
+
+        # Persist the batch with the destination of each file's results
+        os.makedirs(self.batches_dir, exist_ok=True)
+        with open(os.path.join(self.batches_dir, f"{batch.id}.json"), "w", encoding="utf-8") as f:
+            json.dump({"batch_id": batch.id, "jobs": jobs, **(record_fields or {})}, f, indent=4)
+        return batch.id
+
+    def records(self) -> list[tuple[str, dict]]:
+        """
+        Loads the batches persisted in the batches directory.
+        Returns:
+            list[tuple[str, dict]]: The path and record of each persisted batch.
+        """
+        if not os.path.isdir(self.batches_dir): return []
+        records = []
+        for entry in os.scandir(self.batches_dir):
+            if not entry.name.endswith(".json"): continue
+            with open(entry.path, "r", encoding="utf-8") as f:
+                records.append((entry.path, json.load(f)))
+        return records
+
+    def pending_custom_ids(self) -> set[str]:
+        """
+        Lists the files whose results are part of a submitted batch that has not been collected yet.
+        Returns:
+            set[str]: The custom_ids of the pending files.
+        """
+        return {custom_id for _, record in self.records() for custom_id in record["jobs"]}
+
+    def completed_outputs(self) -> Iterator[tuple[dict, list[tuple[str, str]]]]:
+        """
+        Downloads the outputs of all persisted batches that have ended, i.e. completed, failed, expired or cancelled. Failed, expired and cancelled batches yield the outputs of the requests they finished, if any. An ended batch is removed from the batches directory once its outputs have been consumed, so files without an output can be submitted again.
+        Returns:
+            Iterator[tuple[dict, list[tuple[str, str]]]]: The record of each ended batch with the custom_id and response content of its successful requests.
+        """
+        for record_path, record in self.records():
+
+            # Skip batches which are still in progress
+            batch = self.client.batches.retrieve(record["batch_id"])
+            if batch.status not in self.TERMINAL_STATUSES:
+                self.logger.info(f"Batch {batch.id} is {batch.status}.")
+                continue
+
+            # Log the reasons of batches and requests that did not complete
+            if batch.status != "completed":
+                errors = [error.message for error in batch.errors.data or []] if batch.errors else []
+                self.logger.warning(f"Batch {batch.id} ended as {batch.status}: {errors}")
+            if batch.error_file_id:
+                self.logger.warning(f"Batch {batch.id} has failed requests, see error file {batch.error_file_id}.")
+
+            # Collect the response content of each successful request
+            outputs = []
+            output_text = self.client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+            for line in output_text.splitlines():
+                if not line.strip(): continue
+                output = json.loads(line)
+                response = output.get("response") or {}
+                if response.get("status_code") != 200:
+                    self.logger.warning(f"Batch request {output['custom_id']} failed: {output.get('error')}")
+                    continue
+                outputs.append((output["custom_id"], response["body"]["choices"][0]["message"]["content"]))
+
+            yield record, outputs
+            os.remove(record_path)
+            self.logger.info(f"Collected {len(outputs)} outputs of batch {batch.id}.")
@@ -0,0 +1,77 @@
+"""
+OpenAI Batch Extractor Service for SciKGExtract.
+
+Submits structured knowledge extraction requests through the OpenAI Batch API instead of real-time chat completions, which halves the request cost of extracting large offline document collections. Each scientific document becomes one JSONL request formatted with the same extraction prompt as the extraction tool, whose custom_id identifies the document. Submitted batches are persisted in a `.batches` directory of the results directory, so a later poll can download the completed batches and save the extracted knowledge of each document.
+"""
+# Python imports
+import json
+
+# External imports
+from pydantic import BaseModel, ValidationError
+
+# Scikg_extract Model Imports
+from scikg_extract.models.model_adapter import ModelAdapter
+
+# Scikg_extract Agent Imports
+from scikg_extract.agents.states import ExtractionState
+
+# Scikg_extract Tool Imports
+from scikg_extract.tools.extraction.structured_knowledge_extraction import format_prompt_variables
+
+# Scikg_extract Service Imports
+from scikg_extract.services.openai_batch import OpenAIBatchService
+
+# Scikg_extract Prompt Imports
+from scikg_extract.prompts.tools import structure_knowledge_extraction
+
+class OpenAIBatchExtractor(OpenAIBatchService):
+    """
+    Submits structured knowledge extractions to the OpenAI Batch API and collects the completed results.
+    """
+
+    def __init__(self, llm_model: str, results_dir: str, data_model: type[BaseModel], temperature: float = 0.1) -> None:
+        """
+        Initializes the batch extractor with the OpenAI client and the directory of persisted batches.
+        Args:
+            llm_model (str): The OpenAI model used for extraction, optionally prefixed with its provider (e.g., "OPENAI:gpt-5").
+            results_dir (str): The results directory of the extraction, in which submitted batches are persisted.
+            data_model (type[BaseModel]): The Pydantic data model of the extracted knowledge.
+            temperature (float, optional): Sampling temperature of the extraction. Not sent to reasoning models. Defaults to 0.1.
+        """
+        super().__init__(llm_model, results_dir, temperature, data_model)
+
+    def build_extraction_request(self, custom_id: str, state: ExtractionState) -> dict:
+        """
+        Builds the Batch API request extracting the structured knowledge of a scientific document.
+        Args:
+            custom_id (str): The identifier of the scientific document.
+            state (ExtractionState): The initial extraction state of the scientific document.
+        Returns:
+            dict: The Batch API request.
+        """
+        # Format the extraction prompt exactly as the extraction tool does
+        prompt = ModelAdapter.format_prompt_template(structure_knowledge_extraction, format_prompt_variables(state))
+        return self.build_request(custom_id, prompt.to_messages())
+
+    def poll(self) -> dict[str, tuple[list[str], dict]]:
+        """
+        Collects the extracted knowledge of all persisted batches that have completed. Completed batches are removed from the batches directory once collected.
+        Returns:
+            dict[str, tuple[list[str], dict]]: The results directory and JSON filename with the extracted knowledge of each collected document, keyed by its custom_id.
+        """
+        collected = {}
+        for record, outputs in self.completed_outputs():
+            for custom_id, content in outputs:
+                if custom_id not in record["jobs"]: continue
+
+                # Parse the extracted knowledge, wrapping raw JSON arrays as the model adapters do
+                try:
+                    try:
+                        extracted_info = self.data_model.model_validate_json(content)
+                    except ValidationError as e:
+                        extracted_info = ModelAdapter._try_wrap_list_output(content, self.data_model, e)
+                except ValidationError as e:
+                    self.logger.warning(f"Extraction output of {custom_id} does not match the data model: {e}")
+                    continue
+                collected[custom_id] = (record["jobs"][custom_id], json.loads(extracted_info.model_dump_json()))
+        return collected
@@ -0,0 +1,120 @@
+"""
+OpenAI Batch Judge Service for SciKGExtract.
+
+Submits LLM-as-a-Judge evaluation requests through the OpenAI Batch API instead of real-time chat completions, which halves the request cost and removes live rate-limit contention for large, latency-tolerant evaluation runs. Each rubric evaluation of an extracted data file becomes one JSONL request whose custom_id identifies the file and rubric. Submitted batches are persisted in a `.batches` directory of the results directory, so a later poll can download the completed batches and fan the ratings back into the per-file evaluation results.
+"""
+# Python imports
+from types import SimpleNamespace
+
+# External imports
+from pydantic import BaseModel, ValidationError
+
+# Scikg_extract Config Imports
+from scikg_extract.config.process.processConfig import ProcessConfig
+
+# Scikg_extract Model Imports
+from scikg_extract.models.model_adapter import ModelAdapter
+
+# Scikg_extract Agent Imports
+from scikg_extract.agents.states import ExtractionState
+
+# Scikg_extract Service Imports
+from scikg_extract.services.openai_batch import OpenAIBatchService
+
+# Data model for Evaluation Ratings
+from data.models.evaluation.evaluation_rating import EvaluationRating
+
+class OpenAIBatchJudge(OpenAIBatchService):
+    """
+    Submits LLM-as-a-Judge evaluations to the OpenAI Batch API and collects the completed results.
+    """
+
+    def __init__(self, llm_model: str, results_dir: str, temperature: float = 0.1, data_model: type[BaseModel] = EvaluationRating) -> None:
+        """
+        Initializes the batch judge with the OpenAI client and the directory of persisted batches.
+        Args:
+            llm_model (str): The OpenAI model used as a Judge, optionally prefixed with its provider (e.g., "OPENAI:gpt-5").
+            results_dir (str): The results directory of the evaluation, in which submitted batches are persisted.
+            temperature (float, optional): Sampling temperature of the judge. Not sent to reasoning models. Defaults to 0.1.
+            data_model (type[BaseModel], optional): The Pydantic data model of a rubric evaluation. Defaults to EvaluationRating.
+        """
+        super().__init__(llm_model, results_dir, temperature, data_model)
+
+    def response_format(self) -> dict:
+        """
+        Builds the strict JSON schema response format of a rubric evaluation from the data model.
+        Returns:
+            dict: The response_format parameter of the chat completion request.
+        """
+        schema = self.data_model.model_json_schema()
+        schema["additionalProperties"] = False
+        schema["required"] = list(schema["properties"])
+        return {"type": "json_schema", "json_schema": {"name": self.data_model.__name__, "schema": schema, "strict": True}}
+
+    def build_requests(self, custom_id: str, state: ExtractionState) -> list[dict]:
+        """
+        Builds one Batch API request per rubric of the evaluation state.
+        Args:
+            custom_id (str): The identifier of the extracted data file.
+            state (ExtractionState): The initial evaluation state of the extracted data file.
+        Returns:
+            list[dict]: The Batch API requests with custom_ids in the format "<custom_id>:<rubric name>".
+        """
+        requests = []
+        for rubric in state.rubric_names:
+            # Initialize the rubric with the document, schema and extracted data
+            rubric_instance = rubric(
+                scientific_article=state.scientific_document,
+                process_schema=state.process_schema,
+                extracted_data=state.extracted_json if not state.normalized_json else state.normalized_json
+            )
+
+            # Format the rubric prompts exactly as the online judges do
+            var_dict = {"process_name": ProcessConfig.Process_name, "process_description": ProcessConfig.Process_description, "scientific_article": rubric_instance.scientific_article, "process_schema": rubric_instance.process_schema, "extracted_data": rubric_instance.extracted_data}
+            prompt_template = SimpleNamespace(system_prompt=rubric_instance.system_prompt_template, user_prompt=rubric_instance.user_prompt_template)
+            prompt = ModelAdapter.format_prompt_template(prompt_template, var_dict)
+
+            requests.append(self.build_request(f"{custom_id}:{rubric.get_rubric_name().lower()}", prompt.to_messages()))
+        return requests
+
+    def submit(self, requests: list[dict], jobs: dict[str, list[str]]) -> str:
+        """
+        Submits the rubric evaluation requests as a batch, persisting the evaluated rubrics with the batch so a poll can tell complete evaluations from partial ones.
+        Args:
+            requests (list[dict]): The Batch API requests built by build_requests.
+            jobs (dict[str, list[str]]): The destination of the evaluation results of each file, keyed by its custom_id.
+        Returns:
+            str: The ID of the created batch.
+        """
+        rubrics = sorted({request["custom_id"].rsplit(":", 1)[1] for request in requests})
+        return super().submit(requests, jobs, {"rubrics": rubrics})
+
+    def poll(self) -> dict[str, tuple[list[str], dict]]:
+        """
+        Collects the evaluation results of all persisted batches that have ended. Ended batches are removed from the batches directory once collected. Files missing the evaluation of any rubric, including evaluations that do not match the data model, are left out, so they are submitted again.
+        Returns:
+            dict[str, tuple[list[str], dict]]: The results directory and evaluation filename with the evaluation results of each collected file, keyed by its custom_id.
+        """
+        collected = {}
+        for record, outputs in self.completed_outputs():
+
+            # Parse the rubric evaluations of each request
+            results: dict[str, dict] = {}
+            for output_custom_id, content in outputs:
+                custom_id, rubric_name = output_custom_id.rsplit(":", 1)
+                try:
+                    evaluation_rating = self.data_model.model_validate_json(content)
+                except ValidationError as e:
+                    self.logger.warning(f"Evaluation output of {output_custom_id} does not match the data model: {e}")
+                    continue
+                results.setdefault(custom_id, {})[rubric_name] = evaluation_rating.model_dump()
+
+            # Collect only the files evaluated on every rubric of the batch
+            rubrics = set(record.get("rubrics", []))
+            for custom_id, evaluation in results.items():
+                if custom_id not in record["jobs"]: continue
+                if not rubrics.issubset(evaluation):
+                    self.logger.warning(f"Evaluation of {custom_id} is missing rubrics {sorted(rubrics - evaluation.keys())}. Leaving it to be submitted again.")
+                    continue
+                collected[custom_id] = (record["jobs"][custom_id], evaluation)
+        return collected
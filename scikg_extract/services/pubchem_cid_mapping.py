@@ -4,71 +4,142 @@ PubChem CID Mapping Service for SciKGExtract.
 Provides functionality to build an LMDB database mapping chemical synonyms to PubChem CIDs from a TSV file, and to perform lookups with exact, substring, and fuzzy matching. This service is used during the normalization step of the extraction process to resolve chemical entities to their corresponding PubChem CIDs based on the extracted synonyms.
 """
 # Python imports
+import os
+import mmap
 import zlib
 import logging
-from typing import List, Tuple
+import threading
+import multiprocessing
+import multiprocessing.pool
+from collections import deque
+from functools import partial
+from typing import Callable, Iterable, Iterator, List, Tuple
 
 # External imports
 import lmdb
 from rapidfuzz import fuzz
 
-def build_lmdb_from_file(input_file: str, lmdb_path: str, map_size: int = 15 * 1024**3, compression: bool = True) -> None:
+# Shared read-only LMDB environments per database path, as LMDB forbids opening the same environment twice in one process
+_shared_envs: dict[str, lmdb.Environment] = {}
+_shared_envs_lock = threading.Lock()
+
+def _tsv_chunk_boundaries(input_file: str, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Split a TSV file into byte ranges of about chunk_size bytes, each ending at a line boundary.
+    Args:
+        input_file (str): Path to the TSV file.
+        chunk_size (int): Approximate size of each byte range in bytes.
+    Returns:
+        List[Tuple[int, int]]: The start and end byte offsets of each range.
+    """
+    boundaries: List[Tuple[int, int]] = []
+    with open(input_file, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size: return boundaries
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                newline = mm.find(b'\n', min(start + chunk_size, size) - 1)
+                end = size if newline == -1 else newline + 1
+                boundaries.append((start, end))
+                start = end
+    return boundaries
+
+def _parse_tsv_chunk(input_file: str, compression: bool, chunk: Tuple[int, int]) -> List[Tuple[bytes, bytes]]:
+    """
+    Parse a byte range of a TSV file with CID and synonym columns into LMDB key-value pairs. Runs in the worker processes of build_lmdb_from_file.
+    Args:
+        input_file (str): Path to the TSV file.
+        compression (bool): Whether to compress the keys.
+        chunk (Tuple[int, int]): The start and end byte offsets of the range, ending at a line boundary.
+    Returns:
+        List[Tuple[bytes, bytes]]: The (synonym, CID) key-value pairs of the range in file order.
+    """
+    start, end = chunk
+    items: List[Tuple[bytes, bytes]] = []
+    with open(input_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for line in mm[start:end].decode('utf-8').split('\n'):
+
+            # Remove leading/trailing whitespace and skip empty lines
+            line = line.strip()
+            if not line: continue
+
+            # Split by tab, expecting two columns: CID and synonym
+            cid, synonym = line.split('\t')
+
+            # Encode key and value with utf-8, compressing the key if needed
+            key = synonym.encode('utf-8')
+            items.append((zlib.compress(key) if compression else key, cid.encode('utf-8')))
+    return items
+
+def _imap_bounded(pool: multiprocessing.pool.Pool, func: Callable, iterable: Iterable, max_pending: int) -> Iterator:
+    """
+    Apply a function to the items of an iterable on a process pool and yield the results in order, like Pool.imap, but with at most max_pending tasks submitted ahead of the consumer. Pool.imap submits every task up front, so its finished results pile up in memory whenever the consumer is slower than the workers.
+    Args:
+        pool (multiprocessing.pool.Pool): The process pool running the tasks.
+        func (Callable): The function applied to each item.
+        iterable (Iterable): The items to process.
+        max_pending (int): Maximum number of tasks submitted but not yet consumed.
+    Returns:
+        Iterator: The results of the function in the order of the items.
+    """
+    pending: deque = deque()
+    for item in iterable:
+        pending.append(pool.apply_async(func, (item,)))
+
+        # Wait for the oldest task once the window is full
+        if len(pending) >= max_pending: yield pending.popleft().get()
+
+    # Yield the results of the tasks still in flight
+    while pending: yield pending.popleft().get()
+
+def build_lmdb_from_file(input_file: str, lmdb_path: str, map_size: int = 15 * 1024**3, compression: bool = True, workers: int | None = None, chunk_size: int = 64 * 1024**2) -> None:
     """
-    Build an LMDB database from a tab-separated values (TSV) file with CID and synonym columns.
+    Build an LMDB database from a tab-separated values (TSV) file with CID and synonym columns. The memory-mapped file is split into line-aligned chunks that worker processes parse and compress in parallel, while this process writes the pairs in file order within a single write transaction. At most 2 x workers chunks are parsed ahead of the writer, so the parsed pairs held in memory peak at about 2 x workers x chunk_size of input plus its Python object overhead.
 
     Args:
         input_file (str): Path to the input TSV file.
         lmdb_path (str): Path to the output LMDB database.
         compression (bool): Whether to use compression for the values.
         map_size (int): Maximum size of the LMDB database in bytes.
+        workers (int | None): Number of worker processes parsing the file. Defaults to the number of CPUs.
+        chunk_size (int): Approximate size in bytes of the file chunk parsed by a worker at a time.
     """
 
     # Initialize logging
     logger = logging.getLogger(__name__)
     logger.info(f"Building LMDB database at {lmdb_path} from file {input_file}")
 
-    # Total processed counter and log interval
+    # Total processed counter
     total_processed = 0
-    log_interval = 100000
 
-    # Create or open the LMDB environment
-    env = lmdb.open(lmdb_path, map_size=map_size, subdir=False, readonly=False, metasync=False, sync=False, readahead=True, writemap=False)
+    # Create or open the LMDB environment without locking or syncing, as nothing else accesses the database while it is built
+    env = lmdb.open(lmdb_path, map_size=map_size, subdir=False, readonly=False, metasync=False, sync=False, map_async=True, readahead=True, writemap=True, lock=False)
+
+    # Split the input file into line-aligned chunks
+    chunks = _tsv_chunk_boundaries(input_file, chunk_size)
+    logger.info(f"Split input file into {len(chunks)} chunks")
+
+    # Keep at most two parsed chunks per worker in flight, so parsed chunks never pile up faster than they are written
+    workers = workers or os.cpu_count() or 1
+    max_pending = 2 * workers
+    parse_chunk = partial(_parse_tsv_chunk, input_file, compression)
 
     # Start a write transaction
-    logging.info("Starting to read input file and populate LMDB...")
-    with env.begin(write=True) as txn:
-        
-        # Read the input file line by line
-        with open(input_file, 'r', encoding='utf-8') as f:
-            
-            # Iterate through each line in the file
-            for line in f:
-                
-                # Remove leading/trailing whitespace and skip empty lines
-                line = line.strip()
-                if not line: continue
-
-                # Split by tab, expecting two columns: CID and synonym
-                cid, synonym = line.split('\t')
-
-                # Encode key and value with utf-8
-                key = synonym.encode('utf-8')
-                value = cid.encode('utf-8')
-
-                # Compress the value if needed
-                if compression:
-                    key = zlib.compress(key)
-                
-                # Store the key-value pair in the LMDB and update counter
-                txn.put(key, value)
-                total_processed += 1
-
-                # Log total processed entries
-                if total_processed % log_interval == 0:
-                    logger.info(f"Processed {total_processed} records...")
-    
-    # Close the LMDB environment
+    logger.info("Starting to read input file and populate LMDB...")
+    with env.begin(write=True) as txn, txn.cursor() as cursor, multiprocessing.Pool(workers) as pool:
+
+        # Store the key-value pairs of each parsed chunk in file order, so later duplicates still overwrite earlier ones
+        for items in _imap_bounded(pool, parse_chunk, chunks, max_pending):
+            cursor.putmulti(items)
+            total_processed += len(items)
+
+            # Log total processed entries
+            logger.info(f"Processed {total_processed} records...")
+
+    # Flush the database to disk once and close the LMDB environment
     logger.info(f"Finished building LMDB database with total {total_processed} records.")
+    env.sync(True)
     env.close()
 
 def open_env_for_read(lmdb_path: str, readonly: bool = True) -> lmdb.Environment:
@@ -86,6 +157,22 @@ def open_env_for_read(lmdb_path: str, readonly: bool = True) -> lmdb.Environment
     # Return the LMDB environment
     return env
 
+def get_shared_env(lmdb_path: str) -> lmdb.Environment:
+    """
+    Get the read-only LMDB environment of a database, opening it on first use and sharing it across documents and threads. Each lookup begins its own read transaction on the shared environment.
+    Args:
+        lmdb_path (str): Path to the LMDB database.
+    Returns:
+        lmdb.Environment: The shared read-only LMDB environment.
+    """
+    with _shared_envs_lock:
+        env = _shared_envs.get(lmdb_path)
+        if env is None:
+            # Synonym lookups are random reads, so readahead only pollutes the page cache
+            env = lmdb.open(lmdb_path, subdir=False, readonly=True, lock=False, readahead=False, max_readers=256)
+            _shared_envs[lmdb_path] = env
+        return env
+
 def lookup_by_synonym(env: lmdb.Environment, synonym: str, compression: bool = True, enable_fuzzy: bool = True, enable_substring_match: bool = True, match_threshold: int = 85) -> List[Tuple[str, str]]:
     """
     Lookup CIDs by synonym in the LMDB database with exact, substring, and fuzzy matching.
@@ -102,7 +189,7 @@ def lookup_by_synonym(env: lmdb.Environment, synonym: str, compression: bool = T
 
     # Initialize the logger
     logger = logging.getLogger(__name__)
-    logger.debug(f"Looking up synonym: {synonym} (Fuzzy: {enable_fuzzy}, Substring: {enable_substring_match})")
+    logger.debug("Looking up synonym: %s (Fuzzy: %s, Substring: %s)", synonym, enable_fuzzy, enable_substring_match)
 
     # Initialize list to hold matching CIDs
     matching_cids: List[Tuple[str, str]] = []
@@ -116,13 +203,13 @@ def lookup_by_synonym(env: lmdb.Environment, synonym: str, compression: bool = T
         # Try exact match first
         raw = txn.get(syn_key_c)
         if raw:
-            logger.debug(f"Exact match found for synonym: {synonym} with CID: {raw.decode('utf-8')}")
+            logger.debug("Exact match found for synonym: %s with CID: %s", synonym, raw.decode('utf-8'))
             matching_cids.append((synonym, raw.decode('utf-8')))
             return matching_cids
 
         # If not found, use substring to find the closest matches among all keys
         if enable_substring_match:
-            logger.debug(f"Attempting substring match for synonym: {synonym}")
+            logger.debug("Attempting substring match for synonym: %s", synonym)
             
             with txn.cursor() as cursor:
                 for key, value in cursor:
@@ -139,7 +226,7 @@ def lookup_by_synonym(env: lmdb.Environment, synonym: str, compression: bool = T
     
         # Filter list further with fuzzy matching and remove candidates below threshold
         if enable_fuzzy:
-            logger.debug(f"Attempting fuzzy match for synonym: {synonym} in the list of matching candidates having {len(matching_cids)} entries")
+            logger.debug("Attempting fuzzy match for synonym: %s in the list of matching candidates having %s entries", synonym, len(matching_cids))
 
             # Iterate over the matching CIDs and calculate fuzzy scores
             for key_str, cid in matching_cids.copy():
@@ -0,0 +1,144 @@
+"""
+Semantic Extraction Cache Service for SciKGExtract.
+
+Provides a persistent cache that maps scientific document embeddings to previously saved extraction results, so near-duplicate documents (e.g., reprints and preprints of the same paper) can reuse an earlier extraction instead of invoking the LLM again. Embeddings are computed with a sentence transformer, normalized, and compared by exact inner product (cosine similarity) against all cached entries created under the same cache key. Embeddings and entries are appended to their files as they are added, so persisting the cache costs the same for every entry.
+"""
+# Python imports
+import os
+import json
+import hashlib
+import logging
+import threading
+
+# External imports
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+class SemanticExtractionCache:
+    """
+    A persistent semantic cache of extraction results keyed by scientific document embeddings.
+    """
+
+    # Files persisted in the cache directory, with the embeddings stored as consecutive raw float32 vectors
+    EMBEDDINGS_FILE = "embeddings.f32"
+    ENTRIES_FILE = "entries.jsonl"
+
+    # Embeddings file of earlier versions, saved as one NumPy matrix and migrated on load
+    LEGACY_EMBEDDINGS_FILE = "embeddings.npy"
+
+    def __init__(self, cache_dir: str, cache_key: str, embedding_model: str = "all-MiniLM-L6-v2", threshold: float = 0.95):
+        """
+        Initializes the semantic cache and loads previously persisted entries from the cache directory.
+        Args:
+            cache_dir (str): Directory in which the cache embeddings and entries are persisted.
+            cache_key (str): Key identifying the extraction setup (e.g., schema and LLM). Only entries created under the same key are returned.
+            embedding_model (str, optional): The sentence transformer model used to embed documents. Defaults to "all-MiniLM-L6-v2".
+            threshold (float, optional): Minimum cosine similarity for a cache hit. Defaults to 0.95.
+        """
+        self.cache_dir = cache_dir
+        self.cache_key = cache_key
+        self.threshold = threshold
+        self.model = SentenceTransformer(embedding_model)
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+        # Load the persisted cache entries and their embeddings
+        os.makedirs(cache_dir, exist_ok=True)
+        self.dimension = self.model.get_sentence_embedding_dimension() or len(self.embed(""))
+        self.entries_path = os.path.join(cache_dir, self.ENTRIES_FILE)
+        self.embeddings_path = os.path.join(cache_dir, self.EMBEDDINGS_FILE)
+        legacy_embeddings_path = os.path.join(cache_dir, self.LEGACY_EMBEDDINGS_FILE)
+        entries: list[dict] = []
+        embeddings = np.empty((0, self.dimension), dtype=np.float32)
+        stored_bytes = -1
+        if os.path.exists(self.entries_path):
+            with open(self.entries_path, "r", encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        if os.path.exists(self.embeddings_path):
+            stored_bytes = os.path.getsize(self.embeddings_path)
+            vectors = np.fromfile(self.embeddings_path, dtype=np.float32)
+            embeddings = vectors[:len(vectors) - len(vectors) % self.dimension].reshape(-1, self.dimension)
+        elif os.path.exists(legacy_embeddings_path):
+            embeddings = np.load(legacy_embeddings_path).astype(np.float32)
+
+        # Keep entries and embeddings aligned if an earlier run was interrupted between the two writes, rewriting the files so later appends stay aligned
+        total_entries = min(len(entries), len(embeddings))
+        self.entries = entries[:total_entries]
+        if total_entries != len(entries) or total_entries * self.dimension * embeddings.itemsize != stored_bytes:
+            embeddings[:total_entries].tofile(self.embeddings_path)
+            with open(self.entries_path, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in self.entries)
+
+        # Hold the embeddings in a buffer with spare rows, doubled when full, so adding an entry does not copy all embeddings
+        self.buffer = np.empty((max(2 * total_entries, 64), self.dimension), dtype=np.float32)
+        self.buffer[:total_entries] = embeddings[:total_entries]
+        self.logger.info(f"Loaded semantic cache with {len(self.entries)} entries from: {cache_dir}")
+
+    @staticmethod
+    def build_cache_key(*parts) -> str:
+        """
+        Builds a stable cache key from the parts identifying an extraction setup.
+        Args:
+            *parts: JSON-serializable parts such as the process schema and LLM names.
+        Returns:
+            str: The SHA-256 hex digest of the serialized parts.
+        """
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def embed(self, document: str) -> np.ndarray:
+        """
+        Computes the normalized embedding of a scientific document.
+        Args:
+            document (str): The scientific document.
+        Returns:
+            np.ndarray: The normalized embedding vector.
+        """
+        return self.model.encode(document, normalize_embeddings=True).astype(np.float32)
+
+    def lookup(self, embedding: np.ndarray) -> dict | None:
+        """
+        Looks up the most similar cached entry created under the same cache key.
+        Args:
+            embedding (np.ndarray): The normalized embedding of the scientific document.
+        Returns:
+            dict | None: The cached entry if its similarity reaches the threshold, otherwise None.
+        """
+        with self.lock:
+            if not self.entries: return None
+
+            # Cosine similarity against all entries, ignoring entries from other extraction setups
+            scores = self.buffer[:len(self.entries)] @ embedding
+            same_key = np.fromiter((entry["cache_key"] == self.cache_key for entry in self.entries), dtype=bool, count=len(self.entries))
+            scores = np.where(same_key, scores, -1.0)
+
+            # Return the best match if it is similar enough
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold: return None
+            self.logger.debug(f"Semantic cache hit with similarity {scores[best]:.4f}: {self.entries[best]}")
+            return self.entries[best]
+
+    def add(self, embedding: np.ndarray, entry: dict) -> None:
+        """
+        Adds an entry to the cache and appends it to the files of the cache directory.
+        Args:
+            embedding (np.ndarray): The normalized embedding of the scientific document.
+            entry (dict): JSON-serializable details of the saved extraction results (e.g., their file paths).
+        """
+        with self.lock:
+            entry = {**entry, "cache_key": self.cache_key}
+            embedding = embedding.astype(np.float32, copy=False)
+
+            # Grow the embeddings buffer if it is full
+            total_entries = len(self.entries)
+            if total_entries == len(self.buffer):
+                buffer = np.empty((2 * len(self.buffer), self.dimension), dtype=np.float32)
+                buffer[:total_entries] = self.buffer
+                self.buffer = buffer
+            self.buffer[total_entries] = embedding
+            self.entries.append(entry)
+
+            # Append the embedding and then the entry, so an interrupted write leaves at most an unmatched embedding
+            with open(self.embeddings_path, "ab") as f:
+                embedding.tofile(f)
+            with open(self.entries_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
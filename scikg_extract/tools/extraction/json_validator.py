@@ -1,13 +1,10 @@
 """
 JSON Validator tool for SciKGExtract.
 
-This module defines the json_validator function, which serves as a tool in the SciKGExtract agent workflow to validate extracted JSON data against a predefined schema. It uses the validate_json_instance utility function to perform the validation and updates the ExtractionState with the results.
+This module defines the json_validator function, which serves as a tool in the SciKGExtract agent workflow to validate extracted JSON data against a predefined schema. It uses the compiled validator of the schema to perform the validation and updates the ExtractionState with the results.
 """
-# Python Imports
-import json
-
 # SciKGExtract Utility Imports
-from scikg_extract.utils.json_utils import validate_json_instance
+from scikg_extract.utils.json_utils import get_instance_validator
 from scikg_extract.utils.log_handler import LogHandler
 
 # SciKGExtract State Imports
@@ -29,8 +26,6 @@ def json_validator(state: ExtractionState) -> ExtractionState:
     # Extract schema and instance from the state
     schema = state.process_schema
     instance = state.extracted_json
-    logger.debug(f"Schema for validation: {json.dumps(schema)}")
-    logger.debug(f"Instance to validate: {json.dumps(instance)}")
 
     # Get the key containing nested JSON objects to validate
     process_instances_key = state.process_instances_key
@@ -39,13 +34,14 @@ def json_validator(state: ExtractionState) -> ExtractionState:
     process_instances = instance.get(process_instances_key, [])
     logger.debug(f"Extracted {len(process_instances)} process instances for validation.")
 
-    # Validate each process instance
+    # Validate each process instance with the compiled validator of the schema
+    is_valid_instance = get_instance_validator(schema)
     valid_json = True
     for index, process_instance in enumerate(process_instances):
         logger.debug(f"Validating process instance {index + 1}")
         
         # Validate the process instance
-        is_valid = validate_json_instance(process_instance, schema)
+        is_valid = is_valid_instance(process_instance)
         logger.debug(f"Instance Validation Result: {is_valid}")
 
         # Update valid_json flag
@@ -5,16 +5,23 @@ This module implements the PubChem normalization tool, which is responsible for
 """
 # Python imports
 import copy
-import asyncio
+import json
+import time
+import hashlib
+import atexit
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # External imports
 import lmdb
+import httpx
+import orjson
 from pydantic import BaseModel
 from httpx import HTTPStatusError
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 # Data Model Imports
-from data.models.api.pubchem_synonyms import PubChemSynonymsResponse
 from data.models.normalization.llm_disambiguation import LLM_Disambiguation
 
 # Scikg_Extract Config Imports
@@ -28,17 +35,63 @@ from scikg_extract.agents.states import ExtractionState
 from scikg_extract.prompts.tools import normalize_property_values
 
 # Scikg_Extract Service Imports
-from scikg_extract.services.pubchem_cid_mapping import open_env_for_read, lookup_by_synonym
+from scikg_extract.services.pubchem_cid_mapping import get_shared_env, lookup_by_synonym
 
 # Scikg_Extract Utils Imports
-from scikg_extract.utils.rest_client import RestClient
 from scikg_extract.utils.log_handler import LogHandler
+from scikg_extract.utils.file_utils import read_json_file, save_json_file
+from scikg_extract.utils.rest_client import RateLimiter, is_retryable_error, retry_delay
 from scikg_extract.utils.dict_utils import get_value_by_path, set_value_by_path
-from scikg_extract.utils.string_utils import normalize_string
+from scikg_extract.utils.string_utils import cid_from_uri, normalize_string
+
+# Directory of the content-addressed cache of LLM disambiguations, persisted across documents and runs
+LLM_DISAMBIGUATION_CACHE_DIR = "data/cache/llm_disambiguation"
+
+# Directory of the content-addressed cache of PubChem API normalizations, persisted across runs
+PUBCHEM_API_CACHE_DIR = "data/cache/pubchem_api_normalization"
+
+# Maximum number of concurrent LLM disambiguation requests of a batch
+LLM_DISAMBIGUATION_MAX_CONCURRENCY = 8
+
+# LLM disambiguations of this process keyed like the on-disk cache, including failed ones so a value is only sent to the LLM once per run
+_llm_disambiguations: dict[str, BaseModel | None] = {}
+
+# Maximum number of attempts of a PubChem request failing with transient errors, and of concurrent PubChem requests and requests per second, as PubChem allows at most 5 requests per second
+PUBCHEM_MAX_ATTEMPTS = 5
+PUBCHEM_MAX_CONCURRENCY = 5
+PUBCHEM_MAX_REQUESTS_PER_SECOND = 5
+_pubchem_request_slots = threading.BoundedSemaphore(PUBCHEM_MAX_CONCURRENCY)
+_pubchem_rate_limiter = RateLimiter(PUBCHEM_MAX_REQUESTS_PER_SECOND)
+
+# HTTP clients shared by all PubChem requests of the process, keyed by base URL and timeout, so connections are kept alive across documents and worker threads
+_pubchem_clients: dict[tuple[str, int], httpx.Client] = {}
+_pubchem_clients_lock = threading.Lock()
+
+def get_pubchem_client(base_url: str, timeout: int = 10) -> httpx.Client:
+    """
+    Returns the HTTP client shared by all PubChem requests to a base URL, creating it on first use. The clients are closed when the process exits.
+    Args:
+        base_url (str): The base URL for the PubChem API.
+        timeout (int, optional): The timeout for the requests in seconds. Defaults to 10.
+    Returns:
+        httpx.Client: The shared HTTP client.
+    """
+    with _pubchem_clients_lock:
+        if (base_url, timeout) not in _pubchem_clients:
+            _pubchem_clients[(base_url, timeout)] = httpx.Client(base_url=base_url, timeout=timeout)
+        return _pubchem_clients[(base_url, timeout)]
+
+@atexit.register
+def _close_pubchem_clients() -> None:
+    """
+    Closes the shared PubChem HTTP clients.
+    """
+    for client in _pubchem_clients.values():
+        client.close()
 
 def pubchem_get_request(base_url: str, endpoint: str, timeout: int = 10, params: dict = None) -> dict:
     """
-    Makes a GET request to the specified PubChem API endpoint and returns the JSON response.
+    Makes a GET request to the specified PubChem API endpoint and returns the JSON response. Transient errors (network errors, rate limiting and server overload) are retried with exponential backoff, and requests are spaced to stay within the PubChem rate limit.
     Args:
         base_url (str): The base URL for the PubChem API.
         endpoint (str): The specific API endpoint to query.
@@ -51,14 +104,22 @@ def pubchem_get_request(base_url: str, endpoint: str, timeout: int = 10, params:
 
     # Initialize the Logger
     logger = LogHandler.get_logger(__name__)
-    logger.debug(f"Making PubChem GET request to endpoint: {base_url}/{endpoint} with params: {params}")
-
-    # Initialize the RestClient
-    restclient = RestClient(base_url=base_url, timeout=timeout)
-    
-    # Make the GET request asynchronously
-    response = asyncio.run(restclient.get(endpoint, params=params))
-    logger.debug(f"Received response from PubChem API: {response}")
+    logger.debug("Making PubChem GET request to endpoint: %s/%s with params: %s", base_url, endpoint, params)
+
+    # Make the GET request with the shared client, retrying transient errors
+    for attempt in range(PUBCHEM_MAX_ATTEMPTS):
+        try:
+            with _pubchem_request_slots:
+                time.sleep(_pubchem_rate_limiter.reserve())
+                http_response = get_pubchem_client(base_url, timeout).get(f"{base_url}/{endpoint}", params=params)
+                http_response.raise_for_status()
+            break
+        except httpx.HTTPError as e:
+            if attempt == PUBCHEM_MAX_ATTEMPTS - 1 or not is_retryable_error(e): raise
+            logger.debug("Retrying PubChem request to %s after error: %s", endpoint, e)
+            time.sleep(retry_delay(attempt, e))
+    response = orjson.loads(http_response.content)
+    logger.debug("Received response from PubChem API: %s", response)
     
     # Return the JSON response
     return response
@@ -77,29 +138,26 @@ def fetch_cid_from_pubchem_api(pubchem_base_url: str, pubchem_endpoint: str, pub
 
     # Initialize the logger
     logger = LogHandler.get_logger(__name__)
-    logger.debug(f"Fetching CIDs for {value} from PubChem using endpoint: {pubchem_base_url}/{pubchem_endpoint}")
+    logger.debug("Fetching CIDs for %s from PubChem using endpoint: %s/%s", value, pubchem_base_url, pubchem_endpoint)
 
     try:
         # Make the GET request to PubChem API
         response = pubchem_get_request(pubchem_base_url, pubchem_endpoint, timeout=pubchem_timeout)
         
-        # Parse the response to Pydantic model
-        response = PubChemSynonymsResponse.model_validate(response)
-        logger.debug(f"Parsed PubChem response for {value}: {response}")
-        
-        # Extract CIDs from the response
-        cids = [info.CID for info in response.InformationList.Information]
+        # Extract CIDs from the response directly, as validating it against PubChemSynonymsResponse would also validate every synonym of every CID
+        cids = [int(info["CID"]) for info in response["InformationList"]["Information"]]
+        logger.debug("Parsed PubChem CIDs for %s: %s", value, cids)
 
         # Create normalized PubChem URIs
         normalized_uris = [f"https://pubchem.ncbi.nlm.nih.gov/compound/{cid}" for cid in cids]
-        logger.debug(f"Normalized URIs for {value}: {normalized_uris}")
+        logger.debug("Normalized URIs for %s: %s", value, normalized_uris)
         
         # Return the normalized URIs
         return normalized_uris
     except HTTPStatusError as e:
-        logger.debug(f"HTTP error occurred: {e}")
+        logger.debug("HTTP error occurred: %s", e)
     except Exception as e:
-        logger.debug(f"Exception occurred while normalizing value {value} using the name endpoint: {e}")
+        logger.debug("Exception occurred while normalizing value %s using the name endpoint: %s", value, e)
 
 def normalize_with_lookup_dict(synonym_to_cid_mapping: dict[str, str], value: str) -> list | None:
     """
@@ -113,7 +171,7 @@ def normalize_with_lookup_dict(synonym_to_cid_mapping: dict[str, str], value: st
 
     # Initialize the logger
     logger = LogHandler.get_logger(__name__)
-    logger.debug(f"Normalizing value: {value} using Lookup CID mapping...")
+    logger.debug("Normalizing value: %s using Lookup CID mapping...", value)
 
     # Initialize list to hold normalized URIs
     normalized_uris = []
@@ -121,38 +179,57 @@ def normalize_with_lookup_dict(synonym_to_cid_mapping: dict[str, str], value: st
     # Check if the value exists in the synonym to CID mapping
     cid = synonym_to_cid_mapping.get(value, "")
 
-    # Check using fuzzy matching if exact match not found
-    if not cid:
-        logger.debug(f"No exact match found for {value} in lookup dict. Attempting fuzzy matching...")
-        for syn, c in synonym_to_cid_mapping.items():
-            score = fuzz.ratio(value, syn.lower())
-            if score >= 85:
-                cid = f"{cid},{c}" if cid else c
-                logger.debug(f"Fuzzy match found: {syn} (Score: {score}) for value: {value}")
-                break
+    # Check using fuzzy matching if exact match not found, scoring all lowercased synonyms in a single vectorized call
+    if not cid and synonym_to_cid_mapping:
+        logger.debug("No exact match found for %s in lookup dict. Attempting fuzzy matching...", value)
+        lowercased_synonyms = {syn: syn.lower() for syn in synonym_to_cid_mapping}
+        match = process.extractOne(value, lowercased_synonyms, scorer=fuzz.ratio, score_cutoff=85)
+        if match:
+            _, score, syn = match
+            cid = synonym_to_cid_mapping[syn]
+            logger.debug("Fuzzy match found: %s (Score: %s) for value: %s", syn, score, value)
 
     # If not found, return None
     if not cid: return None
 
     # If found, create normalized URIs
     normalized_uris.extend([f"https://pubchem.ncbi.nlm.nih.gov/compound/{c.strip()}" for c in cid.split(",")])
-    logger.debug(f"Normalized URIs for {value} from lookup dict: {normalized_uris}")
+    logger.debug("Normalized URIs for %s from lookup dict: %s", value, normalized_uris)
 
     # Return the list of normalized URIs
     return normalized_uris
 
 def normalize_value_with_pubchem_api(value: str) -> list | None:
     """
-    Normalizes a chemical name using PubChem API to retrieve its CID and properties.
+    Normalizes a chemical name using PubChem API to retrieve its CID and properties. Results, including misses, are memoized for the process, and found ones are cached on disk, so values recurring across documents and runs are only requested once.
     Args:
         value (str): The chemical name to normalize.
     Returns:
         list | None: A list of normalized URIs or None if not found.
     """
+    normalized_uris = _fetch_pubchem_api_uris(value)
+    return list(normalized_uris) if normalized_uris else None
+
+@lru_cache(maxsize=2048)
+def _fetch_pubchem_api_uris(value: str) -> tuple[str, ...]:
+    """
+    Fetches the normalized URIs of a chemical name from the PubChem name and molecular formula endpoints, or from the on-disk cache of earlier runs.
+    Args:
+        value (str): The chemical name to normalize.
+    Returns:
+        tuple[str, ...]: The distinct normalized URIs, empty if not found.
+    """
 
     # Initialize the logger
     logger = LogHandler.get_logger(__name__)
-    logger.debug(f"Normalizing value: {value} using PubChem API...")
+    logger.debug("Normalizing value: %s using PubChem API...", value)
+
+    # Return the cached normalization of the value
+    cache_key = hashlib.sha256(value.encode("utf-8")).hexdigest()
+    cached = read_json_file(f"{PUBCHEM_API_CACHE_DIR}/{cache_key[:2]}/{cache_key}.json")
+    if cached:
+        logger.debug("Cached PubChem API normalization for %s: %s", value, cached)
+        return tuple(cached)
 
     # PubChem API Base URL and Timeout
     pubchem_base_url = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
@@ -171,12 +248,30 @@ def normalize_value_with_pubchem_api(value: str) -> list | None:
     cids = fetch_cid_from_pubchem_api(pubchem_base_url, endpoint, pubchem_timeout, value)
     normalized_uris.extend(cids if cids else [])
 
-    # Remove duplicates URIs
-    normalized_uris = list(set(normalized_uris))
-    logger.debug(f"Final normalized URIs for {value} using PubChem API: {normalized_uris}")
+    # Remove duplicate URIs, keeping the name endpoint results first in response order
+    normalized_uris = tuple(dict.fromkeys(normalized_uris))
+    logger.debug("Final normalized URIs for %s using PubChem API: %s", value, normalized_uris)
 
-    # Return the list of normalized URIs or None if empty
-    return normalized_uris if normalized_uris else None
+    # Cache the normalization for later runs, but not misses as failed requests also end up empty
+    if normalized_uris: save_json_file(f"{PUBCHEM_API_CACHE_DIR}/{cache_key[:2]}", f"{cache_key}.json", list(normalized_uris), indent=None)
+
+    # Return the normalized URIs
+    return normalized_uris
+
+def prefetch_pubchem_api_uris(values: list[str], synonym_to_cid_mapping: dict[str, str]) -> None:
+    """
+    Fetches the PubChem API normalizations of many values concurrently into the memo of normalize_value_with_pubchem_api, so the sequential normalization of the values afterwards does not wait on one request at a time. Values resolved by the synonym to CID mapping are skipped, as their normalization never reaches the API.
+    Args:
+        values (list[str]): The chemical names to normalize.
+        synonym_to_cid_mapping (dict[str, str]): The synonym to CID mapping consulted before the API.
+    """
+    pending = [value for value in dict.fromkeys(values) if not normalize_with_lookup_dict(synonym_to_cid_mapping, value)]
+    if len(pending) < 2: return
+    with ThreadPoolExecutor(max_workers=min(PUBCHEM_MAX_CONCURRENCY, len(pending))) as executor:
+        futures = [executor.submit(_fetch_pubchem_api_uris, value) for value in pending]
+
+        # Surface exceptions raised in the worker threads
+        for future in futures: future.result()
 
 def normalize_value_with_pubchem_cid_mapping(env: lmdb.Environment, value: str) -> list | None:
     """
@@ -190,51 +285,102 @@ def normalize_value_with_pubchem_cid_mapping(env: lmdb.Environment, value: str)
 
     # Initialize the logger
     logger = LogHandler.get_logger(__name__)
-    logger.debug(f"Normalizing value: {value} using PubChem CID mapping local dump...")
+    logger.debug("Normalizing value: %s using PubChem CID mapping local dump...", value)
 
     # Lookup CIDs by synonym in the LMDB database
     matching_cids = lookup_by_synonym(env, value, enable_fuzzy=False, enable_substring_match=False)
 
     # If no matching CIDs found, return None
     if not matching_cids: 
-        logger.debug(f"No matching CIDs found for value: {value} in LMDB PubChem CID mapping.")
+        logger.debug("No matching CIDs found for value: %s in LMDB PubChem CID mapping.", value)
         return None
     
     # Create normalized URIs from the matching CIDs
     logger.info(matching_cids)
     normalized_uris = [f"https://pubchem.ncbi.nlm.nih.gov/compound/{cid}" for _, cid in matching_cids]
-    logger.debug(f"Normalized URIs for {value} from LMDB CID mapping: {normalized_uris}")
+    logger.debug("Normalized URIs for %s from LMDB CID mapping: %s", value, normalized_uris)
 
     # Return the list of normalized URIs
     return normalized_uris
 
-def perform_llm_disambiguation(values: str, llm: str) -> BaseModel | None:
+def perform_llm_disambiguation(values: str, llm: str, cache_dir: str | None = LLM_DISAMBIGUATION_CACHE_DIR) -> BaseModel | None:
     """
-    Performs LLM-based disambiguation to get a more formal and standardized chemical name.
+    Performs LLM-based disambiguation to get a more formal and standardized chemical name. Disambiguations are memoized for the process, including failed ones, and successful ones are cached on disk by the exact prompt inputs, so values recurring across documents and runs only invoke the LLM once.
     Args:
         values (str): The chemical name to disambiguate.
         llm (str): The LLM model to use for disambiguation, specified in the format "provider:model".
+        cache_dir (str | None, optional): Directory of the content-addressed disambiguation cache. Disabled if None. Defaults to LLM_DISAMBIGUATION_CACHE_DIR.
     Returns:
         BaseModel | None: The disambiguated Pydantic model or None if not found.
     """
+    return perform_llm_disambiguations([values], llm, cache_dir)[0]
+
+def perform_llm_disambiguations(values_list: list, llm: str, cache_dir: str | None = LLM_DISAMBIGUATION_CACHE_DIR, max_concurrency: int = LLM_DISAMBIGUATION_MAX_CONCURRENCY) -> list[BaseModel | None]:
+    """
+    Performs LLM-based disambiguation of several chemical names, sending the ones that are neither memoized nor cached on disk to the LLM in a single batch through one model adapter. Each chemical name keeps its own prompt, so the disambiguations and their cache entries are the same as with `perform_llm_disambiguation`.
+    Args:
+        values_list (list): The chemical name of each disambiguation.
+        llm (str): The LLM model to use for disambiguation, specified in the format "provider:model".
+        cache_dir (str | None, optional): Directory of the content-addressed disambiguation cache. Disabled if None. Defaults to LLM_DISAMBIGUATION_CACHE_DIR.
+        max_concurrency (int, optional): Maximum number of LLM requests of the batch in flight. Defaults to LLM_DISAMBIGUATION_MAX_CONCURRENCY.
+    Returns:
+        list[BaseModel | None]: The disambiguated Pydantic model of each chemical name in the order of `values_list`, with None if not found.
+    """
     # Initialize the logger
     logger = LogHandler.get_logger(__name__)
-    logger.debug(f"Performing LLM disambiguation...")
-
-    # Initialize the LLM Model Adapter
-    llm_config = ProviderRegistry.resolve_from_string(llm)
-    model_adapter = llm_config.inference_adapter(model_name=llm_config.model_name, temperature=0.1, response_format="json_object")
-    logger.debug(f"Initialized Model adapter: {model_adapter}")
-
-    # Format the prompt template
-    var_dict = {"process_name": ProcessConfig.Process_name, "process_description": ProcessConfig.Process_description, "compound": values}
-
-    # Disambiguate using the LLM model
-    disambiguated_name = model_adapter.structured_completion(normalize_property_values, var_dict, LLM_Disambiguation)
-    logger.debug(f"Disambiguated name from LLM: {disambiguated_name}")
-
-    # Return the disambiguated name or None if not found
-    return disambiguated_name if disambiguated_name else None
+    logger.debug("Performing LLM disambiguation of %d values...", len(values_list))
+
+    # Format the prompt variables of each value, keyed like the on-disk cache
+    var_dicts = {}
+    cache_keys = []
+    for values in values_list:
+        var_dict = {"process_name": ProcessConfig.Process_name, "process_description": ProcessConfig.Process_description, "compound": values}
+        cache_key = hashlib.sha256(json.dumps([llm, var_dict], sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        cache_keys.append(cache_key)
+
+        # Skip the disambiguations of the same prompt inputs made earlier in this process
+        if cache_key in _llm_disambiguations: continue
+
+        # Memoize the cached disambiguation of the same prompt inputs
+        cache_path = f"{cache_dir}/{cache_key[:2]}/{cache_key}.json" if cache_dir else None
+        cached = read_json_file(cache_path) if cache_path else None
+        if cached is not None:
+            logger.debug("Cached LLM disambiguation for %s: %s", values, cached)
+            _llm_disambiguations[cache_key] = LLM_Disambiguation.model_validate(cached)
+            continue
+        var_dicts[cache_key] = var_dict
+
+    # Disambiguate the remaining values in a single batch
+    if var_dicts:
+
+        # Initialize the LLM Model Adapter
+        llm_config = ProviderRegistry.resolve_from_string(llm)
+        model_adapter = llm_config.inference_adapter(model_name=llm_config.model_name, temperature=0.1, response_format="json_object")
+        logger.debug("Initialized Model adapter: %s", model_adapter)
+
+        # Disambiguate using the LLM model
+        disambiguated_names = model_adapter.structured_batch_completion(normalize_property_values, list(var_dicts.values()), LLM_Disambiguation, max_concurrency)
+        for (cache_key, var_dict), disambiguated_name in zip(var_dicts.items(), disambiguated_names):
+            logger.debug("Disambiguated name from LLM for %s: %s", var_dict["compound"], disambiguated_name)
+
+            # Cache the disambiguation for later documents, but not failures as the model adapters also return None on transient errors
+            if cache_dir and disambiguated_name: save_json_file(f"{cache_dir}/{cache_key[:2]}", f"{cache_key}.json", disambiguated_name.model_dump(), indent=None)
+            _llm_disambiguations[cache_key] = disambiguated_name if disambiguated_name else None
+
+    # Return the disambiguated names or None if not found
+    return [_llm_disambiguations[cache_key] for cache_key in cache_keys]
+
+def prefetch_llm_disambiguations(values: list[str], llm: str, lmdb_env: lmdb.Environment, synonym_to_cid_mapping: dict[str, str]) -> None:
+    """
+    Disambiguates all values that none of the normalizers resolve with the LLM in a single batch up front, so the per-value LLM disambiguations are served from the memo instead of one LLM request at a time.
+    Args:
+        values (list[str]): The values to normalize.
+        llm (str): The LLM model to use for disambiguation, specified in the format "provider:model".
+        lmdb_env (lmdb.Environment): The LMDB environment for PubChem CID mapping.
+        synonym_to_cid_mapping (dict[str, str]): A dictionary mapping synonyms to PubChem CIDs.
+    """
+    unresolved = [value for value in dict.fromkeys(values) if not run_normalizers(value, lmdb_env, synonym_to_cid_mapping)]
+    if unresolved: perform_llm_disambiguations([[value] for value in unresolved], llm)
 
 def update_process_json_with_normalized_value(data: dict, full_path: str, value: str, normalized_uris: list) -> None:
     """
@@ -248,7 +394,7 @@ def update_process_json_with_normalized_value(data: dict, full_path: str, value:
 
     # Initialize the logger
     logger = LogHandler.get_logger(__name__)
-    logger.debug(f"Updating JSON at path: {full_path} with normalized URIs: {normalized_uris}")
+    logger.debug("Updating JSON at path: %s with normalized URIs: %s", full_path, normalized_uris)
 
     # Format the normalized URIs as a dictionary containing the original value and normalized URIs
     normalized_value = {"value": value, "sameAs": normalized_uris}
@@ -256,7 +402,7 @@ def update_process_json_with_normalized_value(data: dict, full_path: str, value:
     # Set the normalized value at the specified path in the JSON data
     success = set_value_by_path(data, full_path, normalized_value)
     if not success: raise Exception(f"Error updating JSON data at path: {full_path} with normalized URIs: {normalized_uris}")
-    logger.debug(f"Successfully updated JSON data at path: {full_path} with normalized URIs.")
+    logger.debug("Successfully updated JSON data at path: %s with normalized URIs.", full_path)
 
 def update_synonym_to_cid_mapping(synonym_to_cid_mapping: dict[str, str], value: str, cids: list[str]) -> dict[str, str]:
     """
@@ -269,12 +415,9 @@ def update_synonym_to_cid_mapping(synonym_to_cid_mapping: dict[str, str], value:
         dict[str, str]: The updated synonym to CID mapping dictionary.
     """
     
-    # Create comma-separated string of CIDs
-    cid_string = ",".join([cid.split("/")[-1] for cid in cids])
-
-    # Update the mapping dictionary
-    if value.lower() not in synonym_to_cid_mapping or value not in synonym_to_cid_mapping:
-        synonym_to_cid_mapping[value] = cid_string
+    # Add the synonym to the mapping dictionary unless it is already mapped
+    if value not in synonym_to_cid_mapping:
+        synonym_to_cid_mapping[value] = ",".join(cid_from_uri(cid) for cid in cids)
 
     # Return the updated mapping dictionary
     return synonym_to_cid_mapping
@@ -318,8 +461,8 @@ def pubchem_normalization(state: ExtractionState) -> ExtractionState:
     logger = LogHandler.get_logger(__name__)
     logger.info("Starting PubChem normalization tool...")
 
-    # Open LMDB environment for PubChem CID mapping
-    lmdb_env = open_env_for_read(state.pubchem_lmdb_path, readonly=True)
+    # Get the shared LMDB environment for PubChem CID mapping, kept open across documents
+    lmdb_env = get_shared_env(state.pubchem_lmdb_path)
 
     # Deep copy extracted JSON data to normalized data
     state.normalized_json = copy.deepcopy(state.extracted_json)
@@ -327,33 +470,44 @@ def pubchem_normalization(state: ExtractionState) -> ExtractionState:
     # Iterate over each process in the extracted JSON data
     normalized_data = state.normalized_json
 
-    for process in normalized_data.get("processes", []):
+    # Query the PubChem API for all valid values of the included properties concurrently up front
+    included_paths = [path for path in state.normalization_properties_to_include if path not in state.normalization_properties_to_exclude]
+    included_values = [
+        value for process_instance in normalized_data.get("processes", []) for path in included_paths for value, _ in get_value_by_path(process_instance, path)
+        if value and value.strip() not in ["Not Found", ""]
+    ]
+    prefetch_pubchem_api_uris(included_values, state.synonym_to_cid_mapping)
+
+    # Disambiguate all values left unresolved by the normalizers with the LLM in a single batch
+    prefetch_llm_disambiguations(included_values, state.normalization_llm, lmdb_env, state.synonym_to_cid_mapping)
+
+    for process_instance in normalized_data.get("processes", []):
         
         # Get the process JSON data
-        data = process
+        data = process_instance
 
         # Normalize each specified property
         for path in state.normalization_properties_to_include:
 
             # Skip excluded properties
             if path in state.normalization_properties_to_exclude:
-                logger.debug(f"Skipping excluded property path: {path}")
+                logger.debug("Skipping excluded property path: %s", path)
                 continue
             
             # Get all values for the specified path
             values_with_paths = get_value_by_path(data, path)
-            logger.debug(f"Retrieved values for path {path}: {values_with_paths}")
+            logger.debug("Retrieved values for path %s: %s", path, values_with_paths)
 
             # Normalize each value found at the specified path
             for value, full_path in values_with_paths:
-                logger.debug(f"Normalizing value at path {full_path}: {value}")
+                logger.debug("Normalizing value at path %s: %s", full_path, value)
 
                 # Copy of the original value
                 original_value = value
 
                 # Check if value is valid
                 if not value or value.strip() in ["Not Found", ""]:
-                    logger.debug(f"Skipping normalization for invalid value: {value} at path: {full_path}")
+                    logger.debug("Skipping normalization for invalid value: %s at path: %s", value, full_path)
                     update_process_json_with_normalized_value(data, full_path, original_value, [])
                     continue
 
@@ -365,30 +519,30 @@ def pubchem_normalization(state: ExtractionState) -> ExtractionState:
                 normalized_uris = run_normalizers(value, lmdb_env, state.synonym_to_cid_mapping)
 
                 if normalized_uris:
-                    logger.debug(f"Path: {full_path}, Original Value: {value}, Normalized URIs: {normalized_uris}")
+                    logger.debug("Path: %s, Original Value: %s, Normalized URIs: %s", full_path, value, normalized_uris)
                     update_process_json_with_normalized_value(data, full_path, original_value, normalized_uris)
                     state.synonym_to_cid_mapping = update_synonym_to_cid_mapping(state.synonym_to_cid_mapping, original_value, normalized_uris)
-                    logger.debug(f"Updated JSON data at path: {full_path} with normalized URIs")
+                    logger.debug("Updated JSON data at path: %s with normalized URIs", full_path)
                     continue
 
                 # Normalize the value using LLM disambiguation
                 disambiguted_details = perform_llm_disambiguation([value], state.normalization_llm)
-                logger.debug(f"LLM Disambiguation result for value {value}: {disambiguted_details}")
+                logger.debug("LLM Disambiguation result for value %s: %s", value, disambiguted_details)
 
                 # Excecute the normalizers again on the disambiguated name/molecular formaula
                 if disambiguted_details and disambiguted_details.Molecular_Formula:
                     normalized_uris = run_normalizers(disambiguted_details.Molecular_Formula, lmdb_env, state.synonym_to_cid_mapping)
 
                     if normalized_uris:
-                        logger.debug(f"Path: {full_path}, Original Value: {value}, Normalized URIs after LLM disambiguation: {normalized_uris}")
+                        logger.debug("Path: %s, Original Value: %s, Normalized URIs after LLM disambiguation: %s", full_path, value, normalized_uris)
                         update_process_json_with_normalized_value(data, full_path, original_value, normalized_uris)
                         state.synonym_to_cid_mapping = update_synonym_to_cid_mapping(state.synonym_to_cid_mapping, original_value, normalized_uris)
-                        logger.debug(f"Updated JSON data at path: {full_path} with normalized URIs after LLM disambiguation")
+                        logger.debug("Updated JSON data at path: %s with normalized URIs after LLM disambiguation", full_path)
                         continue
 
                 # If NO normalization found, update the value with empty SameAs list
                 if not normalized_uris:
-                    logger.debug(f"No normalization found for value: {value} at path: {full_path}. Updating with empty SameAs list.")
+                    logger.debug("No normalization found for value: %s at path: %s. Updating with empty SameAs list.", value, full_path)
                     update_process_json_with_normalized_value(data, full_path, original_value, [])
 
     # Log completion of PubChem normalization
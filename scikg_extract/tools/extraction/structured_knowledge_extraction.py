@@ -19,6 +19,16 @@ from scikg_extract.agents.states import ExtractionState
 # Scikg_Extract Prompt Imports
 from scikg_extract.prompts.tools import structure_knowledge_extraction
 
+def format_prompt_variables(state: ExtractionState) -> dict:
+    """
+    Builds the prompt template variables for structured knowledge extraction from the current state.
+    Args:
+        state (ExtractionState): The current state of the extraction process containing necessary inputs.
+    Returns:
+        dict: The variables used to format the extraction prompt template.
+    """
+    return {"process_name": state.process_name, "process_description": state.process_description, "process_property_constraints": state.process_property_constraints, "scientific_document": state.scientific_document, "schema": state.process_schema_json or json.dumps(state.process_schema), "examples": state.examples}
+
 def structured_knowledge_extraction(state: ExtractionState) -> ExtractionState:
     """
     Extracts structured knowledge from a scientific document using a language model based on the provided schema and examples.
@@ -38,7 +48,7 @@ def structured_knowledge_extraction(state: ExtractionState) -> ExtractionState:
     logger.debug(f"Initialized Model adapter: {model_adapter}")
 
     # Format the prompt template
-    var_dict = {"process_name": state.process_name, "process_description": state.process_description, "process_property_constraints": state.process_property_constraints, "scientific_document": state.scientific_document, "schema": json.dumps(state.process_schema), "examples": state.examples}
+    var_dict = format_prompt_variables(state)
 
     # Extract the knowledge and raise an exception if the extraction fails after retries
     try:
@@ -77,7 +87,7 @@ def refine_extracted_knowledge(state: ExtractionState) -> ExtractionState:
     logger.debug(f"Initialized Model adapter: {model_adapter}")
 
     # Format the prompt template
-    var_dict = {"process_name": state.process_name, "process_description": state.process_description, "process_property_constraints": state.process_property_constraints, "scientific_document": state.scientific_document, "schema": json.dumps(state.process_schema), "examples": state.examples}
+    var_dict = format_prompt_variables(state)
 
     # Update the user prompt now containing the feedback from Reflection Agent
     updated_user_prompt = state.user_feedback_prompt
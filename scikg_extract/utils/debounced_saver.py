@@ -0,0 +1,78 @@
+"""
+Debounced JSON saver utility for SciKGExtract.
+
+Provides a thread-safe saver for a JSON mapping shared across concurrent workers (e.g., the PubChem synonym to CID mapping updated after every normalized document), which merges updates in memory and rewrites the file at most once per save interval instead of after every update.
+"""
+# Python Imports
+import time
+import threading
+
+# SciKGExtract Utility Imports
+from scikg_extract.utils.file_utils import save_json_file
+
+class DebouncedJsonSaver:
+    """
+    A thread-safe saver that merges updates into a shared JSON mapping and saves it at most once per save interval. Call flush() once all updates are merged to save the remaining ones.
+    """
+
+    def __init__(self, filepath: str, filename: str, data: dict, interval: float = 30.0, sort_keys: bool = False):
+        """
+        Initializes the saver for a JSON mapping.
+        Args:
+            filepath (str): The directory path where the file is saved.
+            filename (str): The name of the file to save the mapping to.
+            data (dict): The shared mapping, updated in place.
+            interval (float, optional): Minimum number of seconds between two saves. Defaults to 30.0.
+            sort_keys (bool, optional): Whether to save the mapping with its keys in sorted order. Defaults to False.
+        """
+        self.filepath = filepath
+        self.filename = filename
+        self.data = data
+        self.interval = interval
+        self.sort_keys = sort_keys
+        self.last_saved = time.monotonic()
+        self.pending = False
+        self.lock = threading.Lock()
+
+    def _save(self) -> bool:
+        """
+        Saves the mapping and resets the save interval. Must be called with the lock held.
+        Returns:
+            bool: True if the file was saved successfully, otherwise False
+        """
+        if not save_json_file(self.filepath, self.filename, self.data, sort_keys=self.sort_keys): return False
+        self.last_saved = time.monotonic()
+        self.pending = False
+        return True
+
+    def snapshot(self) -> dict:
+        """
+        Copies the mapping, so a worker can read and update its own copy while other workers merge their updates.
+        Returns:
+            dict: A shallow copy of the mapping.
+        """
+        with self.lock:
+            return dict(self.data)
+
+    def update(self, updates: dict) -> bool:
+        """
+        Merges updates into the mapping and saves it if the save interval has elapsed since the last save.
+        Args:
+            updates (dict): The entries to merge into the mapping.
+        Returns:
+            bool: False if a due save failed, otherwise True
+        """
+        with self.lock:
+            self.data.update(updates)
+            self.pending = True
+            if time.monotonic() - self.last_saved < self.interval: return True
+            return self._save()
+
+    def flush(self) -> bool:
+        """
+        Saves the mapping if it has updates that have not been saved yet.
+        Returns:
+            bool: False if the save failed, otherwise True
+        """
+        with self.lock:
+            return self._save() if self.pending else True
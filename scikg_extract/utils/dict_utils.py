@@ -4,11 +4,14 @@ Dictionary utility functions for traversing and transforming nested extraction o
 Provides helpers for deep traversal of nested dict/list structures, checking for empty QUDT-style value objects, and selectively removing empty nodes from extraction results before serialization or evaluation.
 """
 # Python Imports
-from typing import Any, List, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 # SciKGExtract Utility Imports
 from scikg_extract.utils.string_utils import parse_path
 
+# QUDT metadata keys that don't represent actual data
+QUDT_METADATA_KEYS = frozenset({'quantityKind', 'hasQuantityKind', 'sameAs', 'unit'})
+
 def is_primitive(val: Any) -> bool:
     """
     Check if a value is a primitive type (str, int, float, bool, None).
@@ -73,13 +76,10 @@ def is_empty_qudt_structure(obj: Any) -> bool:
     if not isinstance(obj, dict) or not obj:
         return False
     
-    # QUDT metadata keys that don't represent actual data
-    qudt_metadata_keys = {'quantityKind', 'hasQuantityKind', 'sameAs', 'unit'}
-    
     keys = set(obj.keys())
     
     # Case 1: Only pure metadata keys (no quantityValue at all)
-    if keys.issubset(qudt_metadata_keys):
+    if keys.issubset(QUDT_METADATA_KEYS):
         return True
     
     # Case 2: Has quantityValue - check if it contains actual data
@@ -95,7 +95,7 @@ def is_empty_qudt_structure(obj: Any) -> bool:
         
         # No numeric value - check if rest of object is just metadata
         other_keys = keys - {'quantityValue'}
-        if not other_keys or other_keys.issubset(qudt_metadata_keys):
+        if not other_keys or other_keys.issubset(QUDT_METADATA_KEYS):
             return True
     
     # Otherwise, keep the object
@@ -157,6 +157,71 @@ def remove_empty_qudt_structures(data: Any) -> Any:
     
     return final_dict if final_dict else None
 
+def _clean_json_node(data: Any, skip_keys: list) -> Tuple[bool, Any]:
+    """
+    Cleans a node of a JSON-like structure for `clean_json`, applying the empty QUDT structure and null value rules in one visit.
+    Args:
+        data (Any): The node to clean.
+        skip_keys (list): List of keys to skip from null removal.
+    Returns:
+        Tuple[bool, Any]: Whether the node survives the empty QUDT structure removal, and the node with null values removed.
+    """
+    # Handle lists
+    if isinstance(data, list):
+        cleaned_list = []
+        for item in data:
+            kept, cleaned_item = _clean_json_node(item, skip_keys)
+            if kept and cleaned_item not in (None, {}, []):
+                cleaned_list.append(cleaned_item)
+        return True, cleaned_list
+
+    # Handle non-dict primitives (str, int, float, bool, None)
+    if not isinstance(data, dict):
+        return data is not None, data
+
+    # Special case: preserve quantityValue with numericValue intact (including unit metadata)
+    quantity_value = data.get('quantityValue')
+    has_numeric_value = isinstance(quantity_value, dict) and quantity_value.get('numericValue') is not None
+
+    # Keys surviving the empty QUDT structure removal, and the dictionary with null values removed
+    kept_keys = set()
+    cleaned = {}
+    for key, value in data.items():
+        if key == 'quantityValue' and has_numeric_value:
+            kept, cleaned_value = True, value if key in skip_keys else remove_null_values(value, skip_keys=skip_keys)
+        elif key in skip_keys:
+            cleaned_value = remove_empty_qudt_structures(value)
+            kept = cleaned_value is not None
+        else:
+            kept, cleaned_value = _clean_json_node(value, skip_keys)
+        if not kept: continue
+        kept_keys.add(key)
+
+        # Keep skipped keys as-is, otherwise only if it's not None, not empty dict, not empty list
+        if key in skip_keys or cleaned_value not in ("Not Found", None, {}, []):
+            cleaned[key] = cleaned_value
+
+    # Drop empty dictionaries and dictionaries with only QUDT metadata, based on the keys surviving the QUDT removal
+    if not kept_keys or kept_keys <= QUDT_METADATA_KEYS:
+        return False, None
+    if 'quantityValue' in kept_keys and not has_numeric_value and isinstance(quantity_value, dict) and kept_keys - {'quantityValue'} <= QUDT_METADATA_KEYS:
+        return False, None
+    return True, cleaned
+
+def clean_json(data: Any, skip_keys: list = [], drop_empty_qudt: bool = True) -> Any:
+    """
+    Removes empty QUDT structures and null values from a JSON-like structure in a single traversal. Equivalent to `remove_null_values(remove_empty_qudt_structures(data), skip_keys)` without building the intermediate structure.
+    Args:
+        data (Any): The data structure to clean (dict, list, or primitive).
+        skip_keys (list): List of keys to skip from null removal even if they have null or empty values.
+        drop_empty_qudt (bool, optional): Whether to remove empty QUDT structures. If False, only null values are removed. Defaults to True.
+    Returns:
+        Any: The cleaned data structure, or None if the entire structure is removed.
+    """
+    if not drop_empty_qudt:
+        return remove_null_values(data, skip_keys=skip_keys)
+    return _clean_json_node(data, skip_keys)[1]
+
 def get_value_by_path(data: Any, path: str) -> List[Tuple[Any, str]]:
     """
     Extract value(s) from nested data structure using dot-notation path.
@@ -283,12 +348,13 @@ def set_value_by_path(data: Any, path: str, value: Any) -> bool:
     # Return failure if current is not a dict
     return False
 
-def flatten_record(rec: dict, prefix: str = "") -> List[Tuple[str, Any]]:
+def flatten_record(rec: dict, prefix: str = "", skip: Optional[Callable[[str], Any]] = None) -> List[Tuple[str, Any]]:
     """
     Flatten a dictionary into (property_path, value) pairs.
     Args:
         rec (dict): The record to flatten (could be a dict, list, or primitive).
         prefix (str): The prefix for property paths (used in recursion).
+        skip (Optional[Callable[[str], Any]]): Predicate on property paths (e.g., a compiled regex's `search`). Subtrees whose path matches are not traversed.
     Returns:
         List[Tuple[str, Any]]: A list of (property_path, value) pairs.
     """
@@ -304,10 +370,14 @@ def flatten_record(rec: dict, prefix: str = "") -> List[Tuple[str, Any]]:
     if isinstance(rec, dict):
         for k, v in rec.items():
             new_prefix = f"{prefix}{k}"
+
+            # Prune skipped properties before descending into them
+            if skip is not None and skip(new_prefix): continue
+
             if is_primitive(v):
                 out.append((new_prefix, v))
             else:
-                out.extend(flatten_record(v, new_prefix + "."))
+                out.extend(flatten_record(v, new_prefix + ".", skip))
         return out
 
     # Handle lists
@@ -319,7 +389,7 @@ def flatten_record(rec: dict, prefix: str = "") -> List[Tuple[str, Any]]:
                 out.append((prefix.rstrip(".") or "(root)", v))
             return out
         for idx, item in enumerate(rec):
-            out.extend(flatten_record(item, f"{prefix}[{idx}]."))
+            out.extend(flatten_record(item, f"{prefix}[{idx}].", skip))
         return out
     
     # Return empty if not handled
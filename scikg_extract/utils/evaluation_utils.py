@@ -1,5 +1,6 @@
 # Python Imports
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 # Transformers and Evaluation Library Imports
 import evaluate
@@ -9,9 +10,23 @@ from sentence_transformers import SentenceTransformer, util
 # Numpy Import
 import numpy as np
 
+# RapidFuzz Imports for Fuzzy String Matching
+from rapidfuzz import fuzz, process, utils
+
 # Scipy Import for Hungarian Algorithm
 from scipy.optimize import linear_sum_assignment
 
+@lru_cache(maxsize=None)
+def load_metric(metric_name: str) -> evaluate.EvaluationModule:
+    """
+    Load an evaluation metric once and reuse it, so metrics backed by a model (e.g., BERTScore) keep their loaded model across calls
+    Args:
+        metric_name (str): The name of the evaluation metric
+    Returns:
+        evaluate.EvaluationModule: The loaded evaluation metric
+    """
+    return evaluate.load(metric_name)
+
 def rouge_score(references: list, predictions: list) -> dict:
     """
     Calculate the ROUGE scores between the reference output and the predicted output
@@ -21,7 +36,7 @@ def rouge_score(references: list, predictions: list) -> dict:
     Returns:
         dict: The ROUGE score
     """
-    rouge = evaluate.load("rouge")
+    rouge = load_metric("rouge")
     return rouge.compute(predictions=predictions, references=references)
 
 def bleu_score(references: list, predictions: list) -> dict:
@@ -33,7 +48,7 @@ def bleu_score(references: list, predictions: list) -> dict:
     Returns:
         dict: The BLEU score
     """
-    bleu = evaluate.load("bleu")
+    bleu = load_metric("bleu")
     return bleu.compute(predictions=predictions, references=references)
 
 def split_into_chunks(text: str, tokenizer: PreTrainedTokenizer, max_length: int = 512) -> list:
@@ -52,7 +67,7 @@ def split_into_chunks(text: str, tokenizer: PreTrainedTokenizer, max_length: int
     ]
     return [tokenizer.decode(chunk, skip_special_tokens=False) for chunk in chunks]
 
-def bert_score(references: list, predictions: list, embedding_model: str, embedding_model_revision: str, max_length: int = 256) -> dict:
+def bert_score(references: list, predictions: list, embedding_model: str, embedding_model_revision: str, max_length: int = 256, batch_size: int = 64, device: Optional[str] = None) -> dict:
     """
     Calculate the BERT scores between the reference output and the predicted output
     Args:
@@ -61,34 +76,37 @@ def bert_score(references: list, predictions: list, embedding_model: str, embedd
         embedding_model (str): The name of the embedding model to be used
         embedding_model_revision (str): The revision of the embedding model to be used
         max_length (int): The maximum length of each chunk
+        batch_size (int): The number of chunk pairs scored per forward pass
+        device (Optional[str]): The device to run the embedding model on, selected automatically if not provided
     Returns:
         dict: The BERT score
     """
     # Loading the BERT score and Embedding model from HuggingFace
-    bertscore = evaluate.load("bertscore")
+    bertscore = load_metric("bertscore")
     tokenizer = AutoTokenizer.from_pretrained(
         embedding_model, revision=embedding_model_revision  # nosec B615
     )
 
-    # Intializing dictionary for storing intermediate scores
-    scores: Dict[str, List[float]] = {"precision": [], "recall": [], "f1": []}
-
-    # Iterating each reference and prediction pair
+    # Collecting the aligned chunks of each reference and prediction pair
+    pred_chunks: List[str] = []
+    ref_chunks: List[str] = []
     for pred, ref in zip(predictions, references):
-        pred_chunks = split_into_chunks(pred, tokenizer, max_length)
-        ref_chunks = split_into_chunks(ref, tokenizer, max_length)
-
-        # Calculating bert score for each chunk separately
-        for p_chunk, r_chunk in zip(pred_chunks, ref_chunks):
-            result = bertscore.compute(
-                predictions=[p_chunk],
-                references=[r_chunk],
-                model_type=embedding_model,
-                lang="en"
-            )
-            scores["precision"].append(result["precision"][0])
-            scores["recall"].append(result["recall"][0])
-            scores["f1"].append(result["f1"][0])
+        for p_chunk, r_chunk in zip(split_into_chunks(pred, tokenizer, max_length), split_into_chunks(ref, tokenizer, max_length)):
+            pred_chunks.append(p_chunk)
+            ref_chunks.append(r_chunk)
+
+    # Calculating bert score for all chunk pairs in batched forward passes
+    scores: Dict[str, List[float]] = {"precision": [], "recall": [], "f1": []}
+    if pred_chunks:
+        result = bertscore.compute(
+            predictions=pred_chunks,
+            references=ref_chunks,
+            model_type=embedding_model,
+            lang="en",
+            batch_size=batch_size,
+            device=device
+        )
+        scores = {metric: result[metric] for metric in scores}
 
     # Aggregating the scores - average across chunks
     scores_avg = {
@@ -98,7 +116,46 @@ def bert_score(references: list, predictions: list, embedding_model: str, embedd
     }
     return scores_avg
 
-def cosine_similarity_score(references: list, predictions: list, embedding_model: str, max_length: int = 512) -> dict:
+def pairwise_cosine_similarities(references: list, predictions: list, model: SentenceTransformer, max_length: int = 512, batch_size: int = 64) -> List[List[float]]:
+    """
+    Calculate the Cosine Similarity of the aligned chunks of each reference and prediction pair
+    Args:
+        references (list): The list of reference outputs
+        predictions (list): The list of predicted outputs
+        model (SentenceTransformer): The loaded embedding model
+        max_length (int): The maximum length of each chunk
+        batch_size (int): The number of chunks encoded per forward pass
+    Returns:
+        List[List[float]]: The chunk similarity scores of each reference and prediction pair
+    """
+    # Collecting the aligned chunks of each pair along with the index of the pair they belong to
+    pair_indices: List[int] = []
+    pred_chunks: List[str] = []
+    ref_chunks: List[str] = []
+    for index, (pred, ref) in enumerate(zip(predictions, references)):
+        for p_chunk, r_chunk in zip(split_into_chunks(pred, model.tokenizer, max_length), split_into_chunks(ref, model.tokenizer, max_length)):
+            pair_indices.append(index)
+            pred_chunks.append(p_chunk)
+            ref_chunks.append(r_chunk)
+
+    # Intializing list for storing the similarity scores of each pair
+    similarity_scores: List[List[float]] = [[] for _ in range(min(len(references), len(predictions)))]
+    if not pair_indices: return similarity_scores
+
+    # Encoding each unique chunk once in batched forward passes, as references and predictions repeat heavily
+    unique_chunks = list(dict.fromkeys(pred_chunks + ref_chunks))
+    chunk_index = {chunk: index for index, chunk in enumerate(unique_chunks)}
+    embeddings = model.encode(unique_chunks, batch_size=batch_size, convert_to_tensor=True)
+
+    # Calculating the cosine similarity of each chunk pair from the unique chunk embeddings
+    pred_embeddings = embeddings[[chunk_index[chunk] for chunk in pred_chunks]]
+    ref_embeddings = embeddings[[chunk_index[chunk] for chunk in ref_chunks]]
+    cosine_scores = util.pairwise_cos_sim(pred_embeddings, ref_embeddings).tolist()
+    for index, cosine_score in zip(pair_indices, cosine_scores):
+        similarity_scores[index].append(cosine_score)
+    return similarity_scores
+
+def cosine_similarity_score(references: list, predictions: list, embedding_model: str, max_length: int = 512, model: Optional[SentenceTransformer] = None) -> dict:
     """
     Calculate the Cosine Similarity scores between the reference output and the predicted output
     Args:
@@ -106,31 +163,33 @@ def cosine_similarity_score(references: list, predictions: list, embedding_model
         predictions (list): The list of predicted outputs
         embedding_model (str): The name of the embedding model to be used
         max_length (int): The maximum length of each chunk
+        model (Optional[SentenceTransformer]): An already loaded embedding model to reuse across calls
     Returns:
         dict: The Cosine Similarity score
     """
     # Loading the Embedding model from Sentence Transformers
-    model = SentenceTransformer(embedding_model)
-
-    # Intializing list for storing similarity scores
-    similarity_scores: List[float] = []
-
-    # Iterating each reference and prediction pair
-    for pred, ref in zip(predictions, references):
-        pred_chunks = split_into_chunks(pred, model.tokenizer, max_length)
-        ref_chunks = split_into_chunks(ref, model.tokenizer, max_length)
+    model = model if model else SentenceTransformer(embedding_model)
 
-        # Calculating cosine similarity for each chunk separately
-        for p_chunk, r_chunk in zip(pred_chunks, ref_chunks):
-            emb1 = model.encode(p_chunk, convert_to_tensor=True)
-            emb2 = model.encode(r_chunk, convert_to_tensor=True)
-            cosine_score = util.cos_sim(emb1, emb2).item()
-            similarity_scores.append(cosine_score)
+    # Calculating cosine similarity for each chunk pair
+    similarity_scores = [score for pair_scores in pairwise_cosine_similarities(references, predictions, model, max_length) for score in pair_scores]
 
     # Aggregating the scores - average across chunks
     average_similarity = sum(similarity_scores) / len(similarity_scores) if similarity_scores else 0.0
     return average_similarity
 
+def fuzzy_match_score(references: list, predictions: list) -> float:
+    """
+    Calculate the average fuzzy match score (token set ratio) between the reference output and the predicted output
+    Args:
+        references (list): The list of reference outputs
+        predictions (list): The list of predicted outputs
+    Returns:
+        float: The average fuzzy match score between 0 and 1
+    """
+    # Score all pairs in one vectorized call, preprocessing each string once and using all CPU cores
+    scores = process.cpdist(references, predictions, scorer=fuzz.token_set_ratio, processor=utils.default_process, workers=-1)
+    return float(np.mean(scores)) / 100 if len(scores) else 0.0
+
 def hungarian_similarity(sent1: str, sent2: str, embedding_model: str = "allenai/scibert_scivocab_uncased") -> float:
     """
     Calculate the similarity between two sentences using the Hungarian algorithm for optimal token alignment based on cosine similarity of embeddings.
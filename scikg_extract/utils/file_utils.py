@@ -9,6 +9,13 @@ import json
 import yaml
 import logging
 from pathlib import Path
+from typing import Iterator
+
+# External Imports
+import orjson
+
+# Module-level logger, resolved once instead of on every call
+logger = logging.getLogger(__name__)
 
 def read_yaml_file(file_path: str, enc: str = "utf-8"):
     """
@@ -19,16 +26,14 @@ def read_yaml_file(file_path: str, enc: str = "utf-8"):
     Returns:
         dict: The content of the YAML file in a dictionary format. In case of exception, 'None' is returned!
     """
-    # Initialize the logger
-    logger = logging.getLogger(__name__)
     try:
         with open(file=file_path, mode="r", encoding=enc) as f:
             cfg = yaml.safe_load(f)
         return cfg
     except FileNotFoundError:
-        logger.debug(f"File NOT Found at path: {file_path}")
+        logger.debug("File NOT Found at path: %s", file_path)
     except Exception as e:
-        logger.debug(f"Exception occured: {e},\nType: {type(e)}")
+        logger.debug("Exception occured: %s,\nType: %s", e, type(e))
     return None
 
 def read_json_file(filepath: str, encoding: str = "utf-8") -> dict | None:
@@ -40,21 +45,37 @@ def read_json_file(filepath: str, encoding: str = "utf-8") -> dict | None:
     Returns:
         dict: The content of the JSON file in a dictionary format. In case of exception, 'None' is returned!
     """
-    # Initialize the logger
-    logger = logging.getLogger(__name__)
     try:
-        with open(filepath, "r", encoding=encoding) as f:
-            data = json.load(f)
+        # Parse the raw bytes with orjson, decoding first only for non UTF-8 files
+        with open(filepath, "rb") as f:
+            content = f.read()
+        data = orjson.loads(content if encoding.lower().replace("-", "") == "utf8" else content.decode(encoding))
         return data
     except json.JSONDecodeError:
-        logger.debug("Cannot parse JSON file: {}".format(filepath))
+        logger.debug("Cannot parse JSON file: %s", filepath)
     except FileNotFoundError:
-        logger.debug("File Not Found: {}".format(filepath))
+        logger.debug("File Not Found: %s", filepath)
     except Exception as e:
-        logger.debug("Exception occured: {}".format(e))
+        logger.debug("Exception occured: %s", e)
     return None
 
-def save_json_file(filepath, filename, data, encoding="utf-8") -> bool:
+def _widen_indentation(content: bytes, indent: int) -> bytes:
+    """
+    Converts the 2-space indentation of orjson output to another indentation, giving the same output as json.dump with that indentation.
+    Args:
+        content (bytes): The JSON document indented by 2 spaces.
+        indent (int): The indentation to convert to.
+    Returns:
+        bytes: The JSON document with the requested indentation.
+    """
+    # JSON strings cannot contain raw newlines, so the leading spaces of each line are all indentation
+    lines = []
+    for line in content.split(b"\n"):
+        stripped = line.lstrip(b" ")
+        lines.append(b" " * ((len(line) - len(stripped)) // 2 * indent) + stripped)
+    return b"\n".join(lines)
+
+def save_json_file(filepath, filename, data, encoding="utf-8", indent: int | None = 4, sort_keys: bool = False) -> bool:
     """
     Saves the JSON data to a file at the specified path
     Args:
@@ -62,25 +83,37 @@ def save_json_file(filepath, filename, data, encoding="utf-8") -> bool:
         filename (str): The name of the file to save the JSON data
         data (dict): The JSON data to be saved
         encoding (str, optional): The encoder to use for writing the file. Defaults to "utf-8".
+        indent (int | None, optional): The indentation of the JSON output, compact if None. UTF-8 files are serialized with orjson, whose 2-space indentation is widened to the requested one. Defaults to 4.
+        sort_keys (bool, optional): Whether to write the keys of dictionaries in sorted order. Defaults to False.
     Returns:
         bool: True if the file was saved successfully, otherwise False
     """
-    # Initialize the logger
-    logger = logging.getLogger(__name__)
     try:
         # Checking if the directory exist, if not create the directory
         os.makedirs(filepath, exist_ok=True)
         filename = "{}/{}".format(filepath, filename)
 
+        # Serialize straight to UTF-8 bytes with orjson, falling back to json for data it cannot serialize (e.g., integers above 64 bits)
+        if (indent is None or indent > 0) and encoding.lower().replace("-", "") == "utf8":
+            try:
+                content = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0))
+            except orjson.JSONEncodeError:
+                content = None
+            if content is not None:
+                if indent and indent != 2: content = _widen_indentation(content, indent)
+                with open(filename, "wb") as f:
+                    f.write(content)
+                return True
+
         # Writing the JSON data on the file
         with open(filename, "w", encoding=encoding) as f:
             # Preserve non-ASCII characters (e.g., degree symbol) when writing JSON
-            json.dump(data, f, indent=4, ensure_ascii=False)
+            json.dump(data, f, indent=indent, ensure_ascii=False, sort_keys=sort_keys)
         return True
     except json.JSONDecodeError:
-        logger.debug("Cannot parse JSON file: {}".format(filepath))
+        logger.debug("Cannot parse JSON file: %s", filepath)
     except Exception as e:
-        logger.debug("Exception occured: {}".format(e))
+        logger.debug("Exception occured: %s", e)
     return False
 
 def read_text_file(file_path: str, enc: str = "utf-8"):
@@ -92,16 +125,17 @@ def read_text_file(file_path: str, enc: str = "utf-8"):
     Returns:
         str: The content of the text file as a string. In case of exception, 'None' is returned!
     """
-    # Initialize the logger
-    logger = logging.getLogger(__name__)
     try:
-        with open(file=file_path, mode="r", encoding=enc) as f:
-            data = f.read()
+        # Read the raw bytes and decode them in one step instead of through the buffered text layer
+        data = Path(file_path).read_bytes().decode(enc)
+
+        # Apply the universal newline translation of text mode reads
+        if "\r" in data: data = data.replace("\r\n", "\n").replace("\r", "\n")
         return data
     except FileNotFoundError:
-        logger.debug(f"File NOT Found at path: {file_path}")
+        logger.debug("File NOT Found at path: %s", file_path)
     except Exception as e:
-        logger.debug(f"Exception occured: {e},\nType: {type(e)}")
+        logger.debug("Exception occured: %s,\nType: %s", e, type(e))
     return None
 
 def write_text_file(file_path: str, text: str, encoding: str = "utf-8"):
@@ -114,8 +148,6 @@ def write_text_file(file_path: str, text: str, encoding: str = "utf-8"):
     Returns:
         bool: True if the file was written successfully, otherwise False
     """
-    # Initialize the logger
-    logger = logging.getLogger(__name__)
     try:
         # Checking if the directory exist, if not create the directory
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
@@ -124,9 +156,39 @@ def write_text_file(file_path: str, text: str, encoding: str = "utf-8"):
             f.write(text)
         return True
     except Exception as e:
-        logger.debug("Exception occured: {}".format(e))
+        logger.debug("Exception occured: %s", e)
         return False
 
+def iter_files(directory: str, extensions: tuple[str, ...] = ()) -> Iterator[os.DirEntry]:
+    """
+    Recursively yields the files under a directory using `os.scandir`, whose cached entry types avoid the extra stat calls and per-directory lists built by `os.walk`.
+    Args:
+        directory (str): The root directory to scan.
+        extensions (tuple[str, ...], optional): File extensions to keep (e.g., (".json",)). Defaults to () which keeps all files.
+    Returns:
+        Iterator[os.DirEntry]: The directory entries of the matching files.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path, extensions)
+            elif not extensions or entry.name.endswith(extensions):
+                yield entry
+
+def list_filenames(directory: str) -> frozenset[str]:
+    """
+    Lists the names of the entries in a directory with a single `os.scandir` call, so membership checks of many files do not each pay a `stat` round trip.
+    Args:
+        directory (str): The directory to list.
+    Returns:
+        frozenset[str]: The entry names, empty if the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
 def load_text_input(input_val: str | Path) -> str:
     """
     Resolve a text input that may be provided as either a file path or a string. If the input corresponds to an existing file path, the file will be read and its contents returned as a string. If the input does not match a valid file path, it is treated as the string itself and returned unchanged.
@@ -137,9 +199,16 @@ def load_text_input(input_val: str | Path) -> str:
     """
     if not isinstance(input_val, (str, Path)):
         raise TypeError("The input must be a string or Path object")
-    path = Path(input_val)
-    text = read_text_file(str(path)) if path.is_file() else str(input_val)
-    return text
+
+    # Open the input directly instead of stat-ing it first; anything that cannot be opened is treated as text
+    try:
+        with open(input_val, "r", encoding="utf-8") as f:
+            return f.read()
+    except UnicodeDecodeError as e:
+        logger.debug("Exception occured: %s,\nType: %s", e, type(e))
+        return None
+    except (OSError, ValueError):
+        return str(input_val)
 
 def load_json_input(input_val: dict | Path) -> dict | None:
     """
@@ -152,8 +221,16 @@ def load_json_input(input_val: dict | Path) -> dict | None:
     if not isinstance(input_val, (dict, Path)):
         raise TypeError("The input must be a dictionary or Path object")
     if isinstance(input_val, Path):
-        if input_val.is_file():
-            return read_json_file(str(input_val))
-        else:
-            raise FileNotFoundError(f"JSON file not found: {input_val}")
+
+        # Open the file directly instead of stat-ing it first
+        try:
+            with open(input_val, "rb") as f:
+                content = f.read()
+        except (FileNotFoundError, IsADirectoryError):
+            raise FileNotFoundError(f"JSON file not found: {input_val}") from None
+        try:
+            return orjson.loads(content)
+        except json.JSONDecodeError:
+            logger.debug("Cannot parse JSON file: %s", input_val)
+            return None
     return input_val
\ No newline at end of file
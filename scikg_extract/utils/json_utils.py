@@ -3,12 +3,24 @@ JSON utility functions for SciKGExtract.
 
 Provides functions for validating JSON schemas and instances, as well as a fallback mechanism for handling cases where LLMs return raw JSON arrays instead of the expected wrapper objects.
 """
+# Python imports
+import json
+from functools import lru_cache
+from typing import Callable
+
 # Jsonschema Import
+import fastjsonschema
 from jsonschema import Draft7Validator
 
 # SciKGExtract Utility Imports
 from scikg_extract.utils.log_handler import LogHandler
 
+# Module-level logger, resolved once instead of on every call
+logger = LogHandler.get_logger(__name__)
+
+# Serialized process schemas keyed by the identity of the schema dictionary, with the schema kept alive to guard the identity
+_SERIALIZED_SCHEMAS: dict[int, tuple[dict, str]] = {}
+
 def json_schema_validate(schema: dict) -> bool:
     """
     Validate the provided JSON schema using Draft7Validator.
@@ -17,17 +29,71 @@ def json_schema_validate(schema: dict) -> bool:
     Returns:
         bool: True if the schema is valid, False otherwise.
     """
-    
-    # Initialize the logger
-    logger = LogHandler.get_logger(__name__)
-
     try:
         Draft7Validator.check_schema(schema)
         return True
     except Exception as e:
-        logger.debug(f"Schema validation error: {e}")
+        logger.debug("Schema validation error: %s", e)
         return False
+
+@lru_cache(maxsize=32)
+def _compile_validator(schema_key: str) -> Callable[[dict], bool]:
+    """
+    Compile a JSON schema into a generated validation function once and reuse it for every instance validated against the same schema. Schemas rejected by the code generator (e.g., required properties that are not allowed) fall back to Draft7Validator.
+    Args:
+        schema_key (str): The JSON schema serialized with sorted keys, since dictionaries are not hashable.
+    Returns:
+        Callable[[dict], bool]: A function returning True if an instance is valid against the schema, False otherwise.
+    """
+    schema = json.loads(schema_key)
+    try:
+        validate = fastjsonschema.compile(schema, use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException as e:
+        logger.debug("Schema cannot be compiled, falling back to Draft7Validator: %s", e)
+        return Draft7Validator(schema).is_valid
+    return as_instance_validator(validate)
+
+def as_instance_validator(validate: Callable[[dict], dict]) -> Callable[[dict], bool]:
+    """
+    Wrap a fastjsonschema validation function, which raises for invalid instances, into a predicate. Also used for validators compiled ahead of time with fastjsonschema.compile_to_code.
+    Args:
+        validate (Callable[[dict], dict]): The generated validation function.
+    Returns:
+        Callable[[dict], bool]: A function returning True if an instance is valid, False otherwise.
+    """
+    def is_valid(instance: dict) -> bool:
+        try:
+            validate(instance)
+            return True
+        except fastjsonschema.JsonSchemaException as e:
+            logger.debug("Instance validation error: %s", e.message)
+            return False
+    return is_valid
     
+def get_instance_validator(schema: dict) -> Callable[[dict], bool]:
+    """
+    Get the compiled validator of a JSON schema, so that many instances can be validated against it without serializing the schema for every instance.
+    Args:
+        schema (dict): The JSON schema to validate against.
+    Returns:
+        Callable[[dict], bool]: A function returning True if an instance is valid against the schema, False otherwise.
+    """
+    return _compile_validator(json.dumps(schema, sort_keys=True))
+
+def dumps_schema(schema: dict) -> str:
+    """
+    Serialize a process schema once and reuse the text for every document configured with the same schema dictionary, as the schema is loaded once per run and shared by all documents.
+    Args:
+        schema (dict): The JSON schema to serialize. Must not be mutated after its first serialization.
+    Returns:
+        str: The schema serialized with json.dumps.
+    """
+    cached = _SERIALIZED_SCHEMAS.get(id(schema))
+    if cached is not None and cached[0] is schema: return cached[1]
+    serialized = json.dumps(schema)
+    _SERIALIZED_SCHEMAS[id(schema)] = (schema, serialized)
+    return serialized
+
 def validate_json_instance(instance: dict, schema: dict) -> bool:
     """
     Validate a JSON instance against the provided JSON schema.
@@ -37,12 +103,9 @@ def validate_json_instance(instance: dict, schema: dict) -> bool:
     Returns:
         bool: True if the instance is valid, False otherwise.
     """
-    # Initialize the logger
-    logger = LogHandler.get_logger(__name__)
-
     try:
-        validator = Draft7Validator(schema)
-        return validator.validate(instance)
+        is_valid = get_instance_validator(schema)
+        return is_valid(instance)
     except Exception as e:
-        logger.debug(f"Instance validation error: {e}")
+        logger.debug("Instance validation error: %s", e)
         return False
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+Rate limiter utility for SciKGExtract.
+
+Provides an asynchronous token-bucket rate limiter that keeps concurrent LLM requests under a provider's requests-per-minute and tokens-per-minute limits, so bursts of concurrent calls wait for capacity instead of triggering rate limit errors and retry storms.
+"""
+# Python Imports
+import time
+import asyncio
+from typing import Optional
+
+class AsyncRateLimiter:
+    """
+    An asynchronous token-bucket rate limiter for requests per minute and tokens per minute. Both buckets start full and refill continuously at their per-minute rate.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None):
+        """
+        Initializes the rate limiter with the specified limits.
+        Args:
+            requests_per_minute (float, optional): Maximum number of requests per minute. Defaults to None (unlimited).
+            tokens_per_minute (float, optional): Maximum number of tokens per minute. Defaults to None (unlimited).
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.available_requests = requests_per_minute or 0.0
+        self.available_tokens = tokens_per_minute or 0.0
+        self.last_refill = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """
+        Refills both buckets for the time elapsed since the last refill, capped at their per-minute limits.
+        """
+        now = time.monotonic()
+        elapsed_minutes = (now - self.last_refill) / 60
+        self.last_refill = now
+        if self.requests_per_minute:
+            self.available_requests = min(self.requests_per_minute, self.available_requests + elapsed_minutes * self.requests_per_minute)
+        if self.tokens_per_minute:
+            self.available_tokens = min(self.tokens_per_minute, self.available_tokens + elapsed_minutes * self.tokens_per_minute)
+
+    async def acquire(self, requests: int = 1, tokens: int = 0) -> None:
+        """
+        Waits until the requests and tokens are available and consumes them. Waiters are served in arrival order.
+        Args:
+            requests (int, optional): Number of requests to consume. Defaults to 1.
+            tokens (int, optional): Estimated number of tokens to consume, capped at the per-minute limit. Defaults to 0.
+        """
+        # Requests larger than a bucket can never fit, so they wait for a full bucket instead
+        requests = min(requests, self.requests_per_minute) if self.requests_per_minute else 0
+        tokens = min(tokens, self.tokens_per_minute) if self.tokens_per_minute else 0
+
+        async with self.lock:
+            while True:
+                self._refill()
+                if self.available_requests >= requests and self.available_tokens >= tokens:
+                    self.available_requests -= requests
+                    self.available_tokens -= tokens
+                    return
+
+                # Sleep until both buckets have refilled enough
+                wait_minutes = max(
+                    (requests - self.available_requests) / self.requests_per_minute if requests else 0.0,
+                    (tokens - self.available_tokens) / self.tokens_per_minute if tokens else 0.0
+                )
+                await asyncio.sleep(wait_minutes * 60)
@@ -1,14 +1,75 @@
 """
 REST client utility for SciKGExtract.
 
-Provides a simple asynchronous REST client using httpx for making GET and POST requests to specified endpoints, with optional API key authentication and error handling.
+Provides a simple asynchronous REST client using httpx for making GET and POST requests to specified endpoints, with optional API key authentication and error handling, and helpers to retry transient request errors with exponential backoff and to space requests to a rate-limited API.
 """
-# Httpx Import
+# External Imports
 import httpx
+import orjson
 
 # Python Imports
+import time
+import random
+import threading
 from typing import Any, Dict, Optional
 
+# HTTP status codes of transient errors (rate limiting and server overload) worth retrying
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    Checks whether a request error is transient, i.e. a network error or a rate limiting or server overload response.
+    Args:
+        error (Exception): The error raised by the request.
+    Returns:
+        bool: True if the request should be retried, otherwise False.
+    """
+    if isinstance(error, httpx.HTTPStatusError): return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+def retry_delay(attempt: int, error: Exception, initial: float = 0.5, maximum: float = 10.0) -> float:
+    """
+    Computes the delay before retrying a failed request, honouring the Retry-After header of the response if present and otherwise backing off exponentially with full jitter.
+    Args:
+        attempt (int): The zero-based number of the failed attempt.
+        error (Exception): The error raised by the request.
+        initial (float, optional): The maximum delay in seconds after the first attempt. Defaults to 0.5.
+        maximum (float, optional): The upper bound of the delay in seconds. Defaults to 10.0.
+    Returns:
+        float: The delay in seconds.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        retry_after = error.response.headers.get("Retry-After", "")
+        if retry_after.isdigit(): return min(float(retry_after), maximum)
+    return random.uniform(0, min(maximum, initial * 2 ** attempt))
+
+class RateLimiter:
+    """
+    A thread-safe limiter spacing requests evenly to stay within a maximum request rate. Callers reserve a slot and wait the returned delay, with time.sleep or asyncio.sleep, before sending their request.
+    """
+
+    def __init__(self, requests_per_second: float):
+        """
+        Initializes the limiter with the maximum request rate.
+        Args:
+            requests_per_second (float): The maximum number of requests per second.
+        """
+        self.interval = 1.0 / requests_per_second
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserves the next free request slot.
+        Returns:
+            float: The delay in seconds to wait before sending the request.
+        """
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+            return slot - now
+
 class RestClient:
     """
     A simple REST client for making HTTP requests(GET and POST) to a specified base URL.
@@ -28,7 +89,7 @@ class RestClient:
 
     async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Sends a GET request to the specified endpoint with optional query parameters.
+        Sends a GET request to the specified endpoint with optional query parameters. The JSON body is parsed from the raw bytes with orjson.
         Args:
             endpoint (str): The API endpoint to send the GET request to.
             params (dict, optional): Query parameters for the GET request. Defaults to None.
@@ -41,7 +102,7 @@ class RestClient:
         headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
         response = await self.client.get(url, headers=headers, params=params)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     async def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> httpx.Response:
         """
@@ -58,7 +119,7 @@ class RestClient:
         headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
         response = await self.client.post(url, headers=headers, json=data)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def close(self) -> None:
         """
@@ -1,15 +1,19 @@
 """
 String utility functions for SciKGExtract.
 
-Provides functions for normalizing and cleaning strings, filtering lists of strings, and parsing dot-notation paths with array indices for traversing nested extraction outputs.
+Provides functions for normalizing and cleaning strings, filtering lists of strings, formatting PubChem CID annotations, and parsing dot-notation paths with array indices for traversing nested extraction outputs.
 """
 # Python Imports
 import codecs
 import re
 import string
 import unicodedata
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
+# Array notation of a dot-notation path segment: key[index] or key[*]
+_ARRAY_SEGMENT_PATTERN = re.compile(r'^([^\[]+)\[([^\]]+)\]$')
+
 def remove_whitespace(s: str) -> str:
     """
     Remove all whitespace characters from the input string.
@@ -82,9 +86,10 @@ def remove_surrounding_quotes(s: str) -> str:
     """
     return re.sub(r'^[\'"]|[\'"]$', ' ', s).strip()
 
+@lru_cache(maxsize=200_000)
 def normalize_string(s: str) -> str:
     """
-    Perform a series of normalization steps on the input string.
+    Perform a series of normalization steps on the input string. Results are memoized, as the same chemical names recur across values and documents.
     Args:
         s (str): The input string.
     Returns:
@@ -106,22 +111,46 @@ def normalize_string(s: str) -> str:
 
 def filter_containing(list_str: List[str], substr: str) -> List[str]:
     """
-    Filter a list of strings to include only those that contain a specific substring.
+    Filter a list of strings to include only those that contain a specific substring (case-insensitive).
     Args:
         list_str (List[str]): The list of strings to filter.
         substr (str): The substring to check for.
     Returns:
         List[str]: A list of strings that contain the specified substring.
     """
-    return [s for s in list_str if substr.lower() in s.lower()]
+    sub = substr.casefold()
+    return [s for s in list_str if sub in s.casefold()]
+
+def cid_from_uri(uri: str) -> str:
+    """
+    Extract the PubChem CID from a PubChem compound URI (e.g., "https://pubchem.ncbi.nlm.nih.gov/compound/962" -> "962").
+    Args:
+        uri (str): The PubChem compound URI.
+    Returns:
+        str: The PubChem CID, i.e. the last path segment of the URI.
+    """
+    return uri.rpartition("/")[2]
+
+def format_value_with_cids(value: str, cid_uris: List[str]) -> str:
+    """
+    Format a value with the PubChem CIDs of its compound URIs as "<value> [CID:<cid1>, <cid2>]".
+    Args:
+        value (str): The value to format.
+        cid_uris (List[str]): The PubChem compound URIs of the value.
+    Returns:
+        str: The formatted value, or the value unchanged if it has no compound URIs.
+    """
+    if not cid_uris: return value
+    return f"{value} [CID:{', '.join([cid_from_uri(uri) for uri in cid_uris])}]"
 
-def parse_path(path: str) -> List[Tuple[str, Optional[int]]]:
+@lru_cache(maxsize=None)
+def parse_path(path: str) -> Tuple[Tuple[str, Optional[int]], ...]:
     """
-    Parse a dot-notation path into a list of (key, index) tuples.
+    Parse a dot-notation path into a tuple of (key, index) tuples. Parsed paths are memoized, as the same property paths are traversed for every process.
     Args:
         path: Dot-notation path string
     Returns:
-        List of tuples where each tuple is (key, index). Index is None if not specified,
+        Tuple of tuples where each tuple is (key, index). Index is None if not specified,
         -1 for wildcard '*', or an integer for specific indices.
     """
 
@@ -135,7 +164,7 @@ def parse_path(path: str) -> List[Tuple[str, Optional[int]]]:
     for segment in segments:
         
         # Check if segment has array notation: key[index] or key[*]
-        match = re.match(r'^([^\[]+)\[([^\]]+)\]$', segment)
+        match = _ARRAY_SEGMENT_PATTERN.match(segment)
         
         # If it matches the array notation
         if match:
@@ -157,8 +186,8 @@ def parse_path(path: str) -> List[Tuple[str, Optional[int]]]:
             # Regular key without array notation
             parts.append((segment, None))
     
-    # Return the list of parsed parts
-    return parts
+    # Return the parsed parts
+    return tuple(parts)
 
 def decode_unicode_escapes(s) -> str:
     """
@@ -8,7 +8,10 @@ Last Modified: 10th December 2025
 
 # Python Imports
 import os
+import re
 import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 
 # External Imports
 import pandas as pd
@@ -16,7 +19,7 @@ import pandas as pd
 # SciKG-Extract Utils Imports
 from scikg_extract.utils.log_handler import LogHandler
 from scikg_extract.utils.dict_utils import flatten_record
-from scikg_extract.utils.file_utils import read_json_file
+from scikg_extract.utils.file_utils import iter_files, read_json_file
 
 def read_data_category(filename: str, json_data: list[dict], category: str, skip_properties: list[str] = []) -> list[dict[str, str]]:
     """
@@ -37,21 +40,21 @@ def read_data_category(filename: str, json_data: list[dict], category: str, skip
     # Initialize list to hold rows
     rows: list[dict[str, str]] = []
 
+    # Compile skipped properties into a single pattern applied during flattening
+    skip = re.compile("|".join(map(re.escape, skip_properties))).search if skip_properties else None
+
     # Iterate over multiple process entries if present
     for index, entry in enumerate(json_data):
 
         # Check if the category exists in the entry
         if category in entry:
             
-            # Flatten the records for the category
-            property_value_pairs = flatten_record(entry[category])
+            # Flatten the records for the category, pruning skipped properties by substring match
+            property_value_pairs = flatten_record(entry[category], skip=skip)
 
             # Skip if no data found
             if not property_value_pairs: continue
 
-            # Filter out skipped properties by substring match
-            property_value_pairs = [(p, v) for p, v in property_value_pairs if not any(skip_prop in p for skip_prop in skip_properties)]
-
             # Construct a row dictionary
             row = {}
 
@@ -78,6 +81,32 @@ def read_data_category(filename: str, json_data: list[dict], category: str, skip
     # Return the list of rows for the category
     return rows
 
+def parse_json_file(file_info: tuple[str, str], key: str, data_categories: list[str], skip_properties: list[str] = []) -> tuple[str, dict[str, list[dict[str, str]]]]:
+    """
+    Parses a single extracted JSON file and reads the rows for every data category. Runs inside a worker process.
+    Args:
+        file_info (tuple[str, str]): The path to the JSON file and its filename.
+        key (str): Key containing nested JSON data to export.
+        data_categories (list[str]): The data categories to read.
+        skip_properties (list[str], optional): List of properties to skip. Defaults to [].
+    Returns:
+        tuple[str, dict[str, list[dict[str, str]]]]: The file path and the rows read for each data category.
+    """
+
+    # Read the JSON file
+    file_path, file = file_info
+    json_data = read_json_file(file_path)
+    json_data = json_data.get(key, json_data) if key else json_data
+
+    # Read data for every category, skipping categories without rows
+    rows_by_category = {}
+    for category in data_categories:
+        rows = read_data_category(file, json_data, category, skip_properties)
+        if rows: rows_by_category[category] = rows
+
+    # Return the file path with the rows per category
+    return file_path, rows_by_category
+
 def format_rows_with_same_columns(rows: list[dict[str, str]]) -> pd.DataFrame:
     """
     Formats rows ensuring they all have the same columns, filling missing values with empty strings.
@@ -116,9 +145,30 @@ def format_rows_with_same_columns(rows: list[dict[str, str]]) -> pd.DataFrame:
     other_columns = [col for col in df.columns if col not in index_columns]
     df = df[index_columns + other_columns]
 
+    # Store string columns as Arrow-backed strings to shrink the DataFrame footprint
+    df = df.astype({col: "string[pyarrow]" for col in df.columns if df[col].dtype == object})
+
     # Return the formatted DataFrame
     return df
 
+def write_sheet_rows(writer: pd.ExcelWriter, df: pd.DataFrame, sheet_name: str) -> None:
+    """
+    Writes a DataFrame to an Excel sheet row by row. Required for xlsxwriter's constant_memory mode, which flushes each row to disk once a later row is written and therefore cannot handle the column-wise cell order used by DataFrame.to_excel.
+    Args:
+        writer (pd.ExcelWriter): The Excel writer backed by the xlsxwriter engine.
+        df (pd.DataFrame): The DataFrame to write.
+        sheet_name (str): The name of the sheet to create.
+    """
+
+    # Create the worksheet and header format
+    worksheet = writer.book.add_worksheet(sheet_name)
+    header_format = writer.book.add_format({"bold": True})
+
+    # Write the header row followed by the data rows in order
+    worksheet.write_row(0, 0, list(df.columns), header_format)
+    for row_index, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_index, 0, row)
+
 if __name__ == "__main__":
     """Main function to convert extracted JSON data to Excel format"""
 
@@ -128,6 +178,7 @@ if __name__ == "__main__":
     parser.add_argument("--output", type=str, required=False, help="Path to save the output Excel file.")
     parser.add_argument("--key", type=str, default="processes", help="Key containing nested JSON data to export.")
     parser.add_argument("--llm_model", type=str, default="gpt-5-mini", help="The name of the large language model used during extraction.")
+    parser.add_argument("--max_workers", type=int, default=None, help="Number of worker processes used to parse JSON files. Defaults to the number of CPUs.")
 
     # Parse arguments
     args = parser.parse_args()
@@ -157,43 +208,22 @@ if __name__ == "__main__":
     # Initialize dictionary to hold row dictionaries for each category
     category_rows = {}
 
-    # Iterate over JSON files in the input directory
-    for root, _, files in os.walk(input_path):
-        
-        # Skipping if no files found
-        if not files: continue
-
-        # Extracting LLM model from directory structure
-        llm = root.split(os.sep)[-1]
-        if llm != llm_model: continue
-
-        # Iterate over files
-        for file in files:
-
-            # Process only JSON files
-            if not file.endswith(".json"): continue
-
-            # Read the JSON file
-            file_path = os.path.join(root, file)
-            json_data = read_json_file(file_path)
-            json_data = json_data.get(args.key, json_data) if args.key else json_data
-            logger.info(f"Processing file: {file_path} with {len(json_data)} entries.")
-
-            # Iterate over data categories
-            for category in data_categories:
-                
-                # Read data for the category
-                rows = read_data_category(file, json_data, category, skip_properties)
-                
-                # Skip if no rows found for the category
-                if not rows: continue
+    # Collect JSON files in the input directory, keeping only those extracted by the selected LLM model
+    json_files: list[tuple[str, str]] = [
+        (entry.path, entry.name)
+        for entry in iter_files(input_path, (".json",))
+        if os.path.basename(os.path.dirname(entry.path)) == llm_model
+    ]
 
-                # Initialize category in dictionary if not present
-                if category not in category_rows:
-                    category_rows[category] = []
+    # Parse JSON files in parallel and aggregate rows per category in the main process
+    parse_file = partial(parse_json_file, key=args.key, data_categories=data_categories, skip_properties=skip_properties)
+    with ProcessPoolExecutor(max_workers=args.max_workers) as executor:
+        for file_path, rows_by_category in executor.map(parse_file, json_files, chunksize=8):
+            logger.info(f"Processed file: {file_path} with rows for {len(rows_by_category)} categories.")
 
-                # Append rows to the category
-                category_rows[category].extend(rows)
+            # Append rows to each category
+            for category, rows in rows_by_category.items():
+                category_rows.setdefault(category, []).extend(rows)
 
     # Format rows for each category to ensure consistent columns
     for category in data_categories:
@@ -204,8 +234,8 @@ if __name__ == "__main__":
         # Format rows with same columns
         category_rows[category] = format_rows_with_same_columns(category_rows[category])
 
-    # Write to Excel with multiple sheets
-    with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
+    # Write to Excel with multiple sheets, streaming rows to disk instead of buffering the workbook in memory
+    with pd.ExcelWriter(output_path, engine='xlsxwriter', engine_kwargs={"options": {"constant_memory": True}}) as writer:
         
         # Iterate over categories and write each to a separate sheet
         for category in data_categories:
@@ -215,6 +245,6 @@ if __name__ == "__main__":
 
             # Write DataFrame to Excel sheet
             sheet_name = category[:31]  # Excel sheet name limit
-            category_rows[category].to_excel(writer, sheet_name=sheet_name, index=False)
+            write_sheet_rows(writer, category_rows[category], sheet_name)
             logger.info(f"Wrote category '{category}' to sheet '{sheet_name}' with {len(category_rows[category])} rows.")
 
@@ -2,18 +2,153 @@ import os
 import json
 import argparse
 
-from rapidfuzz import fuzz
-from sklearn.metrics import precision_score, recall_score, f1_score
-
-from scikg_extract.utils.evaluation_utils import bert_score, cosine_similarity_score
+import torch
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sklearn.metrics import precision_recall_fscore_support
+from sentence_transformers import SentenceTransformer
+
+from scikg_extract.utils.evaluation_utils import bert_score, pairwise_cosine_similarities, fuzzy_match_score
 from scikg_extract.utils.log_handler import LogHandler
-from scikg_extract.utils.file_utils import read_json_file
+from scikg_extract.utils.file_utils import iter_files, read_json_file
+from scikg_extract.utils.string_utils import format_value_with_cids
+
+def format_reference(annotation: str, cid_mapping: dict[str, str], with_cids: bool) -> str:
+    """
+    Formats an AtomicLimits annotation as a reference value, appending its PubChem CIDs when available.
+    Args:
+        annotation (str): The AtomicLimits annotation.
+        cid_mapping (dict[str, str]): The PubChem CIDs of the AtomicLimits annotations.
+        with_cids (bool): Whether to append the PubChem CIDs (evaluation with normalization).
+    Returns:
+        str: The formatted reference value.
+    """
+    if with_cids and annotation in cid_mapping: return f"{annotation} [CID:{cid_mapping[annotation]}]"
+    return annotation
+
+def format_prediction(entry: dict | None, with_cids: bool) -> str:
+    """
+    Formats an extracted normalized entry ({"value": ..., "sameAs": [...]}) as a predicted value, appending its PubChem CIDs when available.
+    Args:
+        entry (dict | None): The extracted normalized entry.
+        with_cids (bool): Whether to append the PubChem CIDs (evaluation with normalization).
+    Returns:
+        str: The formatted predicted value, or an empty string if no entry was extracted.
+    """
+    if not entry: return ""
+    if with_cids and entry.get("sameAs"): return format_value_with_cids(entry["value"], entry["sameAs"])
+    return entry.get("value", "")
+
+class ComparisonRowWriter:
+    """
+    Streams the compared reference and predicted value pairs to a Parquet file in fixed-size record batches, so the pairs are not held in memory while the extracted files are read.
+    """
+
+    # Columns of the compared value pairs
+    SCHEMA = pa.schema([("file", pa.string()), ("field", pa.string()), ("reference", pa.string()), ("predicted", pa.string())])
+
+    def __init__(self, path: str, batch_size: int = 1000):
+        """
+        Opens the Parquet file to stream the compared value pairs into.
+        Args:
+            path (str): Path of the Parquet file.
+            batch_size (int, optional): Number of rows buffered before writing a record batch. Defaults to 1000.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.writer = pq.ParquetWriter(path, self.SCHEMA)
+        self.batch_size = batch_size
+        self.rows: dict[str, list[str]] = {name: [] for name in self.SCHEMA.names}
+
+    def write(self, file: str, field: str, reference: str, predicted: str) -> None:
+        """
+        Buffers a compared value pair, writing a record batch once the buffer is full.
+        Args:
+            file (str): The extracted data file of the pair.
+            field (str): The compared field.
+            reference (str): The AtomicLimits reference value.
+            predicted (str): The extracted predicted value.
+        """
+        for name, value in zip(self.SCHEMA.names, (file, field, reference, predicted)):
+            self.rows[name].append(value)
+        if len(self.rows["field"]) >= self.batch_size: self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered value pairs as a record batch.
+        """
+        if not self.rows["field"]: return
+        self.writer.write_batch(pa.RecordBatch.from_pydict(self.rows, schema=self.SCHEMA))
+        self.rows = {name: [] for name in self.SCHEMA.names}
+
+    def close(self) -> None:
+        """
+        Writes the remaining value pairs and closes the Parquet file.
+        """
+        self.flush()
+        self.writer.close()
+
+def record_comparison(comparison_results: dict, row_writer: ComparisonRowWriter, file: str, field: str, reference: str, prediction: str) -> None:
+    """
+    Records a reference and predicted value pair of a field, updating the streaming exact match counters and streaming the pair to the Parquet file.
+    Args:
+        comparison_results (dict): The comparison results of all fields.
+        row_writer (ComparisonRowWriter): The writer streaming the compared value pairs.
+        file (str): The extracted data file of the pair.
+        field (str): The compared field.
+        reference (str): The AtomicLimits reference value.
+        prediction (str): The extracted predicted value.
+    """
+    comparison_results[field]["total"] += 1
+    comparison_results[field]["exact"] += reference == prediction
+    row_writer.write(file, field, reference, prediction)
+
+def parse_cids(value: str) -> list[str]:
+    """
+    Parses the unique PubChem CIDs annotated in a value formatted as "<value> [CID:<cid1>, <cid2>]".
+    Args:
+        value (str): The formatted value.
+    Returns:
+        list[str]: The sorted unique CIDs, or a single empty string if the value has no CID annotation.
+    """
+    if "[CID:" not in value: return [""]
+    return sorted({cid.strip() for cid in value.split("[CID:")[-1].rstrip("]").split(",")})
+
+def align_cid_labels(references: list[str], predictions: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Aligns the CIDs of each reference and predicted value pair into label arrays, cycling the CIDs of the value with fewer CIDs so both values contribute the same number of labels.
+    Args:
+        references (list[str]): The formatted reference values.
+        predictions (list[str]): The formatted predicted values.
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The aligned reference and predicted CID labels.
+    """
+    # Parse the CIDs of every value once and flatten them with their per-value counts
+    ref_cids = [parse_cids(ref) for ref in references]
+    pred_cids = [parse_cids(pred) for pred in predictions]
+    ref_counts = np.fromiter(map(len, ref_cids), dtype=np.int64, count=len(ref_cids))
+    pred_counts = np.fromiter(map(len, pred_cids), dtype=np.int64, count=len(pred_cids))
+    flat_ref_cids = np.array([cid for cids in ref_cids for cid in cids], dtype=object)
+    flat_pred_cids = np.array([cid for cids in pred_cids for cid in cids], dtype=object)
+
+    # Each pair contributes as many labels as its value with the most CIDs
+    label_counts = np.maximum(ref_counts, pred_counts)
+    pair_index = np.repeat(np.arange(len(label_counts)), label_counts)
+    label_position = np.arange(label_counts.sum()) - np.repeat(np.cumsum(label_counts) - label_counts, label_counts)
+
+    # Gather the labels of each pair, cycling over the CIDs of the value with fewer CIDs
+    ref_starts = np.cumsum(ref_counts) - ref_counts
+    pred_starts = np.cumsum(pred_counts) - pred_counts
+    cid_references = flat_ref_cids[ref_starts[pair_index] + label_position % ref_counts[pair_index]]
+    cid_predictions = flat_pred_cids[pred_starts[pair_index] + label_position % pred_counts[pair_index]]
+    return cid_references, cid_predictions
 
 if __name__ == "__main__":
     
     # Configure argument parser
     parser = argparse.ArgumentParser(description="Compare extracted data values with AtomicLimits database annotations.")
-    parser.add_argument("--input", type=str, required=False, help="Path to the directory containing extracted JSON files.")
+    parser.add_argument("--input", type=str, default="results/extracted-data/atomic-layer-deposition/experimental-usecase/version2/IGZO/AtomicLimits Database", help="Path to the directory containing extracted JSON files.")
     parser.add_argument("--output", type=str, required=False, help="Path to save the comparison results.")
     parser.add_argument("--key", type=str, default="processes", help="Key containing nested JSON data to compare.")
     parser.add_argument("--llm_model", type=str, default="gpt-5-mini", help="The name of the large language model used during extraction.")
@@ -26,27 +161,32 @@ if __name__ == "__main__":
     logger.info("Starting comparison of extracted data with AtomicLimits database...")
 
     # Input Path
-    input_path = args.input if args.input else "results/extracted-data/atomic-layer-deposition/experimental-usecase/version2/IGZO/AtomicLimits Database"
+    input_path = args.input
     logger.info(f"Input Path: {input_path}")
 
     # LLM Model used in extraction
-    llm_model = args.llm_model if args.llm_model else "gpt-5-mini"
+    llm_model = args.llm_model
     logger.info(f"LLM Model used: {llm_model}")
 
     # Output Path
     output_path = args.output if args.output else f"results/statistics/atomic-layer-deposition/experimental-usecase/version1/IGZO/comparison_IGZO_AtomicLimits_{llm_model}.xlsx"
     logger.info(f"Output Path: {output_path}")
 
+    # Parquet file the compared value pairs are streamed to, next to the output
+    comparison_rows_path = f"{os.path.splitext(output_path)[0]}.parquet"
+    row_writer = ComparisonRowWriter(comparison_rows_path)
+
     # Evaluate with or without normalization
     evaluate_with_normalization = True
 
-    # Initialize dictionary to hold 
+    # Evaluate with or without the similarity metrics (fuzzy, cosine, BERT and CID scores), which load all value pairs back into memory
+    evaluate_with_similarity_metrics = True
+
+    # Initialize dictionary to hold the exact match counters and, for the similarity metrics, the value pairs of each field
+    coreactant_fields = ["coreactant1", "coreactant2", "coreactant3"]
     comparison_results = {
-        "material_deposited": {"reference": [], "predicted": []},
-        "precursor": {"reference": [], "predicted": []},
-        "coreactant1": {"reference": [], "predicted": []},
-        "coreactant2": {"reference": [], "predicted": []},
-        "coreactant3": {"reference": [], "predicted": []}
+        field: {"total": 0, "exact": 0, "reference": [], "predicted": []}
+        for field in ["material_deposited", "precursor", *coreactant_fields]
     }
 
     # Initialize CID mapping for atomicLimits annotations
@@ -78,183 +218,116 @@ if __name__ == "__main__":
     }
 
     # Iterate over JSON files in the input directory
-    for root, _, files in os.walk(input_path):
-        
-        # Skipping if no files found
-        if not files: continue
-
-        # Check if all files are JSON
-        if not all(file.endswith(".json") for file in files): continue
+    for entry in iter_files(input_path, (".json",)):
 
         # Extracting AtomicLimits annotation from directory structure and LLM model
-        atomiclimits_annotation, llm = root.split(os.sep)[-2:]
+        atomiclimits_annotation, llm = os.path.dirname(entry.path).split(os.sep)[-2:]
         
         # Skip if LLM model does not match
         if llm != llm_model: continue
-        logger.debug(f"Processing AtomicLimits Annotation: {atomiclimits_annotation}, LLM Model: {llm}")
+        logger.debug("Processing AtomicLimits Annotation: %s, LLM Model: %s", atomiclimits_annotation, llm)
 
         # Format the AtomicLimits annotation
         atomiclimits_annotation = atomiclimits_annotation.split(" - ")
-        logger.debug(f"Formatted AtomicLimits Annotation: {atomiclimits_annotation}")
-
-        # Iterate over files
-        for file in files:
-
-            logger.info(f"Processing file: {file}")
-
-            # Read the JSON file
-            file_path = os.path.join(root, file)
-            json_data = read_json_file(file_path)
-            json_data = json_data.get(args.key, json_data) if args.key else json_data
-            logger.debug(f"Processing file: {file_path} with {len(json_data)} entries.")
-
-            # Iterate over each process entry in the JSON data
-            for index, process in enumerate(json_data):
-                logger.debug(f"Processing entry: {index + 1}")
-
-                # Extract material deposited
-                material_deposited_atmoiclimits = "IGZO" # Since we are in ZnO directory
-                
-                # Append CID if available
-                if evaluate_with_normalization and material_deposited_atmoiclimits in cid_mapping:
-                    material_deposited_atmoiclimits = f"{material_deposited_atmoiclimits} [CID:{cid_mapping[material_deposited_atmoiclimits]}]"
-
-                material_deposited = process.get("aldSystem", {}).get("materialDeposited", "")
-
-                if evaluate_with_normalization and material_deposited_atmoiclimits and material_deposited:
-
-                    # Format the predicted material deposited
-                    if material_deposited["sameAs"]:
-                        material_deposited = f"{material_deposited["value"]} [CID:{", ".join([cid.split("/")[-1] for cid in material_deposited["sameAs"]])}]"
-                    else:
-                        material_deposited = material_deposited["value"]
-
-                comparison_results["material_deposited"]["reference"].append(material_deposited_atmoiclimits)
-                comparison_results["material_deposited"]["predicted"].append(material_deposited)
-
-                # Extract precursor
-                precursor_atmoiclimits = atomiclimits_annotation[0] if len(atomiclimits_annotation) > 1 else ""
-
-                # Append CID if available
-                if evaluate_with_normalization and precursor_atmoiclimits in cid_mapping:
-                    precursor_atmoiclimits = f"{precursor_atmoiclimits} [CID:{cid_mapping[precursor_atmoiclimits]}]"
-
-                precursor = process.get("reactantSelection", {}).get("precursor", [])
-
-                # Iterate over precursor list
-                for prec in precursor:
-                    prec_cid = prec.get("precursor", "")
-                    
-                    if evaluate_with_normalization:
-                        if prec.get("precursor", {}).get("sameAs", []):
-                            prec_cid = f"{prec.get("precursor", {}).get("value", "")} [CID:{", ".join([cid.split("/")[-1] for cid in prec.get("precursor", {}).get("sameAs", [])])}]"
-                        else:
-                            prec_cid = prec.get("precursor", {}).get("value", "")
-
-                    if precursor_atmoiclimits and prec_cid:
-                        comparison_results["precursor"]["reference"].append(precursor_atmoiclimits)
-                        comparison_results["precursor"]["predicted"].append(prec_cid)
-
-                # Extract coreactant1
-                coreactant1_atmoiclimits = atomiclimits_annotation[1] if len(atomiclimits_annotation) >= 2 else ""
-
-                # Append CID if available
-                if evaluate_with_normalization and coreactant1_atmoiclimits in cid_mapping:
-                    coreactant1_atmoiclimits = f"{coreactant1_atmoiclimits} [CID:{cid_mapping[coreactant1_atmoiclimits]}]"
+        logger.debug("Formatted AtomicLimits Annotation: %s", atomiclimits_annotation)
+
+        logger.info(f"Processing file: {entry.name}")
+
+        # Read the JSON file
+        json_data = read_json_file(entry.path)
+        json_data = json_data.get(args.key, json_data) if args.key else json_data
+        logger.debug("Processing file: %s with %s entries.", entry.path, len(json_data))
+
+        # Format the AtomicLimits references once per file, as all its process entries share the same annotation
+        material_deposited_reference = format_reference("IGZO", cid_mapping, evaluate_with_normalization) # Since we are in IGZO directory
+        precursor_reference = format_reference(atomiclimits_annotation[0] if len(atomiclimits_annotation) > 1 else "", cid_mapping, evaluate_with_normalization)
+        coreactant_references = [
+            format_reference(atomiclimits_annotation[position] if len(atomiclimits_annotation) > position else "", cid_mapping, evaluate_with_normalization)
+            for position in range(1, len(coreactant_fields) + 1)
+        ]
+
+        # Iterate over each process entry in the JSON data
+        for index, process in enumerate(json_data):
+            logger.debug("Processing entry: %s", index + 1)
+            reactant_selection = process.get("reactantSelection", {})
+
+            # Compare material deposited
+            material_deposited = format_prediction(process.get("aldSystem", {}).get("materialDeposited"), evaluate_with_normalization)
+            record_comparison(comparison_results, row_writer, entry.path, "material_deposited", material_deposited_reference, material_deposited)
+
+            # Compare each extracted precursor
+            if precursor_reference:
+                for prec in reactant_selection.get("precursor", []):
+                    precursor = format_prediction(prec.get("precursor"), evaluate_with_normalization)
+                    if precursor: record_comparison(comparison_results, row_writer, entry.path, "precursor", precursor_reference, precursor)
+
+            # Compare the coreactants by their position
+            coreactants = reactant_selection.get("coReactant", [])
+            for position, (field, coreactant_reference) in enumerate(zip(coreactant_fields, coreactant_references)):
+                coreactant = format_prediction(coreactants[position].get("coReactant") if position < len(coreactants) else None, evaluate_with_normalization)
+                record_comparison(comparison_results, row_writer, entry.path, field, coreactant_reference, coreactant)
+
+    # Close the Parquet file and export the compared value pairs to Excel
+    row_writer.close()
+    comparison_rows = pd.read_parquet(comparison_rows_path)
+    comparison_rows.to_excel(output_path, index=False)
+    logger.info(f"Compared value pairs saved to: {comparison_rows_path} and {output_path}")
+
+    # Calculate the chunk Cosine Similarities of all fields in one batched pass, then slice them per field
+    if evaluate_with_similarity_metrics:
+
+        # Load the value pairs of each field back from the Parquet file, keeping their original order
+        for field, rows in comparison_rows.groupby("field", sort=False):
+            comparison_results[field]["reference"] = rows["reference"].tolist()
+            comparison_results[field]["predicted"] = rows["predicted"].tolist()
+
+        # Load the SciBERT embedding model once for all fields, in half precision when a GPU is available
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        embedding_model = SentenceTransformer("allenai/scibert_scivocab_uncased", device=device, model_kwargs={"torch_dtype": torch.float16} if device == "cuda" else None)
+        embedding_model.eval()
+        logger.info(f"Loaded SciBERT embedding model on device: {device}")
+
+        all_references = [ref for data in comparison_results.values() for ref in data["reference"]]
+        all_predictions = [pred for data in comparison_results.values() for pred in data["predicted"]]
+        all_cosine_scores = pairwise_cosine_similarities(all_references, all_predictions, embedding_model, max_length=512)
+        field_cosine_scores, offset = {}, 0
+        for field, data in comparison_results.items():
+            field_cosine_scores[field] = [score for pair_scores in all_cosine_scores[offset:offset + data["total"]] for score in pair_scores]
+            offset += data["total"]
 
-                coreactant1 = process.get("reactantSelection", {}).get("coReactant", [])
-                
-                coreactant1 = "" if not coreactant1 else coreactant1[0].get("coReactant", "")
-                if evaluate_with_normalization and coreactant1_atmoiclimits and coreactant1:
-
-                    # Format the predicted coreactant1
-                    if coreactant1["sameAs"]:
-                        coreactant1 = f"{coreactant1["value"]} [CID:{', '.join([cid.split('/')[-1] for cid in coreactant1["sameAs"]])}]"
-                    else:
-                        coreactant1 = coreactant1["value"]
-
-                comparison_results["coreactant1"]["reference"].append(coreactant1_atmoiclimits)
-                comparison_results["coreactant1"]["predicted"].append(coreactant1)
-
-                # Extract coreactant2
-                coreactant2_atmoiclimits = atomiclimits_annotation[2] if len(atomiclimits_annotation) >= 3 else ""
-
-                # Append CID if available
-                if evaluate_with_normalization and coreactant2_atmoiclimits in cid_mapping:
-                    coreactant2_atmoiclimits = f"{coreactant2_atmoiclimits} [CID:{cid_mapping[coreactant2_atmoiclimits]}]"
-
-                coreactant2 = process.get("reactantSelection", {}).get("coReactant", [])
-                coreactant2 = "" if not coreactant2 or len(coreactant2) < 2 else coreactant2[1].get("coReactant", "")
-                if evaluate_with_normalization and coreactant2_atmoiclimits and coreactant2:
-
-                    # Format the predicted coreactant2
-                    if coreactant2["sameAs"]:
-                        coreactant2 = f"{coreactant2["value"]} [CID:{', '.join([cid.split('/')[-1] for cid in coreactant2["sameAs"]])}]"
-                    else:
-                        coreactant2 = coreactant2["value"]
-
-                comparison_results["coreactant2"]["reference"].append(coreactant2_atmoiclimits)
-                comparison_results["coreactant2"]["predicted"].append(coreactant2)
+    # Compute evaluation metrics for each field
+    for field, data in comparison_results.items():
 
-                # Extract coreactant3
-                coreactant3_atmoiclimits = atomiclimits_annotation[3] if len(atomiclimits_annotation) >= 4 else ""
+        # Skip if no data
+        if not data["total"]: continue
 
-                # Append CID if available
-                if evaluate_with_normalization and coreactant3_atmoiclimits in cid_mapping:
-                    coreactant3_atmoiclimits = f"{coreactant3_atmoiclimits} [CID:{cid_mapping[coreactant3_atmoiclimits]}]"
-
-                coreactant3 = process.get("reactantSelection", {}).get("coReactant", [])
-                coreactant3 = "" if not coreactant3 or len(coreactant3) < 3 else coreactant3[2].get("coReactant", "")
-                if evaluate_with_normalization and coreactant3_atmoiclimits and coreactant3:
+        # Calculate exact match accuracy from the streaming counters
+        accuracy = data["exact"] / data["total"]
+        print(f"Exact Match Accuracy for {field}: {accuracy:.4%}")
 
-                    # Format the predicted coreactant3
-                    if coreactant3["sameAs"]:   
-                        coreactant3 = f"{coreactant3["value"]} [CID:{', '.join([cid.split('/')[-1] for cid in coreactant3["sameAs"]])}]"
-                    else:
-                        coreactant3 = coreactant3["value"]
-
-                comparison_results["coreactant3"]["reference"].append(coreactant3_atmoiclimits)
-                comparison_results["coreactant3"]["predicted"].append(coreactant3)
+        # Skip the similarity metrics if disabled
+        if not evaluate_with_similarity_metrics: continue
 
-    # Compute evaluation metrics for each field
-    for field, data in comparison_results.items():
-        
         # Extract references and predictions
         references = data["reference"]
         predictions = data["predicted"]
 
-        # Skip if no data
-        if not references or not predictions: continue
-
-        # Calculate exact match accuracy
-        exact_matches = sum(1 for ref, pred in zip(references, predictions) if ref == pred)
-        accuracy = exact_matches / len(references)
-        print(f"Exact Match Accuracy for {field}: {accuracy:.4%}")
+        # Calculate the Fuzzy Match score
+        fuzzy_results = fuzzy_match_score(references, predictions)
+        print(f"Fuzzy Match score for {field}: {fuzzy_results:.4%}")
 
         # Calculate the Cosine Similarity score
-        cosine_results = cosine_similarity_score(references, predictions, embedding_model="allenai/scibert_scivocab_uncased", max_length=512)
+        cosine_scores = field_cosine_scores[field]
+        cosine_results = sum(cosine_scores) / len(cosine_scores) if cosine_scores else 0.0
         print(f"Cosine Similarity scores for {field}: {cosine_results}")
 
         # Calculate BERT score
-        bert_results = bert_score(references, predictions, embedding_model="allenai/scibert_scivocab_uncased", embedding_model_revision="24f92d32b1bfb0bcaf9ab193ff3ad01e87732fc1")
+        bert_results = bert_score(references, predictions, embedding_model="allenai/scibert_scivocab_uncased", embedding_model_revision="24f92d32b1bfb0bcaf9ab193ff3ad01e87732fc1", device=device)
         print(f"BERT scores for {field}: {bert_results}")
 
         # Calculate the recall, precision and F1-score on CIDs
-        cid_references = []
-        cid_predictions = []
-
-        for ref, pred in zip(references, predictions):
-            # Check which has highest number of CIDs
-            ref_cids = set([cid.strip() for cid in ref.split("[CID:")[-1].rstrip("]").split(",")]) if "[CID:" in ref else set([""])
-            pred_cids = set([cid.strip() for cid in pred.split("[CID:")[-1].rstrip("]").split(",")]) if "[CID:" in pred else set([""])
-            highest_cid_count = max(len(ref_cids), len(pred_cids))
-
-            # Append to list with duplicates for multiple CIDs
-            cid_references.extend(list(ref_cids) * highest_cid_count if len(ref_cids) < len(pred_cids) else list(ref_cids))
-            cid_predictions.extend(list(pred_cids) * highest_cid_count if len(pred_cids) < len(ref_cids) else list(pred_cids))
-        
-        precision = precision_score(cid_references, cid_predictions, average='weighted', zero_division=0)
-        recall = recall_score(cid_references, cid_predictions, average='weighted', zero_division=0)
-        f1 = f1_score(cid_references, cid_predictions, average='weighted', zero_division=0)
+        cid_references, cid_predictions = align_cid_labels(references, predictions)
+
+        precision, recall, f1, _ = precision_recall_fscore_support(cid_references, cid_predictions, average='weighted', zero_division=0)
 
         print(f"Precision for {field}: {precision:.4%}, Recall: {recall:.4%}, F1-score: {f1:.4%}")
\ No newline at end of file
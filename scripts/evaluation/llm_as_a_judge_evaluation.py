@@ -3,14 +3,21 @@ Script to evaluate extracted structured knowledge using the LLM-as-a-Judge parad
 """
 # Python packages
 import os
+import sys
+import hashlib
+import asyncio
 import argparse
+from pathlib import Path
+from functools import lru_cache
 
 # External packages
+import orjson
 from pydantic import BaseModel
 
 # SciKG-Extract Utility Imports
 from scikg_extract.utils.log_handler import LogHandler
-from scikg_extract.utils.file_utils import read_json_file, read_text_file, save_json_file
+from scikg_extract.utils.rate_limiter import AsyncRateLimiter
+from scikg_extract.utils.file_utils import iter_files, list_filenames, read_json_file, read_text_file, save_json_file
 
 # SciKG-Extract Agent Imports
 from scikg_extract.agents.states import ExtractionState
@@ -18,22 +25,180 @@ from scikg_extract.agents.reflection_agent import validate_extracted_processes
 
 # SciKG-Extract Config Imports
 from scikg_extract.config.process.processConfig import ProcessConfig
-from scikg_extract.config.agents.reflection import ReflectionConfig
+from scikg_extract.config.llm.envConfig import EnvConfig
+
+# SciKG-Extract Service Imports
+from scikg_extract.services.openai_batch_judge import OpenAIBatchJudge
 
 # SciKG-Extract Evaluation Rubric Imports
 from scikg_extract.evaluation.rubrics.informativeness import Correctness
 from scikg_extract.evaluation.rubrics.informativeness import Completeness
 
+def path_after_anchor(path: str, anchor: str) -> Path:
+    """
+    Returns the part of a path following its last directory named `anchor`.
+    Args:
+        path (str): The path to split.
+        anchor (str): The name of the anchor directory (e.g., "extracted-data").
+    Returns:
+        Path: The relative path following the anchor directory.
+    Raises:
+        ValueError: If the path does not contain the anchor directory.
+    """
+    parts = Path(path).parts
+    if anchor not in parts: raise ValueError(f"Path '{path}' does not contain the directory '{anchor}'.")
+    return Path(*parts[len(parts) - parts[::-1].index(anchor):])
+
+# Results directories are listed once, the evaluation results saved during this run are never re-checked
+existing_results = lru_cache(maxsize=None)(list_filenames)
+
+@lru_cache(maxsize=256)
+def read_scientific_document(scientific_document_filepath: str) -> str:
+    """
+    Reads a scientific document in markdown format, reading each document from disk only once when several extracted data files (e.g., of different LLMs) share it.
+    Args:
+        scientific_document_filepath (str): Path to the scientific document.
+    Returns:
+        str: The content of the scientific document.
+    """
+    return read_text_file(scientific_document_filepath)
+
+def build_initial_state(json_filepath: str, scientific_document_filepath: str, base_state_kwargs: dict) -> ExtractionState:
+    """
+    Loads an extracted data file with its scientific document and builds the initial evaluation state.
+    Args:
+        json_filepath (str): Path to the extracted structured knowledge JSON file.
+        scientific_document_filepath (str): Path to the corresponding scientific document in markdown format.
+        base_state_kwargs (dict): The state fields shared by all evaluations, validated once per run.
+    Returns:
+        ExtractionState: The initial state for the evaluation.
+    Raises:
+        ValueError: If the extracted data or the scientific document cannot be read.
+    """
+    # Initialize the logger
+    logger = LogHandler.get_logger("scikg_extract")
+
+    # Read the extracted structured knowledge JSON file
+    extracted_data = read_json_file(json_filepath)
+    if not isinstance(extracted_data, dict): raise ValueError(f"Failed to read extracted data file: {json_filepath}")
+    logger.info(f"Extracted data loaded successfully: {json_filepath}")
+
+    # Read the scientific document in markdown format
+    scientific_document = read_scientific_document(scientific_document_filepath)
+    if scientific_document is None: raise ValueError(f"Failed to read scientific document: {scientific_document_filepath}")
+    logger.info(f"Scientific document loaded successfully: {scientific_document_filepath}")
+
+    # Define the initial state for evaluation, skipping the revalidation of the shared fields
+    return ExtractionState.model_construct(**base_state_kwargs, scientific_document=scientific_document, extracted_json=extracted_data)
+
+def judge_cache_key(state: ExtractionState) -> str:
+    """
+    Builds the content-addressed key of an evaluation from everything that determines the judge verdicts, so identical inputs evaluated under another results directory reuse the earlier verdicts.
+    Args:
+        state (ExtractionState): The initial evaluation state.
+    Returns:
+        str: The SHA-256 hex digest of the extracted data, scientific document, process schema, process description, judge LLM and rubrics.
+    """
+    # Canonical serialization with sorted keys, straight to UTF-8 bytes
+    content = orjson.dumps([
+        state.extracted_json,
+        state.scientific_document,
+        state.process_schema,
+        state.process_description,
+        state.reflection_llm,
+        [rubric.get_rubric_name() for rubric in state.rubric_names]
+    ], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.sha256(content).hexdigest()
+
+def estimate_judge_tokens(state: ExtractionState) -> int:
+    """
+    Estimates the prompt tokens an evaluation sends to the judge, at roughly 4 characters per token.
+    Args:
+        state (ExtractionState): The initial evaluation state.
+    Returns:
+        int: The estimated prompt tokens over all rubric requests.
+    """
+    characters = len(state.scientific_document) + len(str(state.extracted_json)) + len(str(state.process_schema)) + len(state.process_description)
+    return characters // 4 * len(state.rubric_names)
+
+async def evaluate_extracted_files(jobs: list[tuple[str, str, str, str]], base_state_kwargs: dict, concurrency: int, cache_dir: str | None = None, rate_limiter: AsyncRateLimiter | None = None) -> None:
+    """
+    Evaluates the extracted data files concurrently using the LLM-as-a-Judge paradigm and saves the evaluation results. Each file is loaded and evaluated in a worker thread, with at most `concurrency` evaluations in flight to overlap the LLM request latency. Files with identical evaluation inputs share a single judge call.
+    Args:
+        jobs (list[tuple[str, str, str, str]]): The extracted data filepath, scientific document filepath, results directory and evaluation filename of each file.
+        base_state_kwargs (dict): The state fields shared by all evaluations.
+        concurrency (int): Maximum number of evaluations running concurrently.
+        cache_dir (str | None, optional): Directory of the content-addressed judge cache. Disabled if None. Defaults to None.
+        rate_limiter (AsyncRateLimiter | None, optional): Rate limiter keeping the judge requests under the provider limits. Disabled if None. Defaults to None.
+    """
+    # Initialize the logger
+    logger = LogHandler.get_logger("scikg_extract")
+
+    # Bound the number of evaluations in flight
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Judge verdicts of the distinct evaluation inputs of this run, keyed by their content
+    verdicts: dict[str, asyncio.Future] = {}
+
+    async def evaluate_file(json_filepath: str, scientific_document_filepath: str, res_dir: str, evaluation_filename: str) -> None:
+
+        async with semaphore:
+            # Load the inputs
+            initial_state = await asyncio.to_thread(build_initial_state, json_filepath, scientific_document_filepath, base_state_kwargs)
+
+            # Judge each distinct input once, the first file with an input evaluates it for all identical files
+            cache_key = judge_cache_key(initial_state)
+            verdict = verdicts.get(cache_key)
+            if verdict is None:
+                verdict = verdicts[cache_key] = asyncio.get_running_loop().create_future()
+                try:
+                    # Look up the verdicts of an identical evaluation of an earlier run
+                    evaluation_results = read_json_file(f"{cache_dir}/{cache_key[:2]}/{cache_key}.json") if cache_dir else None
+                    if evaluation_results is not None:
+                        logger.info(f"Evaluation reused from the judge cache for file: {json_filepath}")
+
+                    # Execute the validation agent to evaluate the extracted processes
+                    else:
+                        if rate_limiter: await rate_limiter.acquire(requests=len(initial_state.rubric_names), tokens=estimate_judge_tokens(initial_state))
+                        final_state = await asyncio.to_thread(validate_extracted_processes, initial_state)
+                        evaluation_results = final_state["evaluation_results"]
+                        if cache_dir and evaluation_results: save_json_file(f"{cache_dir}/{cache_key[:2]}", f"{cache_key}.json", evaluation_results, indent=None)
+                    verdict.set_result(evaluation_results)
+                except Exception as e:
+                    verdict.set_exception(e)
+                    raise
+
+        # Wait for the verdict outside the semaphore if another file is evaluating the identical input
+        if not verdict.done(): logger.info(f"Evaluation input of file: {json_filepath} is identical to an earlier file. Reusing its verdict.")
+        evaluation_results = await verdict
+        logger.info(f"Evaluation completed using LLM-as-a-Judge paradigm for file: {json_filepath}")
+
+        # Save the evaluation results
+        file_saved = save_json_file(res_dir, evaluation_filename, evaluation_results)
+        if not file_saved: raise Exception(f"Failed to save evaluation results for file: {json_filepath}")
+        logger.info(f"Evaluation results saved to: {res_dir}/{evaluation_filename}")
+
+    await asyncio.gather(*(evaluate_file(*job) for job in jobs))
+
 if __name__ == "__main__":
     """Main function to evaluate extracted structured knowledge using LLM-as-a-Judge paradigm."""
 
     # Argument Parser Setup
     parser = argparse.ArgumentParser(description="Evaluate extracted structured knowledge using LLM-as-a-Judge paradigm.")
-    parser.add_argument("--llm_model", type=str, required=False, help="The large language model to be used as a Judge in the evaluation.")
-    parser.add_argument("--extracted_data_path", type=str, required=False, help="Path to the extracted structured knowledge JSON files.")
-    parser.add_argument("--scientific_document_path", type=str, required=False, help="Path to the scientific documents in the markdown format.")
-    parser.add_argument("--results_dir", type=str, required=False, help="Directory to save the evaluation results.")
-    parser.add_argument("--process_schema_path", type=str, required=False, help="Path to the process schema JSON file.")
+    parser.add_argument("--llm_model", type=str, default="gpt-5", help="The large language model to be used as a Judge in the evaluation.")
+    parser.add_argument("--extracted_data_path", type=str, default="results/extracted-data/ALD/version2/ZnO-IGZO-papers/experimental-usecase/IGZO/AtomicLimits Database", help="Path to the extracted structured knowledge JSON files.")
+    parser.add_argument("--scientific_document_path", type=str, default="data/research-papers/ALD/markdown", help="Path to the scientific documents in the markdown format.")
+    parser.add_argument("--results_dir", type=str, default="results/evaluation1", help="Directory to save the evaluation results.")
+    parser.add_argument("--process_schema_path", type=str, default="data/schemas/ALD-experimental/ALD-experimental-schema.json", help="Path to the process schema JSON file.")
+    parser.add_argument("--documents_anchor", type=str, default="version2", help="Directory of --extracted_data_path after which the directory structure mirrors the scientific document path (plus one LLM directory).")
+    parser.add_argument("--results_anchor", type=str, default="extracted-data", help="Directory of --extracted_data_path after which the directory structure is mirrored in the results directory.")
+    parser.add_argument("--concurrency", type=int, default=EnvConfig.JUDGE_max_concurrency, help="Number of extracted data files to evaluate concurrently. Defaults to the JUDGE_MAX_CONCURRENCY environment variable.")
+    parser.add_argument("--rpm", type=float, default=None, help="Maximum judge requests per minute. Defaults to unlimited.")
+    parser.add_argument("--tpm", type=float, default=None, help="Maximum estimated judge prompt tokens per minute. Defaults to unlimited.")
+    parser.add_argument("--judge_cache_dir", type=str, default="results/.judge_cache", help="Directory of the content-addressed cache of judge verdicts shared across results directories.")
+    parser.add_argument("--no_cache", action="store_true", help="Bypass the judge cache and always query the LLM judge.")
+    parser.add_argument("--batch_mode", type=str, default="online", choices=["online", "openai_batch"], help="Evaluate with real-time LLM calls or submit the evaluations to the OpenAI Batch API.")
+    parser.add_argument("--poll", action="store_true", help="Collect the results of previously submitted OpenAI batches instead of starting new evaluations.")
 
     # Parse the arguments
     args = parser.parse_args()
@@ -43,26 +208,39 @@ if __name__ == "__main__":
     logger.info("Starting LLM-as-a-Judge evaluation script...")
 
     # Extracted Information path
-    extracted_data_path = args.extracted_data_path if args.extracted_data_path else "results/extracted-data/ALD/version2/ZnO-IGZO-papers/experimental-usecase/IGZO/AtomicLimits Database"
+    extracted_data_path = args.extracted_data_path
     logger.info(f"Extracted data path: {extracted_data_path}")
 
     # Scientific document path
-    scientific_document_path = args.scientific_document_path if args.scientific_document_path else "data/research-papers/ALD/markdown"
+    scientific_document_path = args.scientific_document_path
     logger.info(f"Scientific document path: {scientific_document_path}")
 
     # Read the process schema
-    process_schema_path = args.process_schema_path if args.process_schema_path else "data/schemas/ALD-experimental/ALD-experimental-schema.json"
+    process_schema_path = args.process_schema_path
     process_schema = read_json_file(process_schema_path)
     logger.info(f"Process schema loaded from: {process_schema_path}")
 
     # Results directory
-    results_dir = args.results_dir if args.results_dir else "results/evaluation1"
+    results_dir = args.results_dir
     logger.info(f"Results directory for evaluation: {results_dir}")
 
     # LLM model to use for evaluation
-    llm_model = args.llm_model if args.llm_model else "gpt-5"
+    llm_model = args.llm_model
     logger.info(f"Using LLM model for evaluation: {llm_model}")
 
+    # Collect the results of the completed OpenAI batches
+    if args.poll:
+        batch_judge = OpenAIBatchJudge(llm_model, results_dir)
+        for (res_dir, evaluation_filename), evaluation_results in batch_judge.poll().values():
+            file_saved = save_json_file(res_dir, evaluation_filename, evaluation_results)
+            if not file_saved: raise Exception(f"Failed to save evaluation results to: {res_dir}/{evaluation_filename}")
+            logger.info(f"Evaluation results saved to: {res_dir}/{evaluation_filename}")
+        sys.exit(0)
+
+    # Check once that the anchors are directories of the extracted data path, so every extracted data directory below it can be mirrored
+    for anchor_flag, anchor in (("--documents_anchor", args.documents_anchor), ("--results_anchor", args.results_anchor)):
+        if anchor not in Path(extracted_data_path).parts: parser.error(f"{anchor_flag} '{anchor}' is not a directory of --extracted_data_path '{extracted_data_path}'. Pass the name of one of its directories.")
+
     # Update ProcessConfig with the process details
     ProcessConfig.Process_description = """
     Atomic layer deposition (ALD) is a surface-controlled thin film deposition technique that can enable ultimate control over the film thickness, uniformity on large-area substrates and conformality on 3D (nano)structures. Each ALD cycle consists at least two half-cycles (but can be more complex), containing a precursor dose step and a co-reactant exposure step, separated by purge or pump steps. Ideally the same amount of material is deposited in each cycle, due to the self-limiting nature of the reactions of the precursor and co-reactant with the surface groups on the substrate. By carrying out a certain number of ALD cycles, the targeted film thickness can be obtained.
@@ -72,79 +250,68 @@ if __name__ == "__main__":
     Different precursors are used for each element. For example, diethylzinc (DEZ) and trimethylgallium (TMGa) are common for zinc and gallium, respectively, while a precursor like 3-(dimethylamino)propyl)dimethylindium (DADI) is used for indium. The goal of an IGZO ALD process is to produce a conformal, composition-controlled, amorphous IGZO film suitable for applications such as thin-film transistors (TFTs).
     """
 
-    # Iterate over each extracted data file for evaluation
-    for root, _, files in os.walk(extracted_data_path):
+    # Validate the state fields shared by all evaluations once, leaving the defaults to be created per evaluation state
+    base_state = ExtractionState(
+        extraction_llm="",
+        process_name=ProcessConfig.Process_name,
+        process_description=ProcessConfig.Process_description,
+        process_property_constraints=ProcessConfig.Process_property_constraints,
+        scientific_document="",
+        process_schema=process_schema,
+        process_instances_key="processes",
+        examples="",
+        data_model=BaseModel,
+        reflection_llm=llm_model,
+        rubric_names=[Correctness, Completeness]
+    )
+    base_state_kwargs = {field: getattr(base_state, field) for field in base_state.model_fields_set - {"scientific_document"}}
+
+    # Prepare the evaluation of each extracted data JSON file
+    jobs: list[tuple[str, str, str, str]] = []
+    directory_paths: dict[str, tuple[str, str]] = {}
+    for entry in iter_files(extracted_data_path, (".json",)):
+        root, file, json_filepath = os.path.dirname(entry.path), entry.name, entry.path
+        logger.info(f"Preparing evaluation of extracted data file: {json_filepath}")
 
-        # Skip if no files found
-        if not files: continue
+        # Format the scientific document and results directory paths once per extracted data directory
+        if root not in directory_paths:
 
-        # Check if all files are JSON files
-        json_files = all(file.endswith(".json") for file in files)
-        if not json_files:
-            logger.warning(f"Non-JSON files found in directory: {root}. Skipping this directory.")
+            # Mirror the directories following the anchors into the scientific document and results directories
+            scientific_doc_dir = str(Path(scientific_document_path) / path_after_anchor(root, args.documents_anchor).parent)
+            res_dir = str(Path(results_dir) / path_after_anchor(root, args.results_anchor) / llm_model)
+            directory_paths[root] = (scientific_doc_dir, res_dir)
+        scientific_doc_dir, res_dir = directory_paths[root]
+
+        # Format the evaluation filename for the current JSON file
+        evaluation_filename = f"{os.path.splitext(file)[0]}_evaluation.json"
+
+        # Check if evaluation result already exists
+        if evaluation_filename in existing_results(res_dir):
+            logger.info(f"Evaluation result already exists for file: {json_filepath}. Skipping evaluation.")
             continue
 
-        # Format and Check scientific document path
-        scientific_doc_dir = f"{scientific_document_path}{root.split("version2")[-1]}"
-        scientific_doc_dir = scientific_doc_dir.replace("\\", "/").strip()
-        scientific_doc_dir = "/".join(scientific_doc_dir.split("/")[:-1])
-
-        # Process each JSON file in the directory
-        for file in files:
-            json_filepath = f"{root}/{file}"
-            logger.info(f"Evaluating extracted data file: {json_filepath}")
-
-            # Format the results directory path for the current document and JSON filename
-            res_dir = f"{results_dir}{root.split("extracted-data")[-1]}/{llm_model}".replace("\\", "/").strip()
-            evaluation_filename = f"{os.path.splitext(file)[0]}_evaluation.json"
-
-            # Check if evaluation result already exists
-            if os.path.exists(f"{res_dir}/{evaluation_filename}"):
-                logger.info(f"Evaluation result already exists for file: {json_filepath}. Skipping evaluation.")
-                continue
-
-            # Read the extracted structured knowledge JSON file
-            extracted_data = read_json_file(json_filepath)
-            logger.info("Extracted data loaded successfully.")
-
-            # Derive the corresponding scientific document filepath
-            scientific_document_filename = f"{os.path.splitext(file)[0]}.md"
-            scientific_document_filepath = f"{scientific_doc_dir}/{scientific_document_filename}"
-
-            # Read the scientific document in markdown format
-            scientific_document = read_text_file(scientific_document_filepath)
-            logger.info(f"Scientific document loaded successfully: {scientific_document_filepath}")
-
-            # Define the initial state for evaluation
-            initial_state = ExtractionState(
-                extraction_llm="",
-                process_name=ProcessConfig.Process_name,
-                process_description=ProcessConfig.Process_description,
-                process_property_constraints=ProcessConfig.Process_property_constraints,
-                scientific_document=scientific_document,
-                process_schema=process_schema,
-                process_instances_key="processes",
-                extracted_json=extracted_data,
-                examples="",
-                data_model=BaseModel,
-                reflection_llm=llm_model,
-                rubric_names=[Correctness, Completeness]
-            )
-            logger.info("Initial evaluation state defined successfully.")
-
-            # Initialize the Reflection configuration
-            reflection_config = ReflectionConfig(
-                reflection_mode="single",
-                reflection_llm=llm_model,
-                rubric_names=[Correctness, Completeness]
-            )
-            logger.info("Reflection configuration initialized successfully.")
-
-            # Execute the validation agent to evaluate the extracted processes
-            final_state = validate_extracted_processes(initial_state)
-            logger.info(f"Evaluation completed using LLM-as-a-Judge paradigm for file: {json_filepath}")
-
-            # Save the evaluation results
-            file_saved = save_json_file(res_dir, evaluation_filename, final_state["evaluation_results"])
-            if not file_saved: raise Exception(f"Failed to save evaluation results for file: {json_filepath}")
-            logger.info(f"Evaluation results saved to: {res_dir}/{evaluation_filename}")
\ No newline at end of file
+        # Derive the corresponding scientific document filepath
+        scientific_document_filename = f"{os.path.splitext(file)[0]}.md"
+        scientific_document_filepath = f"{scientific_doc_dir}/{scientific_document_filename}"
+        jobs.append((json_filepath, scientific_document_filepath, res_dir, evaluation_filename))
+
+    # Submit the evaluations to the OpenAI Batch API, skipping files already part of a pending batch
+    if args.batch_mode == "openai_batch":
+        batch_judge = OpenAIBatchJudge(llm_model, results_dir)
+        pending_custom_ids = batch_judge.pending_custom_ids()
+        requests, batch_jobs = [], {}
+        for json_filepath, scientific_document_filepath, res_dir, evaluation_filename in jobs:
+            custom_id = OpenAIBatchJudge.build_custom_id(json_filepath)
+            if custom_id in pending_custom_ids: continue
+            initial_state = build_initial_state(json_filepath, scientific_document_filepath, base_state_kwargs)
+            requests.extend(batch_judge.build_requests(custom_id, initial_state))
+            batch_jobs[custom_id] = [res_dir, evaluation_filename]
+        if batch_jobs:
+            batch_id = batch_judge.submit(requests, batch_jobs)
+            logger.info(f"Submitted {len(batch_jobs)} extracted data files in batch {batch_id}. Rerun with --poll to collect the results.")
+        sys.exit(0)
+
+    # Evaluate the extracted data files concurrently
+    logger.info(f"Evaluating {len(jobs)} extracted data files with concurrency: {args.concurrency}")
+    rate_limiter = AsyncRateLimiter(args.rpm, args.tpm) if args.rpm or args.tpm else None
+    asyncio.run(evaluate_extracted_files(jobs, base_state_kwargs, args.concurrency, None if args.no_cache else args.judge_cache_dir, rate_limiter))
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+JSON schema compilation script to generate an ahead-of-time compiled validator module for a static process schema. The generated module is written next to the schema and is picked up by the JSON validator script instead of compiling the schema on every run.
+"""
+# Python imports
+import os
+import sys
+import json
+import hashlib
+import argparse
+
+# External imports
+import fastjsonschema
+
+# Scikg_Extract Utility Imports
+from scikg_extract.utils.log_handler import LogHandler
+from scikg_extract.utils.file_utils import read_json_file
+
+# Name of the compiled validator module generated next to the schema
+COMPILED_VALIDATOR_FILE = "_compiled_validator.py"
+
+def schema_digest(schema: dict) -> str:
+    """
+    Computes the digest identifying a JSON schema, used to detect compiled validators generated from an outdated schema.
+    Args:
+        schema (dict): The JSON schema.
+    Returns:
+        str: The SHA-256 hex digest of the schema serialized with sorted keys.
+    """
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
+
+def compile_schema(schema: dict) -> str:
+    """
+    Generates the Python source of a specialized validator for a JSON schema.
+    Args:
+        schema (dict): The JSON schema to compile.
+    Returns:
+        str: The source of a module defining validate(data) and the SCHEMA_DIGEST of the compiled schema.
+    Raises:
+        fastjsonschema.JsonSchemaDefinitionException: If the schema cannot be compiled.
+    """
+    code = fastjsonschema.compile_to_code(schema, use_default=False)
+    return f'SCHEMA_DIGEST = "{schema_digest(schema)}"\n{code}'
+
+if __name__ == "__main__":
+    """Main function to compile a JSON schema into a validator module."""
+
+    # Add argument parser
+    parser = argparse.ArgumentParser(description="Compile a JSON schema into a validator module.")
+    parser.add_argument("--schema", type=str, default="data/schemas/ALD-experimental/ALD-experimental-schema.json", help="Path to the JSON schema file.")
+    parser.add_argument("--output", type=str, required=False, help=f"Path of the generated validator module. Defaults to {COMPILED_VALIDATOR_FILE} next to the schema.")
+
+    # Parse the arguments
+    args = parser.parse_args()
+
+    # Configure and Initialize the logger
+    logger = LogHandler.setup_module_logging("compile_schema")
+    logger.info(f"Using schema file: {args.schema}")
+
+    # Read the JSON schema
+    schema = read_json_file(args.schema)
+    if not schema:
+        logger.error(f"Failed to read schema file: {args.schema}")
+        sys.exit(1)
+
+    # Compile the schema
+    try:
+        source = compile_schema(schema)
+    except fastjsonschema.JsonSchemaDefinitionException as e:
+        logger.error(f"Schema cannot be compiled: {e}")
+        sys.exit(1)
+
+    # Save the validator module
+    output_path = args.output if args.output else os.path.join(os.path.dirname(args.schema), COMPILED_VALIDATOR_FILE)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(source)
+    logger.info(f"Compiled validator saved to: {output_path}")
+    sys.exit(0)
@@ -1,28 +1,66 @@
 """
-JSON cleaning script to remove all null, Not Found, and empty values from JSON files.
+JSON cleaning script to remove all null, Not Found, and empty values from JSON files. The input can be a single JSON file or a directory, whose JSON files are cleaned in parallel worker processes.
 """
 # Python imports
 import os
+import logging
 import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 
 # Scikg_Extract Utility Imports
 from scikg_extract.utils.log_handler import LogHandler
-from scikg_extract.utils.dict_utils import remove_null_values, remove_empty_qudt_structures
-from scikg_extract.utils.file_utils import read_json_file, save_json_file
-    
+from scikg_extract.utils.dict_utils import clean_json, remove_empty_qudt_structures
+from scikg_extract.utils.file_utils import iter_files, read_json_file, save_json_file
+
+def clean_json_file(input_file: str, output_dir: str, skip_keys: list[str] = [], passes: tuple[str, ...] = ("qudt", "nulls")) -> bool:
+    """
+    Cleans a JSON file with the selected cleaning passes and saves it with a "_cleaned" suffix.
+    Args:
+        input_file (str): Path to the input JSON file.
+        output_dir (str): Directory to save the cleaned JSON file.
+        skip_keys (list[str], optional): Keys that should not be cleaned by the "nulls" pass. Defaults to [].
+        passes (tuple[str, ...], optional): Cleaning passes to apply: "qudt" removes empty QUDT structures and "nulls" removes null, Not Found and empty values. Defaults to ("qudt", "nulls").
+    Returns:
+        bool: True if the cleaned JSON file was saved successfully, otherwise False.
+    """
+    # Initialize the logger
+    logger = LogHandler.get_logger("scikg_extract")
+
+    # Read the input JSON file
+    data = read_json_file(input_file)
+    logger.debug("JSON data loaded: %s", data)
+
+    # Clean the JSON data, applying both passes in a single traversal when both are selected
+    if "nulls" in passes:
+        cleaned_data = clean_json(data, skip_keys=skip_keys, drop_empty_qudt="qudt" in passes)
+    elif "qudt" in passes:
+        cleaned_data = remove_empty_qudt_structures(data)
+    else:
+        cleaned_data = data
+    logger.debug("Cleaned JSON data: %s", cleaned_data)
+
+    # Save the cleaned JSON data to the output directory
+    filename = f'{os.path.splitext(os.path.basename(input_file))[0]}_cleaned.json'
+    return save_json_file(output_dir, filename, cleaned_data)
+
 if __name__ == "__main__":
     """Main function to clean JSON files by removing null and empty values."""
 
     # Add argument parser
     parser = argparse.ArgumentParser(description="Clean JSON files.")
-    parser.add_argument("--input", type=str, required=False, help="Path to the input JSON file.")
-    parser.add_argument("--output", type=str, required=False, help="Path to the output cleaned JSON file.")
+    parser.add_argument("--input", type=str, required=False, help="Path to the input JSON file or a directory of JSON files.")
+    parser.add_argument("--output", type=str, required=False, help="Directory to save the cleaned JSON files. For a directory input, the input directory structure is mirrored under it.")
+    parser.add_argument("--passes", type=str, default="qudt,nulls", help="Comma-separated cleaning passes to apply: 'qudt' removes empty QUDT structures and 'nulls' removes null, Not Found and empty values.")
+    parser.add_argument("--skip_keys", type=str, default="sameAs", help="Comma-separated keys that should not be cleaned by the 'nulls' pass.")
+    parser.add_argument("--debug", action="store_true", help="Write the loaded and cleaned JSON data of each file to the log file.")
+    parser.add_argument("--max_workers", type=int, default=None, help="Number of worker processes used to clean the JSON files of a directory. Defaults to the number of CPUs.")
 
     # Parse the arguments
     args = parser.parse_args()
 
     # Configure and Initialize the logger
-    logger = LogHandler.setup_module_logging("scikg_extract")
+    logger = LogHandler.setup_module_logging("scikg_extract", file_level=logging.DEBUG if args.debug else logging.INFO)
     logger.info("Starting JSON cleaning process...")
 
     # Input file path
@@ -33,22 +71,29 @@ if __name__ == "__main__":
     output_path = args.output if args.output else "results/extracted-data-test/ALD/version2/ZnO-IGZO-papers/experimental-usecase/IGZO/AtomicLimits Database/In(PrNMe2)Me2-GaMe3-ZnEt2-O2 plasma/gpt-5-mini"
     logger.info(f"Using output file: {output_path}")
 
-    # Read the input JSON file
-    data = read_json_file(input_path)
-    logger.debug(f"JSON data loaded: {data}")
-
-    # Remove EMPTY QUDT structures
-    cleaned_data = remove_empty_qudt_structures(data)
-    logger.debug(f"JSON data after removing empty QUDT structures: {cleaned_data}")
+    # Cleaning passes to apply
+    passes = tuple(name.strip() for name in args.passes.split(",") if name.strip())
+    unknown_passes = set(passes) - {"qudt", "nulls"}
+    if unknown_passes: parser.error(f"Unknown cleaning passes: {', '.join(sorted(unknown_passes))}")
+    logger.info(f"Using cleaning passes: {passes}")
 
     # Skip keys that should not be cleaned
-    skip_keys = ["sameAs"]
+    skip_keys = [key.strip() for key in args.skip_keys.split(",") if key.strip()]
 
-    # Clean the JSON data by removing null and empty values
-    cleaned_data = remove_null_values(cleaned_data, skip_keys=skip_keys)
-    logger.debug(f"Cleaned JSON data: {cleaned_data}")
+    # Clean a single JSON file
+    if not os.path.isdir(input_path):
+        file_saved = clean_json_file(input_path, output_path, skip_keys=skip_keys, passes=passes)
+        if file_saved: logger.info("JSON cleaning process completed successfully.")
+    else:
+        # Collect the JSON files of the directory, skipping the outputs of earlier runs, with their mirrored output directories
+        input_files, output_dirs = [], []
+        for entry in iter_files(input_path, (".json",)):
+            if entry.name.endswith("_cleaned.json"): continue
+            input_files.append(entry.path)
+            output_dirs.append(os.path.join(output_path, os.path.relpath(os.path.dirname(entry.path), input_path)))
 
-    # Save the cleaned JSON data to the output file
-    filename = f'{os.path.splitext(os.path.basename(input_path))[0]}_cleaned.json'
-    file_saved = save_json_file(output_path, filename, cleaned_data)
-    if file_saved: logger.info("JSON cleaning process completed successfully.")
+        # Clean the JSON files in parallel
+        clean_file = partial(clean_json_file, skip_keys=skip_keys, passes=passes)
+        with ProcessPoolExecutor(max_workers=args.max_workers) as executor:
+            files_saved = list(executor.map(clean_file, input_files, output_dirs, chunksize=16))
+        logger.info(f"JSON cleaning process completed for {sum(files_saved)} of {len(input_files)} files.")
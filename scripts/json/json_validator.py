@@ -1,50 +1,73 @@
-import json
+import os
+import sys
+import hashlib
 import logging
 import argparse
+import importlib.util
+from itertools import batched, islice
+from typing import Callable, Iterator
 
+import ijson
+import orjson
 from jsonschema import Draft7Validator
 
 from scikg_extract.utils.log_handler import LogHandler
 from scikg_extract.utils.file_utils import read_json_file
+from scikg_extract.utils.json_utils import as_instance_validator, get_instance_validator, json_schema_validate
 
-def json_schema_validate(schema: dict) -> bool:
+from compile_schema import COMPILED_VALIDATOR_FILE, schema_digest
+
+# Module-level logger, resolved once instead of on every call. Running as a script rebinds it below to the configured "json_validator" logger
+logger = logging.getLogger(__name__)
+
+def canonical_hash(obj: dict) -> bytes:
     """
-    Validate the provided JSON schema using Draft7Validator.
+    Compute the canonical hash identifying a JSON object, used to reuse the validation result of identical instances. Only the 16-byte digest is kept, not the serialized object.
     Args:
-        schema (dict): The JSON schema to validate.
+        obj (dict): The JSON object.
     Returns:
-        bool: True if the schema is valid, False otherwise.
+        bytes: The 16-byte BLAKE2b digest of the object serialized with sorted keys.
     """
-    
-    # Initialize the logger
-    logger = LogHandler.get_logger("json_validator.json_schema_validate")
-
-    try:
-        Draft7Validator.check_schema(schema)
-        return True
-    except Exception as e:
-        logger.debug(f"Schema validation error: {e}")
-        return False
-    
-def validate_json_instance(instance: dict, schema: dict) -> bool:
+    return hashlib.blake2b(orjson.dumps(obj, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+
+def load_compiled_validator(schema_file_path: str, schema: dict) -> Callable[[dict], bool] | None:
     """
-    Validate a JSON instance against the provided JSON schema.
+    Load the ahead-of-time compiled validator generated by compile_schema.py next to the schema file.
     Args:
-        instance (dict): The JSON instance to validate.
-        schema (dict): The JSON schema to validate against.
+        schema_file_path (str): Path to the JSON schema file.
+        schema (dict): The JSON schema, used to reject validators compiled from an outdated schema.
     Returns:
-        bool: True if the instance is valid, False otherwise.
+        Callable[[dict], bool] | None: A function returning True if an instance is valid, or None if no up-to-date compiled validator exists.
     """
-    # Initialize the logger
-    logger = LogHandler.get_logger("json_validator.validate_json_instance")
-
-    try:
-        validator = Draft7Validator(schema)
-        return validator.validate(instance)
-    except Exception as e:
-        logger.debug(f"Instance validation error: {e}")
-        return False
-    
+    # Check for a compiled validator next to the schema
+    module_path = os.path.join(os.path.dirname(schema_file_path), COMPILED_VALIDATOR_FILE)
+    if not os.path.exists(module_path): return None
+
+    # Load the compiled validator module
+    spec = importlib.util.spec_from_file_location("_compiled_validator", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # Ignore validators compiled from a different version of the schema
+    if getattr(module, "SCHEMA_DIGEST", None) != schema_digest(schema):
+        logger.warning("Compiled validator is outdated, recompile it with compile_schema.py: %s", module_path)
+        return None
+    logger.info("Using compiled validator: %s", module_path)
+    return as_instance_validator(module.validate)
+
+def iter_instance_errors(instances: list[dict], validator: Draft7Validator) -> Iterator[tuple[int, str, str]]:
+    """
+    Validate a list of JSON instances and yield every validation error, instead of only the first error of each instance reported by the compiled validators.
+    Args:
+        instances (list[dict]): The JSON instances to validate.
+        validator (Draft7Validator): The validator of the JSON schema each instance is validated against.
+    Returns:
+        Iterator[tuple[int, str, str]]: The index of the invalid instance, the "/"-joined path of the invalid field within it and the error message of each validation error.
+    """
+    for index, instance in enumerate(instances):
+        for error in validator.iter_errors(instance):
+            yield index, "/".join(str(part) for part in error.absolute_path), error.message
+
 if __name__ == "__main__":
     """Main function to validate JSON schema and instances."""
 
@@ -53,49 +76,100 @@ if __name__ == "__main__":
     parser.add_argument("--schema", type=str, required=False, help="Path to the JSON schema file.")
     parser.add_argument("--instance", type=str, required=False, help="Path to the JSON instance file.")
     parser.add_argument("--key", type=str, default="processes", help="Key containing nested JSON objects to validate")
+    parser.add_argument("--debug", action="store_true", help="Write the schema content to the log file.")
+    parser.add_argument("--memoize", action="store_true", help="Validate identical nested JSON objects only once. Ignored with --report tsv.")
+    parser.add_argument("--report", type=str, choices=["log", "tsv"], default="log", help="Log the validity of each nested JSON object, or write every validation error to a TSV file.")
+    parser.add_argument("--report_file", type=str, default="validation_errors.tsv", help="Path of the TSV file written with --report tsv.")
+    parser.add_argument("--fail_fast", action="store_true", help="Stop at the first invalid nested JSON object and exit with status 1.")
+    parser.add_argument("--max_errors", type=int, default=0, help="Stop after writing this many validation errors with --report tsv. Defaults to 0 (no limit).")
+    parser.add_argument("--batch_size", type=int, default=1000, help="Number of nested JSON objects streamed from the instance file and validated together.")
 
     # Parse the arguments
     args = parser.parse_args()
 
     # Configure and Initialize the logger
-    logger = LogHandler.setup_module_logging("json_validator")
+    logger = LogHandler.setup_module_logging("json_validator", file_level=logging.DEBUG if args.debug else logging.INFO)
     logger.info("Starting JSON schema and instance validation...")
     
     # JSON schema file path
     schema_file_path = 'data/schemas/ALD-experimental/ALD-experimental-schema.json'
     if args.schema:
         schema_file_path = args.schema
-    logger.info(f'Using schema file: {schema_file_path}')
+    logger.info('Using schema file: %s', schema_file_path)
 
     # Instance file path
     instance_file_path = 'results/extracted-data/atomic-layer-deposition/experimental-usecase/version1/ZnO/ZnO_ALD&Temp_Kim_2011_cleaned.json'
     if args.instance:
         instance_file_path = args.instance
-    logger.info(f'Using instance file: {instance_file_path}')
+    logger.info('Using instance file: %s', instance_file_path)
 
     # Read the JSON schema
     schema = read_json_file(schema_file_path)
-    logger.debug(f'Schema content: {json.dumps(schema)}')
+    if args.debug: logger.debug('Schema content: %s', orjson.dumps(schema).decode())
 
     # Validate the JSON schema
     is_schema_valid = json_schema_validate(schema)
-    logger.info(f'Schema valid: {is_schema_valid}')
-
-    # Read the JSON instance
-    instance = read_json_file(instance_file_path)
-    logger.debug(f'Instance content: {json.dumps(instance)}')
-
-    # Check if a specific key is provided for nested validation
-    instance_to_validate = instance
-    if args.key and args.key in instance:
-        instance_to_validate = instance.get(args.key, {})
-        logger.info(f'Validating nested objects under key: {args.key}')
-
-    # Check if the instance to validate is a list or a single object
-    if not isinstance(instance_to_validate, list):
-        instance_to_validate = [instance_to_validate]
-        
-    # Validate the JSON instance/s against the schema
-    for obj in instance_to_validate:
-        is_instance_valid = validate_json_instance(obj, schema)
-        logger.info(f'Instance valid: {is_instance_valid}')
\ No newline at end of file
+    logger.info('Schema valid: %s', is_schema_valid)
+
+    # Select the validator compiled ahead of time, or compile the schema otherwise, so that every validity check uses the same engine
+    is_valid = load_compiled_validator(schema_file_path, schema) or get_instance_validator(schema)
+
+    # Write every validation error as a row of the TSV report instead of logging each instance, listing all errors of an instance with Draft7Validator
+    report = open(args.report_file, 'w', encoding='utf-8', buffering=1 << 20) if args.report == 'tsv' else None
+    if report: report.write('row\tfield\terror\n')
+    report_counts = {'errors': 0, 'invalid_instances': 0}
+    error_validator = Draft7Validator(schema) if report else None
+
+    # Validation results of the distinct instances, keyed by their digest, when memoization is enabled
+    memoized_results: dict[bytes, bool] = {}
+    def validate_batch(instances: list, offset: int = 0) -> bool:
+        if report:
+            # Errors are yielded lazily per instance, so stopping early skips validating the remaining instances
+            invalid_indices = set()
+            remaining_errors = args.max_errors - report_counts['errors'] if args.max_errors else None
+            for index, field, message in islice(iter_instance_errors(instances, error_validator), remaining_errors):
+                if args.fail_fast and invalid_indices and index not in invalid_indices: break
+                report.write(f"{offset + index}\t{field}\t{' '.join(message.split())}\n")
+                invalid_indices.add(index)
+                report_counts['errors'] += 1
+            report_counts['invalid_instances'] += len(invalid_indices)
+            return bool(args.fail_fast and invalid_indices) or bool(args.max_errors) and report_counts['errors'] >= args.max_errors
+        if args.memoize:
+            digests = [canonical_hash(obj) for obj in instances]
+            unseen_instances = {digest: obj for digest, obj in zip(digests, instances) if digest not in memoized_results}
+            memoized_results.update((digest, is_valid(obj)) for digest, obj in unseen_instances.items())
+            instances_valid = [memoized_results[digest] for digest in digests]
+        else:
+            # Validate lazily so that with --fail_fast the objects after the first invalid one are never validated
+            instances_valid = map(is_valid, instances)
+        for is_instance_valid in instances_valid:
+            logger.info('Instance valid: %s', is_instance_valid)
+            if args.fail_fast and not is_instance_valid: return True
+        return False
+
+    # Stream the nested objects under the key in batches, so that only one batch is held in memory
+    total_streamed = 0
+    stopped = False
+    if args.key:
+        with open(instance_file_path, 'rb') as f:
+            for batch in batched(ijson.items(f, f'{args.key}.item', buf_size=1 << 20, use_float=True), args.batch_size):
+                if not total_streamed: logger.info('Validating nested objects under key: %s', args.key)
+                stopped = validate_batch(list(batch), total_streamed)
+                total_streamed += len(batch)
+                if stopped: break
+
+    # Validate the whole instance if the key does not contain a list of nested objects
+    if not total_streamed:
+        instance = read_json_file(instance_file_path)
+        instance_to_validate = instance.get(args.key, instance) if args.key and isinstance(instance, dict) else instance
+        stopped = validate_batch(instance_to_validate if isinstance(instance_to_validate, list) else [instance_to_validate])
+
+    # Close the TSV report and log its summary
+    if report:
+        report.close()
+        logger.info("Wrote %d validation errors of %d invalid instances to: %s", report_counts['errors'], report_counts['invalid_instances'], args.report_file)
+
+    # Fail the run if validation stopped at an invalid instance
+    if stopped:
+        logger.info("Stopped validation early.")
+        if args.fail_fast: sys.exit(1)
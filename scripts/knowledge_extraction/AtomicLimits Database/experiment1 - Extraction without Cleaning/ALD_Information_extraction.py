@@ -4,10 +4,14 @@ Script to extract structured ALD process information from scientific documents b
 # Python imports
 import os
 import argparse
+from pathlib import Path
+from dataclasses import replace
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 # Scikg_extract utility imports
 from scikg_extract.utils.log_handler import LogHandler
-from scikg_extract.utils.file_utils import read_json_file, read_text_file, save_json_file
+from scikg_extract.utils.file_utils import list_filenames, read_json_file, read_text_file, save_json_file
 
 # Scikg_extract agent imports
 from scikg_extract.agents.orchestrator_agent import orchestrate_extraction_workflow
@@ -20,6 +24,51 @@ from scikg_extract.config.agents.workflow import WorkflowConfig
 # Data model for ALD Experimental Use case
 from data.models.schema.ALD_experimental_schema import ALDProcessList
 
+# File extensions of the scientific documents to extract
+DOCUMENT_SUFFIXES = (".md", ".txt")
+
+def extract_document(root: str, filename: str, res_dir: str, json_filename: str, orchestrator_config_template: OrchestratorConfig) -> None:
+    """
+    Extracts the ALD process information from a scientific document and saves the results. Runs inside a worker thread.
+    Args:
+        root (str): Directory containing the scientific document.
+        filename (str): Filename of the scientific document.
+        res_dir (str): Directory to save the extracted data of the document.
+        json_filename (str): Filename of the saved extracted data.
+        orchestrator_config_template (OrchestratorConfig): The orchestrator configuration shared by all documents, without the scientific document.
+    """
+
+    # Initialize the logger
+    logger = LogHandler.get_logger("scikg_extract")
+
+    # Read the scientific document in markdown format
+    logger.info(f"Processing scientific document: {filename}")
+    scientific_document_filepath = f"{root}/{filename}"
+    scientific_document = read_text_file(scientific_document_filepath)
+
+    # Initialize the orchestrator configuration of the document from the shared template
+    orchestrator_config = replace(orchestrator_config_template, scientific_document=scientific_document)
+
+    # Initialize the Workflow configuration
+    workflow_config = WorkflowConfig(
+        normalize_extracted_data=False,
+        clean_extracted_data=False,
+        validate_extracted_data=False,
+        refine_extracted_data=False
+    )
+
+    # Extract knowledge using the orchestrator agent
+    final_state = orchestrate_extraction_workflow(orchestrator_config, workflow_config)
+    logger.info(f"Extraction completed for document: {root}/{filename}")
+
+    # Get the extracted knowledge from the final state
+    extracted_knowledge = final_state["extracted_json"]
+
+    # Save the extracted information to a JSON file
+    file_saved = save_json_file(res_dir, json_filename, extracted_knowledge)
+    if not file_saved: raise Exception(f"Failed to save extracted information for document: {filename} at directory: {res_dir}")
+    logger.info(f"Extracted information saved to: {res_dir}/{json_filename}")
+
 if __name__ == "__main__":
     """Main function to extract ALD process information from scientific documents."""
 
@@ -30,6 +79,7 @@ if __name__ == "__main__":
     parser.add_argument("--process_schema", type=str, help="Path to the process schema JSON file.")
     parser.add_argument("--process_examples", type=str, help="Path to the gold-standard examples text file.")
     parser.add_argument("--scientific_docs_dir", type=str, help="Directory containing scientific documents in text/markdown format.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of scientific documents to extract concurrently.")
 
     # Parse the arguments
     args = parser.parse_args()
@@ -65,62 +115,52 @@ if __name__ == "__main__":
     scientific_docs_dir = args.scientific_docs_dir if args.scientific_docs_dir else "data/research-papers/ALD/markdown/AtomicLimits Database"
     logger.info(f"Scientific Documents Directory: {scientific_docs_dir}")
 
-    # Process each scientific document in the specified directory
+    # Collect the scientific documents in the specified directory that are still to be extracted
+    documents: list[tuple[str, str, str, str]] = []
     for root, _, filenames in os.walk(scientific_docs_dir):
 
-        # Skip if no files found
+        # Process only markdown or text files, skipping directories without any
+        filenames = [filename for filename in filenames if filename.endswith(DOCUMENT_SUFFIXES)]
         if not filenames: continue
 
+        # Format the results directory path for the current directory and list its existing extraction results
+        res_llm_model = llm_model.split("/")[-1]
+        res_dir = str(Path(results_dir) / Path(root).relative_to(scientific_docs_dir) / res_llm_model)
+        existing_results = list_filenames(res_dir)
+
         # Process each file in the directory
         for filename in filenames:
         
-            # Process only markdown or text files
-            if not filename.endswith(".md") and not filename.endswith(".txt"): 
-                logger.debug(f"Skipping non-markdown/text file: {filename}")
-                continue
-
             if filename == '38 Puurunen et al.md': continue
 
-            # Format the results directory path for the current document and JSON filename
-            res_llm_model = llm_model.split("/")[-1]
-            res_dir = f"{results_dir}{root.split(scientific_docs_dir)[-1].replace("\\", "/").strip()}/{res_llm_model}"
+            # Format the JSON filename for the current document
             json_filename = f"{os.path.splitext(filename)[0]}.json"
 
             # Check if the extraction result already exists
-            if os.path.exists(f"{res_dir}/{json_filename}"):
+            if json_filename in existing_results:
                 logger.info(f"Extraction result already exists for document: {filename}. Skipping extraction.")
                 continue
 
-            # Read the scientific document in markdown format
-            logger.info(f"Processing scientific document: {filename}")
-            scientific_document_filepath = f"{root}/{filename}"
-            scientific_document = read_text_file(scientific_document_filepath)
-
-            # Initialize orchestrator configuration
-            orchestrator_config = OrchestratorConfig(
-                extraction_llm=llm_model,
-                process_schema=process_schema,
-                scientific_document=scientific_document,
-                examples=examples,
-                extraction_data_model=ALDProcessList
-            )
-
-            # Initialize the Workflow configuration
-            workflow_config = WorkflowConfig(
-                normalize_extracted_data=False,
-                clean_extracted_data=False,
-                validate_extracted_data=False,
-                refine_extracted_data=False
-            )
-
-            # Extract knowledge using the orchestrator agent
-            final_state = orchestrate_extraction_workflow(orchestrator_config, workflow_config)
-            logger.info(f"Extraction completed for document: {root}/{filename}")
-
-            # Get the extracted knowledge from the final state
-            extracted_knowledge = final_state["extracted_json"]
-
-            # Save the extracted information to a JSON file
-            file_saved = save_json_file(res_dir, json_filename, extracted_knowledge)
-            if not file_saved: raise Exception(f"Failed to save extracted information for document: {filename} at directory: {res_dir}")
-            logger.info(f"Extracted information saved to: {res_dir}/{json_filename}")
\ No newline at end of file
+            # Queue the document for extraction
+            documents.append((root, filename, res_dir, json_filename))
+
+    # Initialize the orchestrator configuration shared by all documents
+    orchestrator_config_template = OrchestratorConfig(
+        extraction_llm=llm_model,
+        process_schema=process_schema,
+        scientific_document="",
+        examples=examples,
+        extraction_data_model=ALDProcessList
+    )
+
+    # Extract the scientific documents concurrently to overlap the LLM request latency
+    logger.info(f"Extracting {len(documents)} scientific documents with concurrency: {args.concurrency}")
+    process_document = partial(
+        extract_document,
+        orchestrator_config_template=orchestrator_config_template
+    )
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = [executor.submit(process_document, *document) for document in documents]
+
+        # Surface exceptions raised in the worker threads
+        for future in futures: future.result()
\ No newline at end of file
@@ -5,10 +5,11 @@ Script to extract and normalize structured ALD process information from scientif
 import os
 from time import time
 import argparse
+from pathlib import Path
 
 # Scikg_extract utility imports
 from scikg_extract.utils.log_handler import LogHandler
-from scikg_extract.utils.file_utils import read_json_file, read_text_file, save_json_file
+from scikg_extract.utils.file_utils import list_filenames, read_json_file, read_text_file, save_json_file
 
 # Scikg_extract agent imports
 from scikg_extract.agents.orchestrator_agent import orchestrate_extraction_workflow
@@ -24,6 +25,9 @@ from scikg_extract.evaluation.rubrics.informativeness import Completeness, Corre
 # Data Model for ALD Experimental and Simulation Use Case
 from data.models.schema.ALD_experimental_schema import ALDProcessList
 
+# File extensions of the scientific documents to extract
+DOCUMENT_SUFFIXES = (".md", ".txt")
+
 if __name__ == "__main__":
     """Main function to extract ALD process information from scientific documents."""
 
@@ -106,26 +110,25 @@ if __name__ == "__main__":
     # Process each scientific document in the specified directory
     for root, _, filenames in os.walk(scientific_docs_dir):
 
-        # Skip if no files found
+        # Process only markdown or text files, skipping directories without any
+        filenames = [filename for filename in filenames if filename.endswith(DOCUMENT_SUFFIXES)]
         if not filenames: continue
 
+        # Format the results directory path for the current directory and list its existing extraction results
+        res_dir = str(Path(results_dir) / Path(root).relative_to(scientific_docs_dir) / llm_model)
+        existing_results = list_filenames(res_dir)
+
         # Process each file in the directory
         for filename in filenames:
         
-            # Process only markdown or text files
-            if not filename.endswith(".md") and not filename.endswith(".txt"): 
-                logger.debug(f"Skipping non-markdown/text file: {filename}")
-                continue
-
             # Process only "128 Malm et al.md" for testing
             if filename != "1 Sheng et al.md": continue
 
-            # Format the results directory path for the current document and JSON filename
-            res_dir = f"{results_dir}{root.split(scientific_docs_dir)[-1].replace("\\", "/").strip()}/{llm_model}"
+            # Format the JSON filename for the current document
             json_filename = f"{os.path.splitext(filename)[0]}.json"
 
             # Check if the extraction result already exists
-            if os.path.exists(f"{res_dir}/{json_filename}"):
+            if json_filename in existing_results:
                 logger.info(f"Extraction result already exists for document: {filename}. Skipping extraction.")
                 continue
 
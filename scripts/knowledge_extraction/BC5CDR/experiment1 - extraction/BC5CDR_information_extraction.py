@@ -7,7 +7,7 @@ import argparse
 
 # SciKGExtract utility imports
 from scikg_extract.utils.log_handler import LogHandler
-from scikg_extract.utils.file_utils import read_json_file, read_text_file, save_json_file
+from scikg_extract.utils.file_utils import list_filenames, read_json_file, read_text_file, save_json_file
 
 # SciKGExtract agent imports
 from scikg_extract.agents.orchestrator_agent import orchestrate_extraction_workflow
@@ -84,9 +84,10 @@ if __name__ == "__main__":
     data = read_json_file(data_path)
     logger.info(f"Loaded {len(data)} documents from: {data_path}")
 
-    # Format the results directory path with LLM model name
+    # Format the results directory path with LLM model name and list its existing extraction results
     res_llm_model = ProviderRegistry.parse_llm_string(extraction_llm)[0].split("/")[-1]
     res_dir = f"{results_dir}/{res_llm_model}"
+    existing_results = list_filenames(res_dir)
 
     # Process each document in the dataset
     for record in data:
@@ -95,7 +96,7 @@ if __name__ == "__main__":
         json_filename = f"{doc_id}.json"
 
         # Check if the extraction result already exists
-        if os.path.exists(f"{res_dir}/{json_filename}"):
+        if json_filename in existing_results:
             logger.info(f"Extraction result already exists for document: {doc_id}. Skipping.")
             continue
 
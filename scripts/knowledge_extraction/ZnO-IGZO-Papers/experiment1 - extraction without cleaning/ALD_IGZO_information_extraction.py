@@ -3,16 +3,22 @@ Script to extract structured ALD process information related to IGZO thin-film d
 """
 # Python imports
 import os
+import sys
 import argparse
+from pathlib import Path
 
 # Scikg_extract utility imports
 from scikg_extract.utils.log_handler import LogHandler
-from scikg_extract.utils.file_utils import read_json_file, read_text_file, save_json_file
+from scikg_extract.utils.file_utils import list_filenames, read_json_file, read_text_file, save_json_file
 
 # Scikg_extract agent imports
-from scikg_extract.agents.orchestrator_agent import orchestrate_extraction_workflow
+from scikg_extract.agents.orchestrator_agent import initialize_extraction_state, orchestrate_extraction_workflow
+
+# Scikg_extract service imports
+from scikg_extract.services.openai_batch_extractor import OpenAIBatchExtractor
 
 # Scikg_extract config imports
+from scikg_extract.config.llm.llmConfig import ProviderRegistry
 from scikg_extract.config.process.processConfig import ProcessConfig
 from scikg_extract.config.agents.orchestrator import OrchestratorConfig
 from scikg_extract.config.agents.workflow import WorkflowConfig
@@ -20,6 +26,9 @@ from scikg_extract.config.agents.workflow import WorkflowConfig
 # Data Model for ALD Experimental Use Case
 from data.models.schema.ALD_experimental_schema import ALDProcessList
 
+# File extensions of the scientific documents to extract
+DOCUMENT_SUFFIXES = (".md", ".txt")
+
 if __name__ == "__main__":
     """Main function to extract ALD IGZO process information from scientific documents."""
 
@@ -30,6 +39,8 @@ if __name__ == "__main__":
     parser.add_argument("--process_schema", type=str, help="Path to the process schema JSON file.")
     parser.add_argument("--process_examples", type=str, help="Path to the gold-standard examples text file.")
     parser.add_argument("--scientific_docs_dir", type=str, help="Directory containing scientific documents in text/markdown format.")
+    parser.add_argument("--batch_mode", type=str, default="online", choices=["online", "openai_batch"], help="Extract with real-time LLM calls or submit the extractions to the OpenAI Batch API.")
+    parser.add_argument("--poll", action="store_true", help="Collect the results of previously submitted OpenAI batches instead of starting new extractions.")
 
     # Parse the arguments
     args = parser.parse_args()
@@ -42,6 +53,12 @@ if __name__ == "__main__":
     llm_model = args.llm_model if args.llm_model else "google/gemma-4-26b-a4b-it"
     logger.info(f"Using LLM model: {llm_model}")
 
+    # OpenAI batches can only run OpenAI models, so reject any other provider before submitting or polling
+    if args.batch_mode == "openai_batch" or args.poll:
+        model_name, provider_name = ProviderRegistry.parse_llm_string(llm_model)
+        is_openai_model = provider_name == "OPENAI" or (provider_name is None and model_name in ProviderRegistry.providers["OPENAI"].known_models)
+        if not is_openai_model: parser.error(f"--batch_mode openai_batch and --poll require an OpenAI model (e.g., \"OPENAI:gpt-5\"), got: {llm_model}")
+
     # Updating the process description for IGZO
     ProcessConfig.Process_description = """
     Atomic layer deposition (ALD) is a surface-controlled thin film deposition technique that can enable ultimate control over the film thickness, uniformity on large-area substrates and conformality on 3D (nano)structures. Each ALD cycle consists at least two half-cycles (but can be more complex), containing a precursor dose step and a co-reactant exposure step, separated by purge or pump steps. Ideally the same amount of material is deposited in each cycle, due to the self-limiting nature of the reactions of the precursor and co-reactant with the surface groups on the substrate. By carrying out a certain number of ALD cycles, the targeted film thickness can be obtained.
@@ -60,6 +77,15 @@ if __name__ == "__main__":
     results_dir = args.results_dir if args.results_dir else "results/extractions/ZnO-IGZO-Papers/version1/experimental-usecase/IGZO/AtomicLimits Database"
     logger.info(f"Results Directory to save extracted data: {results_dir}")
 
+    # Collect the results of the completed OpenAI batches
+    if args.poll:
+        batch_extractor = OpenAIBatchExtractor(llm_model, results_dir, ALDProcessList)
+        for (res_dir, json_filename), extracted_knowledge in batch_extractor.poll().values():
+            file_saved = save_json_file(res_dir, json_filename, extracted_knowledge)
+            if not file_saved: raise Exception(f"Failed to save extracted information to: {res_dir}/{json_filename}")
+            logger.info(f"Extracted information saved to: {res_dir}/{json_filename}")
+        sys.exit(0)
+
     # Read the process schema from the JSON file
     process_schema_path = args.process_schema if args.process_schema else "data/schemas/ALD/experimental-usecase/ALD-experimental-schema.json"
     process_schema = read_json_file(process_schema_path)
@@ -74,27 +100,31 @@ if __name__ == "__main__":
     scientific_docs_dir = args.scientific_docs_dir if args.scientific_docs_dir else "data/research-papers/ALD/markdown/ZnO-IGZO-papers/experimental-usecase/IGZO/AtomicLimits Database"
     logger.info(f"Scientific Documents Directory: {scientific_docs_dir}")
 
+    # Initialize the OpenAI batch extractor, skipping documents already part of a pending batch
+    batch_extractor = OpenAIBatchExtractor(llm_model, results_dir, ALDProcessList) if args.batch_mode == "openai_batch" else None
+    pending_custom_ids = batch_extractor.pending_custom_ids() if batch_extractor else set()
+    batch_requests, batch_jobs = [], {}
+
     # Process each scientific document in the specified directory
     for root, _, filenames in os.walk(scientific_docs_dir):
 
-        # Skip if no files found
+        # Process only markdown or text files, skipping directories without any
+        filenames = [filename for filename in filenames if filename.endswith(DOCUMENT_SUFFIXES)]
         if not filenames: continue
 
+        # Format the results directory path for the current directory and list its existing extraction results
+        res_llm_model = llm_model.split("/")[-1]
+        res_dir = str(Path(results_dir) / Path(root).relative_to(scientific_docs_dir) / res_llm_model)
+        existing_results = list_filenames(res_dir)
+
         # Process each file in the directory
         for filename in filenames:
         
-            # Process only markdown or text files
-            if not filename.endswith(".md") and not filename.endswith(".txt"): 
-                logger.debug(f"Skipping non-markdown/text file: {filename}")
-                continue
-
-            # Format the results directory path for the current document and JSON filename
-            res_llm_model = llm_model.split("/")[-1]
-            res_dir = f"{results_dir}{root.split(scientific_docs_dir)[-1].replace("\\", "/").strip()}/{res_llm_model}"
+            # Format the JSON filename for the current document
             json_filename = f"{os.path.splitext(filename)[0]}.json"
 
             # Check if the extraction result already exists
-            if os.path.exists(f"{res_dir}/{json_filename}"):
+            if json_filename in existing_results:
                 logger.info(f"Extraction result already exists for document: {filename}. Skipping extraction.")
                 continue
 
@@ -120,6 +150,14 @@ if __name__ == "__main__":
                 refine_extracted_data=False
             )
 
+            # Queue the document for the OpenAI Batch API instead of extracting it in real time
+            if batch_extractor:
+                custom_id = OpenAIBatchExtractor.build_custom_id(scientific_document_filepath)
+                if custom_id in pending_custom_ids: continue
+                batch_requests.append(batch_extractor.build_extraction_request(custom_id, initialize_extraction_state(orchestrator_config, workflow_config)))
+                batch_jobs[custom_id] = [res_dir, json_filename]
+                continue
+
             # Extract knowledge using the orchestrator agent
             final_state = orchestrate_extraction_workflow(orchestrator_config, workflow_config)
             logger.info(f"Extraction completed for document: {root}/{filename}")
@@ -130,4 +168,9 @@ if __name__ == "__main__":
             # Save the extracted information to a JSON file
             file_saved = save_json_file(res_dir, json_filename, extracted_knowledge)
             if not file_saved: raise Exception(f"Failed to save extracted information for document: {filename}")
-            logger.info(f"Extracted information saved to: {res_dir}/{json_filename}")
\ No newline at end of file
+            logger.info(f"Extracted information saved to: {res_dir}/{json_filename}")
+
+    # Submit the queued documents to the OpenAI Batch API
+    if batch_jobs:
+        batch_id = batch_extractor.submit(batch_requests, batch_jobs)
+        logger.info(f"Submitted {len(batch_jobs)} scientific documents in batch {batch_id}. Rerun with --poll to collect the results.")
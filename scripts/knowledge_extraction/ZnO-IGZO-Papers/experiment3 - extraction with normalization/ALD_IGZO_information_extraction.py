@@ -8,14 +8,22 @@ Last Modified: December 20, 2025
 # Python imports
 import os
 import argparse
+from pathlib import Path
+from dataclasses import replace
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 
 # Scikg_extract utility imports
 from scikg_extract.utils.log_handler import LogHandler
-from scikg_extract.utils.file_utils import read_json_file, read_text_file, save_json_file
+from scikg_extract.utils.debounced_saver import DebouncedJsonSaver
+from scikg_extract.utils.file_utils import iter_files, list_filenames, read_json_file, read_text_file, save_json_file
 
 # Scikg_extract agent imports
 from scikg_extract.agents.orchestrator_agent import orchestrate_extraction_workflow
 
+# Scikg_extract service imports
+from scikg_extract.services.semantic_cache import SemanticExtractionCache
+
 # Scikg_extract config imports
 from scikg_extract.config.process.processConfig import ProcessConfig
 from scikg_extract.config.agents.orchestrator import OrchestratorConfig
@@ -24,26 +32,130 @@ from scikg_extract.config.agents.workflow import WorkflowConfig
 # Data Model for ALD Experimental Use Case
 from data.models.schema.ALD_experimental_schema import ALDProcessList
 
+# File extensions of the scientific documents to extract
+DOCUMENT_SUFFIXES = (".md", ".txt")
+
+# Output directories are listed once per run instead of checking each document's outputs with a separate stat call
+existing_outputs = lru_cache(maxsize=None)(list_filenames)
+
+def extract_document(root: str, filename: str, llm_model: str, results_dir: str, normalized_results_dir: str, scientific_docs_dir: str, orchestrator_config_template: OrchestratorConfig, mapping_saver: DebouncedJsonSaver, semantic_cache: SemanticExtractionCache | None = None) -> None:
+    """
+    Extracts and normalizes the ALD process information from a single scientific document and saves the results. Runs inside a worker thread.
+    Args:
+        root (str): Directory containing the scientific document.
+        filename (str): Filename of the scientific document.
+        llm_model (str): The name of the large language model to use, naming the results directories.
+        results_dir (str): Directory to save the extracted data.
+        normalized_results_dir (str): Directory to save the normalized extracted data.
+        scientific_docs_dir (str): Directory containing scientific documents in text/markdown format.
+        orchestrator_config_template (OrchestratorConfig): The orchestrator configuration shared by all documents, without the scientific document and synonym to CID mapping.
+        mapping_saver (DebouncedJsonSaver): Saver of the PubChem synonym to CID mapping shared across documents, which hands each document its own copy of the mapping, merges the updated copies back and periodically saves them to the lookup dictionary file.
+        semantic_cache (SemanticExtractionCache | None, optional): Semantic cache used to reuse the results of near-duplicate documents. Defaults to None (disabled).
+    """
+
+    # Initialize the logger
+    logger = LogHandler.get_logger("scikg_extract")
+
+    # Format the results directory path for the current document and JSON filename
+    relative_root = Path(root).relative_to(scientific_docs_dir)
+    res_dir = str(Path(results_dir) / relative_root / llm_model)
+    norm_results_dir = str(Path(normalized_results_dir) / relative_root / llm_model)
+    json_filename = f"{os.path.splitext(filename)[0]}.json"
+
+    # Check if the extraction result already exists
+    if json_filename in existing_outputs(res_dir) and json_filename in existing_outputs(norm_results_dir):
+        logger.info(f"Extraction result already exists for document: {filename}. Skipping extraction.")
+        return
+
+    # Read the scientific document in markdown format
+    logger.info(f"Processing scientific document: {filename}")
+    scientific_document_filepath = f"{root}/{filename}"
+    scientific_document = read_text_file(scientific_document_filepath)
+
+    # Reuse the saved results of a near-duplicate document from the semantic cache, if any
+    embedding = semantic_cache.embed(scientific_document) if semantic_cache else None
+    cached_entry = semantic_cache.lookup(embedding) if semantic_cache else None
+    cached_extracted = read_json_file(cached_entry["extracted_json"]) if cached_entry else None
+    cached_normalized = read_json_file(cached_entry["normalized_json"]) if cached_entry else None
+
+    # Treat the hit as a miss if the cached results have since been deleted or cannot be read
+    if cached_entry and (cached_extracted is None or cached_normalized is None):
+        logger.warning(f"Semantic cache hit for document: {filename} has unreadable results of: {cached_entry['document']}. Extracting the document instead.")
+    elif cached_entry:
+        logger.info(f"Semantic cache hit for document: {filename}. Reusing results of: {cached_entry['document']}")
+        file_saved = save_json_file(res_dir, json_filename, cached_extracted)
+        if not file_saved: raise Exception(f"Failed to save extracted information for document: {filename}")
+        file_saved = save_json_file(norm_results_dir, json_filename, cached_normalized)
+        if not file_saved: raise Exception(f"Failed to save normalized extracted information for document: {filename}")
+        return
+
+    # Initialize the orchestrator configuration of the document from the shared template, normalizing with a copy of the shared synonym to CID mapping so concurrent documents never update the same dictionary
+    orchestrator_config = replace(orchestrator_config_template, scientific_document=scientific_document, synonym_to_cid_mapping=mapping_saver.snapshot())
+
+    # Initialize the Workflow configuration
+    workflow_config = WorkflowConfig(
+        normalize_extracted_data=True,
+        clean_extracted_data=False,
+        validate_extracted_data=False
+    )
+
+    # Extract knowledge using the orchestrator agent
+    final_state = orchestrate_extraction_workflow(orchestrator_config, workflow_config)
+    logger.info(f"Extraction completed for document: {root}/{filename}")
+
+    # Get the extracted knowledge from the final state
+    extracted_knowledge = final_state["extracted_json"]
+
+    # Get the normalized knowledge from the final state
+    normalized_knowledge = final_state["normalized_json"]
+
+    # Get the updated synonym to CID mapping used during normalization to save for next papers
+    updated_synonym_to_cid_mapping = final_state.get("synonym_to_cid_mapping", {})
+
+    # Merge the updated synonym to CID mapping, saving it back to the lookup dictionary file at most once per save interval
+    if not mapping_saver.update(updated_synonym_to_cid_mapping): raise Exception("Error saving PubChem synonym to CID mapping JSON file.")
+
+    # Save the extracted information to a JSON file
+    file_saved = save_json_file(res_dir, json_filename, extracted_knowledge)
+    if not file_saved: raise Exception(f"Failed to save extracted information for document: {filename}")
+    logger.info(f"Extracted information saved to: {res_dir}/{json_filename}")
+
+    # Save the normalized extracted information to a JSON file
+    file_saved = save_json_file(norm_results_dir, json_filename, normalized_knowledge)
+    if not file_saved: raise Exception(f"Failed to save normalized extracted information for document: {filename}")
+    logger.info(f"Normalized extracted information saved to: {norm_results_dir}/{json_filename}")
+
+    # Register the saved results in the semantic cache for later near-duplicate documents
+    if semantic_cache: semantic_cache.add(embedding, {
+        "document": f"{root}/{filename}",
+        "extracted_json": f"{res_dir}/{json_filename}",
+        "normalized_json": f"{norm_results_dir}/{json_filename}"
+    })
+
 if __name__ == "__main__":
     """Main function to extract ALD IGZO process information from scientific documents."""
 
     # Argument Parser Setup
     parser = argparse.ArgumentParser(description="Extract structured ALD process information from scientific documents.")
-    parser.add_argument("--llm_model", type=str, help="The name of the large language model to use.")
-    parser.add_argument("--normalization_llm_model", type=str, help="The name of the LLM model to use for normalization disambiguation.")
-    parser.add_argument("--results_dir", type=str, help="Directory to save the extracted data.")
-    parser.add_argument("--normalized_results_dir", type=str, help="Directory to save the normalized extracted data.")
-    parser.add_argument("--process_schema", type=str, help="Path to the process schema JSON file.")
-    parser.add_argument("--process_examples", type=str, help="Path to the gold-standard examples text file.")
-    parser.add_argument("--scientific_docs_dir", type=str, help="Directory containing scientific documents in text/markdown format.")
-    parser.add_argument("--pubchem_lookup_dict_path", type=str, help="Path to the manual curated PubChem CID mapping lookup dictionary JSON file.")
-    parser.add_argument("--lmdb_pubchem_path", type=str, help="Path to the LMDB PubChem CID mapping database.")
+    parser.add_argument("--llm_model", type=str, default="gpt-4o", help="The name of the large language model to use.")
+    parser.add_argument("--normalization_llm_model", type=str, default="gpt-5", help="The name of the LLM model to use for normalization disambiguation.")
+    parser.add_argument("--results_dir", type=str, default="results/extracted-data-test/ALD/version1/ZnO-IGZO-papers/experimental-usecase/IGZO", help="Directory to save the extracted data.")
+    parser.add_argument("--normalized_results_dir", type=str, default="results/extracted-data-test/ALD/version2/ZnO-IGZO-papers/experimental-usecase/IGZO", help="Directory to save the normalized extracted data.")
+    parser.add_argument("--process_schema", type=str, default="data/schemas/ALD-experimental/ALD-experimental-schema.json", help="Path to the process schema JSON file.")
+    parser.add_argument("--process_examples", type=str, default="data/examples/Atomic-layer-deposition/IGZO/example1.txt", help="Path to the gold-standard examples text file.")
+    parser.add_argument("--scientific_docs_dir", type=str, default="data/research-papers/ALD/markdown/ZnO-IGZO-papers/experimental-usecase/IGZO", help="Directory containing scientific documents in text/markdown format.")
+    parser.add_argument("--pubchem_lookup_dict_path", type=str, default="data/resources/PubChem-Synonym-CID.json", help="Path to the manual curated PubChem CID mapping lookup dictionary JSON file.")
+    parser.add_argument("--lmdb_pubchem_path", type=str, default="data/external/pubchem/pubchem_cid_lmdb", help="Path to the LMDB PubChem CID mapping database.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of scientific documents to extract concurrently.")
+    parser.add_argument("--mapping_save_interval", type=float, default=30.0, help="Minimum number of seconds between two saves of the updated PubChem synonym to CID mapping.")
+    parser.add_argument("--semantic_cache_dir", type=str, help="Directory of the semantic cache used to reuse results of near-duplicate documents. Disabled if not provided.")
+    parser.add_argument("--semantic_cache_threshold", type=float, default=0.95, help="Minimum cosine similarity for a semantic cache hit.")
 
     # Parse the arguments
     args = parser.parse_args()
 
     # Build unique run identifier for concurrent execution (LLM name + PID)
-    llm_model = args.llm_model if args.llm_model else "gpt-4o"
+    llm_model = args.llm_model
     run_id = f"{llm_model}_{os.getpid()}"
 
     # Setup and Initialize Module Logging
@@ -54,7 +166,7 @@ if __name__ == "__main__":
     logger.info(f"Using LLM model: {llm_model}")
 
     # Initialize the Normalization LLM model
-    normalization_llm_model = args.normalization_llm_model if args.normalization_llm_model else "gpt-5"
+    normalization_llm_model = args.normalization_llm_model
     logger.info(f"Using Normalization LLM model: {normalization_llm_model}")
 
     # Updating the process description for IGZO
@@ -72,107 +184,78 @@ if __name__ == "__main__":
     logger.debug(f"Process Contraints:\n{ProcessConfig.Process_property_constraints}")
 
     # Results directory
-    results_dir = args.results_dir if args.results_dir else "results/extracted-data-test/ALD/version1/ZnO-IGZO-papers/experimental-usecase/IGZO"
+    results_dir = args.results_dir
     logger.info(f"Results Directory to save extracted data: {results_dir}")
 
     # Normalized results directory
-    normalized_results_dir = args.normalized_results_dir if args.normalized_results_dir else "results/extracted-data-test/ALD/version2/ZnO-IGZO-papers/experimental-usecase/IGZO"
+    normalized_results_dir = args.normalized_results_dir
     logger.info(f"Normalized Results Directory to save normalized extracted data: {normalized_results_dir}")
 
     # Read the process schema from the JSON file
-    process_schema_path = args.process_schema if args.process_schema else "data/schemas/ALD-experimental/ALD-experimental-schema.json"
+    process_schema_path = args.process_schema
     process_schema = read_json_file(process_schema_path)
     logger.info(f"Loaded process schema from: {process_schema_path}")
 
     # Read the gold-standard examples from a text file
-    examples_path = args.process_examples if args.process_examples else "data/examples/Atomic-layer-deposition/IGZO/example1.txt"
+    examples_path = args.process_examples
     examples = read_text_file(examples_path)
     logger.info(f"Loaded process examples from: {examples_path}")
 
     # Load manual curated PubChem CID mapping lookup dictionary
-    pubchem_lookup_dict_path = args.pubchem_lookup_dict_path if args.pubchem_lookup_dict_path else "data/resources/PubChem-Synonym-CID.json"
+    pubchem_lookup_dict_path = args.pubchem_lookup_dict_path
     synonym_to_cid_mapping = read_json_file(pubchem_lookup_dict_path)
     logger.info(f"Loaded PubChem CID mapping lookup dictionary with {len(synonym_to_cid_mapping)} entries from: {pubchem_lookup_dict_path}")
 
     # LMDB PubChem CID mapping path
-    lmdb_pubchem_path = args.lmdb_pubchem_path if args.lmdb_pubchem_path else "data/external/pubchem/pubchem_cid_lmdb"
+    lmdb_pubchem_path = args.lmdb_pubchem_path
 
     # Directory containing scientific documents
-    scientific_docs_dir = args.scientific_docs_dir if args.scientific_docs_dir else "data/research-papers/ALD/markdown/ZnO-IGZO-papers/experimental-usecase/IGZO"
+    scientific_docs_dir = args.scientific_docs_dir
     logger.info(f"Scientific Documents Directory: {scientific_docs_dir}")
 
-    # Process each scientific document in the specified directory
-    for root, _, filenames in os.walk(scientific_docs_dir):
-
-        # Skip if no files found
-        if not filenames: continue
-
-        # Process each file in the directory
-        for filename in filenames:
-        
-            # Process only markdown or text files
-            if not filename.endswith(".md") and not filename.endswith(".txt"): 
-                logger.debug(f"Skipping non-markdown/text file: {filename}")
-                continue
-
-            # Format the results directory path for the current document and JSON filename
-            res_dir = f"{results_dir}{root.split(scientific_docs_dir)[-1].replace("\\", "/").strip()}/{llm_model}"
-            norm_results_dir = f"{normalized_results_dir}{root.split(scientific_docs_dir)[-1].replace('\\', '/').strip()}/{llm_model}"
-            json_filename = f"{os.path.splitext(filename)[0]}.json"
-
-            # Check if the extraction result already exists
-            if os.path.exists(f"{res_dir}/{json_filename}") and os.path.exists(f"{norm_results_dir}/{json_filename}"):
-                logger.info(f"Extraction result already exists for document: {filename}. Skipping extraction.")
-                continue
-
-            # Read the scientific document in markdown format
-            logger.info(f"Processing scientific document: {filename}")
-            scientific_document_filepath = f"{root}/{filename}"
-            scientific_document = read_text_file(scientific_document_filepath)
-
-            # Initialize orchestrator configuration
-            orchestrator_config = OrchestratorConfig(
-                extraction_llm=llm_model,
-                normalization_llm=normalization_llm_model,
-                process_schema=process_schema,
-                scientific_document=scientific_document,
-                examples=examples,
-                extraction_data_model=ALDProcessList,
-                pubchem_lmdb_path=lmdb_pubchem_path,
-                synonym_to_cid_mapping=synonym_to_cid_mapping
-            )
-
-            # Initialize the Workflow configuration
-            workflow_config = WorkflowConfig(
-                normalize_extracted_data=True,
-                clean_extracted_data=False,
-                validate_extracted_data=False
-            )
-
-            # Extract knowledge using the orchestrator agent
-            final_state = orchestrate_extraction_workflow(orchestrator_config, workflow_config)
-            logger.info(f"Extraction completed for document: {root}/{filename}")
-
-            # Get the extracted knowledge from the final state
-            extracted_knowledge = final_state["extracted_json"]
-
-            # Get the normalized knowledge from the final state
-            normalized_knowledge = final_state["normalized_json"]
-
-            # Get the updated synonym to CID mapping used during normalization to save for next papers
-            updated_synonym_to_cid_mapping = final_state.get("synonym_to_cid_mapping", synonym_to_cid_mapping)
-
-            # Save the updated synonym to CID mapping back to the lookup dictionary file
-            file_saved = save_json_file(os.path.dirname(pubchem_lookup_dict_path), "PubChem-Synonym-CID.json", synonym_to_cid_mapping)
-            if not file_saved: raise Exception("Error saving PubChem synonym to CID mapping JSON file.")
-            logger.info(f"Updated PubChem synonym to CID mapping saved to: {pubchem_lookup_dict_path}")
-
-            # Save the extracted information to a JSON file
-            file_saved = save_json_file(res_dir, json_filename, extracted_knowledge)
-            if not file_saved: raise Exception(f"Failed to save extracted information for document: {filename}")
-            logger.info(f"Extracted information saved to: {res_dir}/{json_filename}")
-
-            # Save the normalized extracted information to a JSON file
-            file_saved = save_json_file(norm_results_dir, json_filename, normalized_knowledge)
-            if not file_saved: raise Exception(f"Failed to save normalized extracted information for document: {filename}")
-            logger.info(f"Normalized extracted information saved to: {norm_results_dir}/{json_filename}")
\ No newline at end of file
+    # Collect the markdown or text scientific documents in the specified directory
+    documents: list[tuple[str, str]] = [(os.path.dirname(entry.path), entry.name) for entry in iter_files(scientific_docs_dir, DOCUMENT_SUFFIXES)]
+
+    # Initialize the semantic cache, keyed on the extraction setup so results are only reused for the same schema and LLMs
+    semantic_cache = None
+    if args.semantic_cache_dir:
+        cache_key = SemanticExtractionCache.build_cache_key(process_schema, llm_model, normalization_llm_model)
+        semantic_cache = SemanticExtractionCache(args.semantic_cache_dir, cache_key, threshold=args.semantic_cache_threshold)
+        logger.info(f"Using semantic cache from: {args.semantic_cache_dir} with threshold: {args.semantic_cache_threshold}")
+
+    # Initialize the orchestrator configuration shared by all documents, each document receiving its own copy of the synonym to CID mapping
+    orchestrator_config_template = OrchestratorConfig(
+        extraction_llm=llm_model,
+        normalization_llm=normalization_llm_model,
+        process_schema=process_schema,
+        scientific_document="",
+        examples=examples,
+        extraction_data_model=ALDProcessList,
+        pubchem_lmdb_path=lmdb_pubchem_path
+    )
+
+    # Merge the synonym to CID mappings updated by the workers and save them at most once per save interval
+    mapping_saver = DebouncedJsonSaver(os.path.dirname(pubchem_lookup_dict_path), "PubChem-Synonym-CID.json", synonym_to_cid_mapping, args.mapping_save_interval)
+
+    # Extract the scientific documents concurrently to overlap the LLM and PubChem request latency
+    logger.info(f"Extracting {len(documents)} scientific documents with concurrency: {args.concurrency}")
+    process_document = partial(
+        extract_document,
+        llm_model=llm_model,
+        results_dir=results_dir,
+        normalized_results_dir=normalized_results_dir,
+        scientific_docs_dir=scientific_docs_dir,
+        orchestrator_config_template=orchestrator_config_template,
+        mapping_saver=mapping_saver,
+        semantic_cache=semantic_cache
+    )
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            futures = [executor.submit(process_document, root, filename) for root, filename in documents]
+
+            # Surface exceptions raised in the worker threads
+            for future in futures: future.result()
+    finally:
+        # Save the synonym to CID mapping updates not saved yet, also when a worker failed
+        if not mapping_saver.flush(): raise Exception("Error saving PubChem synonym to CID mapping JSON file.")
+        logger.info(f"Updated PubChem synonym to CID mapping saved to: {pubchem_lookup_dict_path}")
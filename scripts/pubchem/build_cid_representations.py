@@ -20,7 +20,8 @@ import re
 import time
 
 # SciKG-Extract Script Imports
-from scripts.pubchem.pubchem_api import fetch_compound_by_cid, fetch_synonyms_by_cid
+from data.models.api.pubchem_property import PropertyItem
+from scripts.pubchem.pubchem_api import PUBCHEM_CACHE_DIR, close_pubchem_clients, fetch_compound_by_cid, fetch_compounds_by_cids, fetch_synonyms_by_cid
 
 # SciKG-Extract Utility Imports
 from scikg_extract.utils.file_utils import read_json_file, save_json_file
@@ -66,6 +67,8 @@ async def fetch_representations_for_cid(
     delay: float,
     timeout: int,
     logger,
+    cache_dir: str | None = PUBCHEM_CACHE_DIR,
+    property_item: PropertyItem | None = None,
 ) -> dict:
     """
     Fetch IUPACName, MolecularFormula and synonyms for a single CID.
@@ -77,6 +80,8 @@ async def fetch_representations_for_cid(
         delay: Seconds to sleep after each API call to respect rate limits.
         timeout: HTTP timeout in seconds.
         logger: Logger instance.
+        cache_dir: Directory of the PubChem response cache, disabled if None.
+        property_item: Properties of the CID already fetched in a batch, fetched per CID if None.
 
     Returns:
         Dict with chemical representations for the CID.
@@ -87,20 +92,23 @@ async def fetch_representations_for_cid(
         "synonyms": [],
     }
 
-    # Fetch properties (IUPACName, MolecularFormula)
+    # Fetch properties (IUPACName, MolecularFormula), unless already fetched in a batch
     try:
-        prop_response = await fetch_compound_by_cid(cid, PROPERTIES, PUBCHEM_BASE_URL, timeout)
-        if prop_response and prop_response.PropertyTable.Properties:
-            item = prop_response.PropertyTable.Properties[0]
+        item = property_item
+        if item is None:
+            prop_response = await fetch_compound_by_cid(cid, PROPERTIES, PUBCHEM_BASE_URL, timeout, cache_dir)
+            if prop_response and prop_response.PropertyTable.Properties:
+                item = prop_response.PropertyTable.Properties[0]
+            await asyncio.sleep(delay)
+        if item:
             entry["iupac_name"] = item.IUPACName
             entry["molecular_formula"] = item.MolecularFormula
-        await asyncio.sleep(delay)
     except Exception as e:
         logger.warning(f"CID {cid}: property fetch failed — {e}")
 
     # Fetch synonyms
     try:
-        syn_response = await fetch_synonyms_by_cid(cid, PUBCHEM_BASE_URL, timeout)
+        syn_response = await fetch_synonyms_by_cid(cid, PUBCHEM_BASE_URL, timeout, cache_dir)
         if syn_response and syn_response.InformationList.Information:
             entry["synonyms"] = syn_response.InformationList.Information[0].Synonym
         await asyncio.sleep(delay)
@@ -116,6 +124,7 @@ async def build_representations(
     delay: float,
     timeout: int,
     logger,
+    cache_dir: str | None = PUBCHEM_CACHE_DIR,
 ) -> None:
     """
     Fetch representations for all CIDs and save the result JSON file.
@@ -127,6 +136,7 @@ async def build_representations(
         delay: Seconds to sleep between API calls.
         timeout: HTTP timeout in seconds.
         logger: Logger instance.
+        cache_dir: Directory of the PubChem response cache, disabled if None.
     """
     # Load existing results to support resuming an interrupted run
     existing: dict = {}
@@ -140,10 +150,14 @@ async def build_representations(
     remaining = sorted(cids - set(existing.keys()))
     logger.info(f"{len(remaining)} CIDs to fetch (skipping {len(existing)} already done)")
 
+    # Fetch the properties of all remaining CIDs in batched requests up front
+    property_items = await fetch_compounds_by_cids(remaining, PROPERTIES, PUBCHEM_BASE_URL, timeout, cache_dir)
+    logger.info(f"Fetched properties of {len(property_items)}/{len(remaining)} CIDs in batches")
+
     results: dict = dict(existing)
     for i, cid in enumerate(remaining, start=1):
         logger.info(f"[{i}/{len(remaining)}] Fetching CID {cid} ...")
-        entry = await fetch_representations_for_cid(cid, delay, timeout, logger)
+        entry = await fetch_representations_for_cid(cid, delay, timeout, logger, cache_dir, property_items.get(cid))
         results[cid] = entry
 
         # Checkpoint every 25 CIDs so a crash doesn't lose all progress
@@ -170,7 +184,10 @@ async def main(args) -> None:
         logger.warning("No CIDs found. Check --extractions_dir path.")
         return
 
-    await build_representations(cids, args.output, args.delay, args.timeout, logger)
+    try:
+        await build_representations(cids, args.output, args.delay, args.timeout, logger, None if args.no_cache else args.cache_dir)
+    finally:
+        await close_pubchem_clients()
 
 
 if __name__ == "__main__":
@@ -197,5 +214,15 @@ if __name__ == "__main__":
         default=10,
         help="HTTP timeout in seconds for each API call (default: 10).",
     )
+    parser.add_argument(
+        "--cache_dir",
+        default=PUBCHEM_CACHE_DIR,
+        help=f"Directory of the on-disk cache of PubChem responses (default: {PUBCHEM_CACHE_DIR}).",
+    )
+    parser.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="Bypass the PubChem response cache and always query the API.",
+    )
     args = parser.parse_args()
     asyncio.run(main(args))
@@ -5,35 +5,114 @@ Author: Sameer Sadruddin
 Created: 10th December 2025
 Last Modified: 10th December 2025
 """
+# Python Imports
+import os
+import time
+import hashlib
+from itertools import batched
+
 # External Imports
 import asyncio
-from httpx import HTTPStatusError
+from httpx import HTTPError, HTTPStatusError
 
 # SciKG-Extract Data Models Imports
-from data.models.api.pubchem_property import PubChemPropertyResponse
+from data.models.api.pubchem_property import PropertyItem, PubChemPropertyResponse
 from data.models.api.pubchem_synonyms import PubChemSynonymsResponse
 
 # SciKG-Extract Utility Imports
 from scikg_extract.utils.log_handler import LogHandler
-from scikg_extract.utils.rest_client import RestClient
+from scikg_extract.utils.rest_client import RateLimiter, RestClient, is_retryable_error, retry_delay
+from scikg_extract.utils.file_utils import read_json_file, save_json_file
+
+# Directory of the content-addressed cache of PubChem responses and the age after which cached responses are refetched
+PUBCHEM_CACHE_DIR = "data/cache/pubchem"
+PUBCHEM_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Maximum number of attempts of a PubChem request failing with transient errors, and of concurrent PubChem requests and requests per second, as PubChem allows at most 5 requests per second
+PUBCHEM_MAX_ATTEMPTS = 5
+PUBCHEM_MAX_CONCURRENCY = 5
+PUBCHEM_MAX_REQUESTS_PER_SECOND = 5
+
+# Maximum number of CIDs requested together in one PubChem property request
+PUBCHEM_CID_BATCH_SIZE = 200
+
+# Responses fetched during this run, keyed like the on-disk cache, so repeated requests skip the cache files as well
+_responses: dict[str, dict] = {}
+
+# Semaphore bounding the concurrent PubChem requests of this run and limiter spacing them within the PubChem rate limit
+_request_slots = asyncio.Semaphore(PUBCHEM_MAX_CONCURRENCY)
+_rate_limiter = RateLimiter(PUBCHEM_MAX_REQUESTS_PER_SECOND)
+
+# REST clients shared by all requests of this run, keyed by base URL and timeout, so connections are kept alive between requests
+_clients: dict[tuple[str, int], RestClient] = {}
+
+def get_pubchem_client(base_url: str, timeout: int = 10) -> RestClient:
+    """
+    Returns the REST client shared by all PubChem requests to a base URL, creating it on first use.
+    Args:
+        base_url (str): The base URL for the PubChem API.
+        timeout (int, optional): The timeout for the requests in seconds. Defaults to 10.
+    Returns:
+        RestClient: The shared REST client.
+    """
+    if (base_url, timeout) not in _clients:
+        _clients[(base_url, timeout)] = RestClient(base_url=base_url, timeout=timeout)
+    return _clients[(base_url, timeout)]
+
+async def close_pubchem_clients() -> None:
+    """
+    Closes the shared REST clients. Must be awaited in the event loop that made the requests, before it ends.
+    """
+    for client in _clients.values():
+        await client.close()
+    _clients.clear()
 
-async def pubchem_get_request(base_url: str, endpoint: str, timeout: int = 10, params: dict = None):
+async def pubchem_get_request(base_url: str, endpoint: str, timeout: int = 10, params: dict = None, cache_dir: str | None = PUBCHEM_CACHE_DIR):
     """
-    Makes a GET request to the specified PubChem API endpoint and returns the JSON response.
+    Makes a GET request to the specified PubChem API endpoint and returns the JSON response. Responses are memoized for the run and cached on disk, so compounds recurring across documents are only requested once per cache TTL. Transient errors (network errors, rate limiting and server overload) are retried with exponential backoff, and requests are spaced to stay within the PubChem rate limit.
     Args:
         base_url (str): The base URL for the PubChem API.
         endpoint (str): The specific API endpoint to query.
         timeout (int, optional): The timeout for the request in seconds. Defaults to 10.
+        params (dict, optional): The query parameters of the request. Defaults to None.
+        cache_dir (str | None, optional): Directory of the content-addressed response cache. Disabled if None. Defaults to PUBCHEM_CACHE_DIR.
     Returns:
         dict: The JSON response from the PubChem API.
     Raises:
         httpx.HTTPError: If an error occurs during the request.
     """
-    restclient = RestClient(base_url=base_url, timeout=timeout)
-    response = await restclient.get(endpoint, params=params)
+    # Return the response already fetched during this run
+    cache_key = hashlib.sha256(f"{base_url}|{endpoint}|{sorted((params or {}).items())}".encode("utf-8")).hexdigest()
+    if cache_key in _responses: return _responses[cache_key]
+
+    # Return the cached response of the request unless it has expired
+    if cache_dir:
+        cache_path = f"{cache_dir}/{cache_key[:2]}/{cache_key}.json"
+        try:
+            is_fresh = time.time() - os.path.getmtime(cache_path) < PUBCHEM_CACHE_TTL
+        except OSError:
+            is_fresh = False
+        response = read_json_file(cache_path) if is_fresh else None
+        if response is not None:
+            _responses[cache_key] = response
+            return response
+
+    for attempt in range(PUBCHEM_MAX_ATTEMPTS):
+        try:
+            async with _request_slots:
+                await asyncio.sleep(_rate_limiter.reserve())
+                response = await get_pubchem_client(base_url, timeout).get(endpoint, params=params)
+            break
+        except HTTPError as e:
+            if attempt == PUBCHEM_MAX_ATTEMPTS - 1 or not is_retryable_error(e): raise
+            await asyncio.sleep(retry_delay(attempt, e))
+
+    # Cache the response for later requests
+    _responses[cache_key] = response
+    if cache_dir: save_json_file(f"{cache_dir}/{cache_key[:2]}", f"{cache_key}.json", response, indent=None)
     return response
 
-async def fetch_compound_by_cid(cid: str, properties: list[str], base_url: str, timeout: int = 10) -> PubChemPropertyResponse:
+async def fetch_compound_by_cid(cid: str, properties: list[str], base_url: str, timeout: int = 10, cache_dir: str | None = PUBCHEM_CACHE_DIR) -> PubChemPropertyResponse:
     """
     Fetches compound properties from PubChem by CID.
     Args:
@@ -41,6 +120,7 @@ async def fetch_compound_by_cid(cid: str, properties: list[str], base_url: str,
         properties (list[str]): List of properties to fetch.
         base_url (str): The base URL for the PubChem API.
         timeout (int, optional): The timeout for the request in seconds. Defaults to 10.
+        cache_dir (str | None, optional): Directory of the content-addressed response cache. Disabled if None. Defaults to PUBCHEM_CACHE_DIR.
     Returns:
         PubChemPropertyResponse: The response model containing compound properties.
     Raises:
@@ -52,7 +132,7 @@ async def fetch_compound_by_cid(cid: str, properties: list[str], base_url: str,
 
     try:
         endpoint = f"compound/cid/{cid}/property/{','.join(properties)}/JSON"
-        response_json = await pubchem_get_request(base_url, endpoint, timeout)
+        response_json = await pubchem_get_request(base_url, endpoint, timeout, cache_dir=cache_dir)
         response_model = PubChemPropertyResponse.model_validate(response_json)
         return response_model
     except HTTPStatusError as e:
@@ -60,7 +140,37 @@ async def fetch_compound_by_cid(cid: str, properties: list[str], base_url: str,
     except Exception as e:
         logger.error(f"Exception occurred while fetching CID {cid}: {e}")
 
-async def fetch_compound_by_name(name: str, properties: list[str], base_url: str, timeout: int = 10) -> PubChemPropertyResponse:
+async def fetch_compounds_by_cids(cids: list[str], properties: list[str], base_url: str, timeout: int = 10, cache_dir: str | None = PUBCHEM_CACHE_DIR) -> dict[str, PropertyItem]:
+    """
+    Fetches compound properties from PubChem for many CIDs, requesting up to PUBCHEM_CID_BATCH_SIZE comma-separated CIDs per request instead of one request per CID.
+    Args:
+        cids (list[str]): The PubChem Compound IDs.
+        properties (list[str]): List of properties to fetch.
+        base_url (str): The base URL for the PubChem API.
+        timeout (int, optional): The timeout for the request in seconds. Defaults to 10.
+        cache_dir (str | None, optional): Directory of the content-addressed response cache. Disabled if None. Defaults to PUBCHEM_CACHE_DIR.
+    Returns:
+        dict[str, PropertyItem]: The properties of each CID found, keyed by CID. CIDs of failed requests are missing.
+    """
+    # Initialize Logger
+    logger = LogHandler.get_logger("pubchem_api.fetch_compounds_by_cids")
+    logger.info(f"Fetching properties for {len(cids)} CIDs from PubChem with properties: {properties}")
+
+    # Request the CIDs batch by batch, keeping within the PubChem request rate limits
+    property_items: dict[str, PropertyItem] = {}
+    for batch in batched(cids, PUBCHEM_CID_BATCH_SIZE):
+        try:
+            endpoint = f"compound/cid/{','.join(batch)}/property/{','.join(properties)}/JSON"
+            response_json = await pubchem_get_request(base_url, endpoint, timeout, cache_dir=cache_dir)
+            response_model = PubChemPropertyResponse.model_validate(response_json)
+            property_items.update({str(item.CID): item for item in response_model.PropertyTable.Properties})
+        except HTTPStatusError as e:
+            logger.error(f"HTTP error occurred while fetching {len(batch)} CIDs starting at {batch[0]}: {e}")
+        except Exception as e:
+            logger.error(f"Exception occurred while fetching {len(batch)} CIDs starting at {batch[0]}: {e}")
+    return property_items
+
+async def fetch_compound_by_name(name: str, properties: list[str], base_url: str, timeout: int = 10, cache_dir: str | None = PUBCHEM_CACHE_DIR) -> PubChemPropertyResponse:
     """
     Fetches compound properties from PubChem by compound name.
     Args:
@@ -68,6 +178,7 @@ async def fetch_compound_by_name(name: str, properties: list[str], base_url: str
         properties (list[str]): List of properties to fetch.
         base_url (str): The base URL for the PubChem API.
         timeout (int, optional): The timeout for the request in seconds. Defaults to 10.
+        cache_dir (str | None, optional): Directory of the content-addressed response cache. Disabled if None. Defaults to PUBCHEM_CACHE_DIR.
     Returns:
         PubChemPropertyResponse: The response model containing compound properties.
     Raises:
@@ -79,7 +190,7 @@ async def fetch_compound_by_name(name: str, properties: list[str], base_url: str
 
     try:
         endpoint = f"compound/name/{name}/property/{','.join(properties)}/JSON"
-        response_json = await pubchem_get_request(base_url, endpoint, timeout)
+        response_json = await pubchem_get_request(base_url, endpoint, timeout, cache_dir=cache_dir)
         response_model = PubChemPropertyResponse.model_validate(response_json)
         return response_model
     except HTTPStatusError as e:
@@ -87,13 +198,14 @@ async def fetch_compound_by_name(name: str, properties: list[str], base_url: str
     except Exception as e:
         logger.error(f"Exception occurred while fetching compound '{name}': {e}")
 
-async def fetch_synonyms_by_cid(cid: str, base_url: str, timeout: int = 10) -> PubChemSynonymsResponse:
+async def fetch_synonyms_by_cid(cid: str, base_url: str, timeout: int = 10, cache_dir: str | None = PUBCHEM_CACHE_DIR) -> PubChemSynonymsResponse:
     """
     Fetches compound synonyms from PubChem by CID.
     Args:
         cid (str): The PubChem Compound ID.
         base_url (str): The base URL for the PubChem API.
         timeout (int, optional): The timeout for the request in seconds. Defaults to 10.
+        cache_dir (str | None, optional): Directory of the content-addressed response cache. Disabled if None. Defaults to PUBCHEM_CACHE_DIR.
     Returns:
         PubChemSynonymsResponse: The response model containing compound synonyms.
     Raises:
@@ -105,7 +217,7 @@ async def fetch_synonyms_by_cid(cid: str, base_url: str, timeout: int = 10) -> P
 
     try:
         endpoint = f"compound/cid/{cid}/synonyms/JSON"
-        response_json = await pubchem_get_request(base_url, endpoint, timeout)
+        response_json = await pubchem_get_request(base_url, endpoint, timeout, cache_dir=cache_dir)
         response_model = PubChemSynonymsResponse.model_validate(response_json)
         return response_model
     except HTTPStatusError as e:
@@ -113,13 +225,14 @@ async def fetch_synonyms_by_cid(cid: str, base_url: str, timeout: int = 10) -> P
     except Exception as e:
         logger.error(f"Exception occurred while fetching synonyms for CID {cid}: {e}")
 
-async def fetch_synonyms_by_name(name: str, base_url: str, timeout: int = 10) -> PubChemSynonymsResponse:
+async def fetch_synonyms_by_name(name: str, base_url: str, timeout: int = 10, cache_dir: str | None = PUBCHEM_CACHE_DIR) -> PubChemSynonymsResponse:
     """
     Fetches compound synonyms from PubChem by compound name.
     Args:
         name (str): The compound name.
         base_url (str): The base URL for the PubChem API.
         timeout (int, optional): The timeout for the request in seconds. Defaults to 10.
+        cache_dir (str | None, optional): Directory of the content-addressed response cache. Disabled if None. Defaults to PUBCHEM_CACHE_DIR.
     Returns:
         PubChemSynonymsResponse: The response model containing compound synonyms.
     Raises:
@@ -131,7 +244,7 @@ async def fetch_synonyms_by_name(name: str, base_url: str, timeout: int = 10) ->
 
     try:
         endpoint = f"compound/name/{name}/synonyms/JSON"
-        response_json = await pubchem_get_request(base_url, endpoint, timeout)
+        response_json = await pubchem_get_request(base_url, endpoint, timeout, cache_dir=cache_dir)
         response_model = PubChemSynonymsResponse.model_validate(response_json)
         return response_model
     except HTTPStatusError as e:
@@ -150,20 +263,20 @@ async def main():
     pubchem_base_url = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
     pubchem_timeout = 10
 
-    # Example usage: Fetch properties for a compound by CID
+    # Example usage: Fetch properties for a compound by CID, properties from a compound by name and synonyms for a compound by name concurrently over the shared client
     cid = "3007857"  # CID for Zinc Oxide
-    response = await fetch_compound_by_cid(cid, ["MolecularFormula", "IUPACName", "CanonicalSMILES", "InChIKey"], pubchem_base_url, pubchem_timeout)
-    logger.info(f"Properties for CID {cid}: \n{response}")
-
-    # Example usage: Fetch properties from a compound by name
-    compound_name = "Zinc Oxide"
-    response = await fetch_compound_by_name(compound_name, ["MolecularFormula", "IUPACName", "CanonicalSMILES", "InChIKey"], pubchem_base_url, pubchem_timeout)
-    logger.info(f"Properties for compound '{compound_name}': \n{response}")
-
-    # # Example usage: Fetch synonyms for a compound by name
-    compound_name = "ZnO"
-    response = await fetch_synonyms_by_name(compound_name, pubchem_base_url, pubchem_timeout)
-    logger.info(f"Synonyms for compound '{compound_name}': \n{response}")
+    properties = ["MolecularFormula", "IUPACName", "CanonicalSMILES", "InChIKey"]
+    try:
+        cid_response, name_response, synonyms_response = await asyncio.gather(
+            fetch_compound_by_cid(cid, properties, pubchem_base_url, pubchem_timeout),
+            fetch_compound_by_name("Zinc Oxide", properties, pubchem_base_url, pubchem_timeout),
+            fetch_synonyms_by_name("ZnO", pubchem_base_url, pubchem_timeout)
+        )
+    finally:
+        await close_pubchem_clients()
+    logger.info(f"Properties for CID {cid}: \n{cid_response}")
+    logger.info(f"Properties for compound 'Zinc Oxide': \n{name_response}")
+    logger.info(f"Synonyms for compound 'ZnO': \n{synonyms_response}")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -22,6 +22,7 @@ if __name__ == "__main__":
     parser.add_argument("--input_file", type=str, help="Path to the input TSV file.")
     parser.add_argument("--lmdb_path", type=str, help="Path to the output LMDB database.")
     parser.add_argument("--compression", action="store_true", default=True, help="Enable compression for LMDB values.")
+    parser.add_argument("--workers", type=int, help="Number of worker processes parsing the input file. Defaults to the number of CPUs.")
 
     # Parse the arguments
     args = parser.parse_args()
@@ -40,4 +41,4 @@ if __name__ == "__main__":
 
     # Build the LMDB database from the input TSV file
     logger.info("Building PubChem LMDB database...")
-    build_lmdb_from_file(input_file, lmdb_path, compression=args.compression)
\ No newline at end of file
+    build_lmdb_from_file(input_file, lmdb_path, compression=args.compression, workers=args.workers)
\ No newline at end of file
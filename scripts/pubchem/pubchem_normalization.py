@@ -1,13 +1,16 @@
 # Python Imports
 import os
 import sys
+import glob
 import argparse
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 # External Imports
 import lmdb
 
 # SciKG_Extract Service Imports
-from scikg_extract.services.pubchem_cid_mapping import open_env_for_read
+from scikg_extract.services.pubchem_cid_mapping import get_shared_env
 
 # SciKG_Extract Config Imports
 from scikg_extract.config.normalization.normalizationConfig import NormalizationConfig
@@ -17,10 +20,13 @@ from scikg_extract.tools.extraction.pubchem_normalization import normalize_value
 from scikg_extract.tools.extraction.pubchem_normalization import normalize_with_lookup_dict
 from scikg_extract.tools.extraction.pubchem_normalization import normalize_value_with_pubchem_cid_mapping
 from scikg_extract.tools.extraction.pubchem_normalization import perform_llm_disambiguation
+from scikg_extract.tools.extraction.pubchem_normalization import prefetch_pubchem_api_uris
+from scikg_extract.tools.extraction.pubchem_normalization import prefetch_llm_disambiguations
 from scikg_extract.tools.extraction.pubchem_normalization import update_process_json_with_normalized_value
 
 # SciKG_Extract Utils Imports
 from scikg_extract.utils.log_handler import LogHandler
+from scikg_extract.utils.debounced_saver import DebouncedJsonSaver
 from scikg_extract.utils.dict_utils import get_value_by_path
 from scikg_extract.utils.file_utils import read_json_file, save_json_file
 from scikg_extract.utils.string_utils import normalize_string
@@ -36,12 +42,9 @@ def update_synonym_to_cid_mapping(synonym_to_cid_mapping: dict[str, str], value:
         dict[str, str]: The updated synonym to CID mapping dictionary.
     """
     
-    # Create comma-separated string of CIDs
-    cid_string = ",".join([cid.split("/")[-1] for cid in cids])
-
-    # Update the mapping dictionary
-    if value.lower() not in synonym_to_cid_mapping or value not in synonym_to_cid_mapping:
-        synonym_to_cid_mapping[value] = cid_string
+    # Add the synonym to the mapping dictionary unless it is already mapped
+    if value not in synonym_to_cid_mapping:
+        synonym_to_cid_mapping[value] = ",".join(cid.rpartition("/")[2] for cid in cids)
 
     # Return the updated mapping dictionary
     return synonym_to_cid_mapping
@@ -89,6 +92,14 @@ def normalize_process_json(data: dict, lmdb_env: lmdb.Environment, properties_to
     logger = LogHandler.get_logger("scikg_extract.normalize_process_json")
     logger.debug("Starting normalization of process JSON data...")
 
+    # Query the PubChem API for all values of the included properties concurrently up front
+    included_paths = [path for path in properties_to_normalize if path not in properties_to_exclude]
+    included_values = [normalize_string(value) for path in included_paths for value, _ in get_value_by_path(data, path)]
+    prefetch_pubchem_api_uris(included_values, synonym_to_cid_mapping)
+
+    # Disambiguate all values left unresolved by the normalizers with the LLM in a single batch
+    prefetch_llm_disambiguations(included_values, "gpt-5", lmdb_env, synonym_to_cid_mapping)
+
     # Normalize each specified property
     for path in properties_to_normalize:
 
@@ -151,10 +162,13 @@ if __name__ == "__main__":
     # Configure argument parser
     parser = argparse.ArgumentParser(description="Normalize values with PubChem CIDs from extracted Process JSON data.")
     parser.add_argument("--input_json", type=str, help="Path to the extracted process JSON file.")
+    parser.add_argument("--input_json_glob", type=str, help="Glob pattern of extracted process JSON files to normalize in one run, sharing the LMDB environment and synonym to CID mapping. Each file is saved under --output_json at its path relative to the common directory of the matched files. Overrides --input_json.")
     parser.add_argument("--output_json", type=str, help="Path to save the normalized JSON file.")
     parser.add_argument("--key", type=str, default="processes", help="Key containing nested JSON data to normalize")
     parser.add_argument("--lmdb_pubchem_path", type=str, help="Path to the LMDB PubChem CID mapping database.")
     parser.add_argument("--pubchem_lookup_dict_path", type=str, help="Path to the manual curated PubChem CID mapping lookup dictionary JSON file.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Number of processes to normalize concurrently.")
+    parser.add_argument("--mapping_save_interval", type=float, default=30.0, help="Minimum number of seconds between two saves of the updated PubChem synonym to CID mapping.")
 
     # Parse arguments
     args = parser.parse_args()
@@ -179,44 +193,56 @@ if __name__ == "__main__":
     properties_to_exclude = NormalizationConfig.exclude_paths
     logger.info(f"Total properties to exclude from normalization: {len(properties_to_exclude)}, Properties: {properties_to_exclude}")
 
-    # Input JSON file path
+    # Input JSON file paths
     input_json = args.input_json if args.input_json else "results/extracted-data/ALD/version2/ZnO-IGZO-papers/experimental-usecase/ZnO/ZnEt2 - H2O/gpt-4o/2 Lujala et al.json"
-    logger.info(f"Input JSON file: {input_json}")
+    input_jsons = sorted(glob.glob(args.input_json_glob, recursive=True)) if args.input_json_glob else [input_json]
+    logger.info(f"Input JSON files: {len(input_jsons)}")
 
-    # Extract Input JSON file name with extension
-    input_filename = input_json.split("/")[-1]
-    logger.debug(f"Input JSON file name: {input_filename}")
+    # Common directory of the matched input files, whose structure is mirrored under the output directory so files with the same name do not overwrite each other
+    input_root = os.path.commonpath([os.path.dirname(path) for path in input_jsons]) if len(input_jsons) > 1 else None
 
     # Output JSON file path
     output_json = args.output_json if args.output_json else "results/extracted-data/ALD/version5/ZnO-IGZO-papers/experimental-usecase/ZnO/ZnEt2 - H2O/gpt-4o"
     logger.info(f"Output JSON file: {output_json}")
 
-    # Open LMDB PubChem CID mapping environment
+    # Open the LMDB PubChem CID mapping environment once for all input files
     lmdb_pubchem_path = args.lmdb_pubchem_path if args.lmdb_pubchem_path else "data/external/pubchem/pubchem_cid_lmdb"
-    env = open_env_for_read(lmdb_pubchem_path, readonly=True)
+    env = get_shared_env(lmdb_pubchem_path)
     logger.info(f"Opened LMDB PubChem CID mapping environment from: {lmdb_pubchem_path}")
 
-    # Read the input JSON data
-    data = read_json_file(input_json)
-    data = data.get(args.key, data) if args.key else data
-    logger.info(f"Total processes in input data: {len(data)}")
-
-    # Normalize the process JSON data
-    for index, process in enumerate(data):
-        # Normalize the process JSON data
-        logger.info(f"Normalizing process {index + 1}/{len(data)}...")
-        synonym_to_cid_mapping = normalize_process_json(process, env, properties_to_normalize, properties_to_exclude, synonym_to_cid_mapping)
-        logger.info(f"Completed normalization for process {index + 1}/{len(data)}.")
-
-        # Sort the synonym to CID mapping dictionary by keys
-        synonym_to_cid_mapping = dict(sorted(synonym_to_cid_mapping.items()))
-
-        # Save the updated synonym to CID mapping file
-        file_saved = save_json_file(os.path.dirname(pubchem_lookup_dict_path), "PubChem-Synonym-CID.json", synonym_to_cid_mapping)
-        if not file_saved: raise Exception("Error saving PubChem synonym to CID mapping JSON file.")
+    # Saver writing the updated synonym to CID mapping back to the lookup dictionary file at most once per save interval
+    mapping_saver = DebouncedJsonSaver(os.path.dirname(pubchem_lookup_dict_path), "PubChem-Synonym-CID.json", synonym_to_cid_mapping, args.mapping_save_interval, sort_keys=True)
+    normalize_process = partial(normalize_process_json, lmdb_env=env, properties_to_normalize=properties_to_normalize, properties_to_exclude=properties_to_exclude)
+
+    try:
+        for input_json in input_jsons:
+            logger.info(f"Input JSON file: {input_json}")
+
+            # Extract Input JSON file name with extension
+            input_filename = input_json.split("/")[-1]
+            logger.debug(f"Input JSON file name: {input_filename}")
+
+            # Read the input JSON data
+            data = read_json_file(input_json)
+            data = data.get(args.key, data) if args.key else data
+            logger.info(f"Total processes in input data: {len(data)}")
+
+            # Normalize the processes concurrently to overlap the PubChem and LLM request latency, each on its own copy of the synonym to CID mapping
+            logger.info(f"Normalizing {len(data)} processes with concurrency: {args.concurrency}")
+            with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+                futures = [executor.submit(normalize_process, process, synonym_to_cid_mapping=dict(synonym_to_cid_mapping)) for process in data]
+
+                # Merge the updated synonym to CID mapping of each process into the periodically saved one, surfacing exceptions raised in the worker threads
+                for index, future in enumerate(futures):
+                    if not mapping_saver.update(future.result()): raise Exception("Error saving PubChem synonym to CID mapping JSON file.")
+                    logger.info(f"Completed normalization for process {index + 1}/{len(data)}.")
+
+            # Save the normalized JSON data to output file, mirroring the input directory structure for multiple input files
+            output_dir = os.path.normpath(os.path.join(output_json, os.path.relpath(os.path.dirname(input_json), input_root))) if input_root is not None else output_json
+            file_saved = save_json_file(output_dir, input_filename, data)
+            if not file_saved: raise Exception("Error saving normalized JSON file.")
+            logger.info(f"Normalized JSON data saved to: {output_dir}/{input_filename}")
+    finally:
+        # Save the remaining updates of the synonym to CID mapping sorted by keys, also when interrupted
+        if not mapping_saver.flush(): raise Exception("Error saving PubChem synonym to CID mapping JSON file.")
         logger.info(f"Updated PubChem synonym to CID mapping saved to: {pubchem_lookup_dict_path}")
-    
-    # Save the normalized JSON data to output file
-    file_saved = save_json_file(output_json, input_filename, data)
-    if not file_saved: raise Exception("Error saving normalized JSON file.")
-    logger.info(f"Normalized JSON data saved to: {output_json}")
\ No newline at end of file
@@ -7,28 +7,22 @@ Last Modified: November 21, 2025
 """
 # Python imports
 import os
+import re
 import argparse
 from pathlib import Path
+from functools import partial
 from collections import defaultdict
-from typing import Any, Optional, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional, Set
 
 # Scikg_Extract imports
 from scikg_extract.utils.log_handler import LogHandler
-from scikg_extract.utils.file_utils import load_json_input
+from scikg_extract.utils.dict_utils import flatten_record
+from scikg_extract.utils.file_utils import iter_files, load_json_input
 
 # Pandas import
 import pandas as pd
 
-def is_primitive(val: Any) -> bool:
-    """
-    Check if a value is a primitive type (str, int, float, bool, None).
-    Args:
-        val (Any): The value to check.
-    Returns:
-        bool: True if the value is a primitive type, otherwise False.
-    """
-    return isinstance(val, (str, int, float, bool)) or val is None
-
 def parse_number(val: Any) -> Optional[float]:
     """
     Parse a value as a float, handling common formats like percentages and commas.
@@ -81,55 +75,76 @@ def samples_from_document(obj: Any) -> list[dict]:
     # Return the list of samples
     return samples
 
-def flatten_record(rec: Any, prefix: str = "") -> list[Tuple[str, Any]]:
+def compute_stats_for_file(file_info: tuple[str, str], skip_keys: list[str] = [], key: str = None) -> tuple[str, dict[str, int], dict[str, Set[str]], dict[str, tuple[float, float]]]:
     """
-    Flatten a nested record (dicts/lists) into (property_path, value) pairs.
+    Compute the partial data statistics of a single extracted JSON file. Runs inside a worker process.
     Args:
-        rec (Any): The record to flatten (could be a dict, list, or primitive).
-        prefix (str): The prefix for property paths (used in recursion).
+        file_info (tuple[str, str]): The path to the JSON file and its filename.
+        skip_keys (List[str]): List of properties which has to be skipped if found in the property path.
+        key (str): If specified, only process nested JSON objects under this key.
     Returns:
-        List[Tuple[str, Any]]: A list of (property_path, value) pairs.
+        tuple: The filename with the occurrences, distinct string values and numeric (min, max) range of each property found in the file.
     """
-    # Initialize output list
-    out: list[Tuple[str, Any]] = []
-    
-    # Flatten a nested record (dicts/lists) into (property_path, value) pairs.
-    if is_primitive(rec):
-        out.append((prefix.rstrip(".") or "(root)", rec)) 
-        return out
-
-    # Handle dicts
-    if isinstance(rec, dict):
-        for k, v in rec.items():
-            new_prefix = f"{prefix}{k}"
-            if is_primitive(v):
-                out.append((new_prefix, v))
+
+    # Initialize the logger
+    logger = LogHandler.get_logger("data_statistics.compute_stats_for_file")
+
+    # Compile skipped properties into a single pattern applied during flattening
+    skip = re.compile("|".join(map(re.escape, skip_keys))).search if skip_keys else None
+
+    # Stats accumulators
+    occurrences: dict[str, int] = defaultdict(int)
+    distinct_strings: dict[str, Set[str]] = defaultdict(set)
+    numeric_ranges: dict[str, tuple[float, float]] = {}
+
+    # Read and parse the JSON file
+    file_path, fname = file_info
+    doc = load_json_input(Path(file_path))
+
+    # If a specific key is provided, extract that part of the JSON
+    if key is not None and isinstance(doc, dict):
+        doc = doc.get(key, {})
+
+    # Extract samples from the document
+    samples = samples_from_document(doc)
+    if not samples: return fname, {}, {}, {}
+    logger.info(f"Found {len(samples)} samples in file: {fname}")
+
+    # Process each sample in the file
+    for sample in samples:
+
+        # Flatten the sample, pruning skipped properties by substring match
+        for prop_path, raw_val in flatten_record(sample, skip=skip):
+            
+            # Skip empty values
+            if raw_val is None or (isinstance(raw_val, str) and raw_val.strip() == ""):
+                continue
+            
+            # Update occurrences
+            occurrences[prop_path] += 1
+
+            # Numeric parsing
+            parsed_num = parse_number(raw_val)
+
+            # Store values based on type
+            if parsed_num is not None:
+                min_v, max_v = numeric_ranges.get(prop_path, (parsed_num, parsed_num))
+                numeric_ranges[prop_path] = (min(min_v, parsed_num), max(max_v, parsed_num))
             else:
-                out.extend(flatten_record(v, new_prefix + "."))
-        return out
-
-    # Handle lists
-    if isinstance(rec, list):
-        if not rec:
-            return out
-        if all(is_primitive(x) for x in rec):
-            for v in rec:
-                out.append((prefix.rstrip(".") or "(root)", v))
-            return out
-        for idx, item in enumerate(rec):
-            out.extend(flatten_record(item, f"{prefix}[{idx}]."))
-        return out
-    
-    # Return empty if not handled
-    return out
+                # String / other (including booleans as "True"/"False") -> convert to string and add to set
+                distinct_strings[prop_path].add(str(raw_val))
 
-def compute_stats_for_folder(input_dir: str, skip_keys: list[str] = [], key: str = None) -> pd.DataFrame:
+    # Return the partial statistics of the file
+    return fname, dict(occurrences), dict(distinct_strings), numeric_ranges
+
+def compute_stats_for_folder(input_dir: str, skip_keys: list[str] = [], key: str = None, max_workers: int | None = None) -> pd.DataFrame:
     """
-    Compute data statistics from extracted JSON files in a specified directory.
+    Compute data statistics from extracted JSON files in a specified directory. Files are parsed in parallel worker processes and their partial statistics merged in the main process.
     Args:
         input_dir (str): The directory containing the JSON files.
         skip_keys (List[str]): List of properties which has to be skipped if found in the property path.
         key (str): If specified, only process nested JSON objects under this key.
+        max_workers (int | None): Number of worker processes used to parse JSON files. Defaults to the number of CPUs.
     Returns:
         pd.DataFrame: A DataFrame containing the computed statistics.
     """
@@ -142,82 +157,36 @@ def compute_stats_for_folder(input_dir: str, skip_keys: list[str] = [], key: str
     papers_with_property: dict[str, Set[str]] = defaultdict(set)
     occurrences: dict[str, int] = defaultdict(int)
     distinct_strings: dict[str, Set[str]] = defaultdict(set)
-    numeric_values: dict[str, list[float]] = defaultdict(list)
-
-    # Process each JSON file in the input directory
-    for root, _, filenames in os.walk(input_dir):
-
-        # Skipping if no files in the directory
-        if not filenames: continue
-
-        # Iterate over each file
-        logger.info(f"Total files found in {root}: {len(filenames)}")
-        for fname in filenames:
-            
-            # Only process JSON files
-            if not fname.lower().endswith(".json"): continue
-            logger.info(f"Processing file: {fname}")
-
-            # Read and parse the JSON file
-            doc = load_json_input(Path(os.path.join(root, fname)))
-
-            # If a specific key is provided, extract that part of the JSON
-            if key is not None and isinstance(doc, dict):
-                doc = doc.get(key, {})
-
-            # Extract samples from the document
-            samples = samples_from_document(doc)
-            if not samples: continue
-            logger.info(f"Found {len(samples)} samples in file: {fname}")
-
-            # Intialize set to track properties seen in this file
-            props_seen_in_file: Set[str] = set()
-
-            # Process each sample in the file
-            for sample in samples:
-                for prop_path, raw_val in flatten_record(sample, prefix=""):
-                    
-                    # Skip empty values
-                    if raw_val is None or (isinstance(raw_val, str) and raw_val.strip() == ""):
-                        continue
-
-                    # Skip specified keys
-                    if any(skip_key in prop_path for skip_key in skip_keys):
-                        continue
-                    
-                    # Update occurrences and papers_with_property
-                    occurrences[prop_path] += 1
-                    props_seen_in_file.add(prop_path)
-
-                    # Numeric parsing
-                    parsed_num = parse_number(raw_val)
-
-                    # Store values based on type
-                    if parsed_num is not None:
-                        numeric_values[prop_path].append(parsed_num)
-                    else:
-                        # Treat as string-like
-                        if isinstance(raw_val, bool):
-                            # Booleans we record in strings set as "true"/"false"
-                            distinct_strings[prop_path].add(str(raw_val))
-                        else:
-                            # String / other -> convert to string and add to set
-                            distinct_strings[prop_path].add(str(raw_val))
-
-            # Update papers_with_property using the set found in this file
-            for p in props_seen_in_file:
-                papers_with_property[p].add(fname)
+    numeric_ranges: dict[str, tuple[float, float]] = {}
+
+    # Collect the JSON files in the input directory
+    json_files = [(entry.path, entry.name) for entry in iter_files(input_dir) if entry.name.lower().endswith(".json")]
+    logger.info(f"Total JSON files found in {input_dir}: {len(json_files)}")
+
+    # Compute the statistics of each file in parallel and merge them in the main process
+    compute_file_stats = partial(compute_stats_for_file, skip_keys=skip_keys, key=key)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for fname, file_occurrences, file_distinct_strings, file_numeric_ranges in executor.map(compute_file_stats, json_files, chunksize=16):
+            logger.info(f"Processed file: {fname}")
+
+            # Update occurrences and papers_with_property using the properties found in this file
+            for prop, occ in file_occurrences.items():
+                occurrences[prop] += occ
+                papers_with_property[prop].add(fname)
+            for prop, values in file_distinct_strings.items():
+                distinct_strings[prop].update(values)
+            for prop, (min_v, max_v) in file_numeric_ranges.items():
+                prev_min, prev_max = numeric_ranges.get(prop, (min_v, max_v))
+                numeric_ranges[prop] = (min(prev_min, min_v), max(prev_max, max_v))
 
     # build summary
     rows = []
-    for prop in sorted(set(list(occurrences.keys()) + list(distinct_strings.keys()) + list(numeric_values.keys()))):
+    for prop in sorted(set(list(occurrences.keys()) + list(distinct_strings.keys()) + list(numeric_ranges.keys()))):
         num_papers = len(papers_with_property.get(prop, set()))
         occ = occurrences.get(prop, 0)
         distinct_count = len(distinct_strings.get(prop, set()))
         distinct_sample_list = sorted(list(distinct_strings.get(prop, set()))) if distinct_count > 0 else []
-        nums = numeric_values.get(prop, [])
-        min_v = float(min(nums)) if nums else None
-        max_v = float(max(nums)) if nums else None
+        min_v, max_v = numeric_ranges.get(prop, (None, None))
 
         # Create the summary row
         rows.append(
@@ -244,6 +213,7 @@ if __name__ == "__main__":
     parser.add_argument("--output_csv", type=str, required=False, help="Output CSV file path for statistics.")
     parser.add_argument("--skip_keys", type=str, nargs='*', default=[], help="List of properties to skip.")
     parser.add_argument("--key", type=str, default="processes", help="Key containing nested JSON objects to validate")
+    parser.add_argument("--max_workers", type=int, default=None, help="Number of worker processes used to parse JSON files. Defaults to the number of CPUs.")
 
     # Parse the arguments
     args = parser.parse_args()
@@ -272,7 +242,7 @@ if __name__ == "__main__":
     logger.info(f"Skipping keys: {skip_keys}")
 
     # Compute statistics for the folder
-    df = compute_stats_for_folder(input_dir, skip_keys, key=args.key)
+    df = compute_stats_for_folder(input_dir, skip_keys, key=args.key, max_workers=args.max_workers)
 
     # Print a concise table preview
     pd.set_option("display.max_rows", None)
@@ -7,52 +7,104 @@ Last Modified: November 21, 2025
 """
 # Python imports
 import os
+import sys
+import shutil
+import hashlib
 import argparse
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Scikg_Extract Imports
 from scikg_extract.utils.log_handler import LogHandler
+from scikg_extract.utils.file_utils import iter_files
 
 # Docling Imports
+import pypdfium2 as pdfium
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.pipeline_options import AcceleratorDevice, AcceleratorOptions, PdfPipelineOptions, TableFormerMode, TableStructureOptions
+from docling.datamodel.settings import settings
 from docling.document_converter import DocumentConverter, PdfFormatOption
 from docling_core.types.doc import ImageRefMode, DoclingDocument
 
-def parse_pdf(file_path: str) -> tuple[str, DoclingDocument]:
+# Batch sizes of Docling's page and element model inference, raised from the defaults (4 and 16) so the layout, table and OCR models run on larger batches. Documents are parallelized across worker processes, so the concurrency settings stay at their defaults.
+settings.perf.page_batch_size = 16
+settings.perf.elements_batch_size = 64
+
+@lru_cache(maxsize=None)
+def get_converter(num_threads: int = 4, do_ocr: bool = True, fast_tables: bool = False) -> DocumentConverter:
     """
-    Parses a PDF file to extract text and tables using Docling library.
+    Returns the Docling Document Converter of this process for a pipeline configuration, creating it and loading its PDF pipeline models on first use, so the models are loaded once per process instead of once per PDF.
 
     Args:
-        file_path (str): Path to the input PDF file.
+        num_threads (int, optional): Number of threads used by the Docling models. Defaults to 4.
+        do_ocr (bool, optional): Whether to OCR bitmap content of the pages. Defaults to True.
+        fast_tables (bool, optional): Whether to use the fast instead of the accurate TableFormer mode. Defaults to False.
     Returns:
-        tuple[str, DoclingDocument]: A tuple containing the filename (without extension) and the extracted document object.
-    Raises:
-        AssertionError: If the specified file_path does not exist.  
+        DocumentConverter: The shared Docling Document Converter.
     """
-    # Check if file_path exists
-    assert os.path.isfile(file_path), f"File {file_path} does not exist."
-
-    # Initialize the Path Object
-    pdf_path = Path(file_path)
-
     # Configure Docling PDF Pipeline Options
     pdf_options = PdfPipelineOptions(
-        do_ocr=True,
+        do_ocr=do_ocr,
         do_formula_enrichment=True,
         do_table_structure=True,
-        table_structure_options=TableStructureOptions(do_cell_matching=True, mode=TableFormerMode.ACCURATE),
+        table_structure_options=TableStructureOptions(do_cell_matching=True, mode=TableFormerMode.FAST if fast_tables else TableFormerMode.ACCURATE),
         generate_picture_images=True,
-        accelerator_options=AcceleratorOptions(num_threads=4, device=AcceleratorDevice.AUTO)
+        accelerator_options=AcceleratorOptions(num_threads=num_threads, device=AcceleratorDevice.AUTO)
     )
 
-    # Initialize Docling Document Converter
+    # Initialize Docling Document Converter and load the PDF pipeline models
     converter = DocumentConverter(
         format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=pdf_options)}
     )
+    converter.initialize_pipeline(InputFormat.PDF)
+
+    # Return the Docling Document Converter
+    return converter
+
+def has_text_layer(file_path: str, pages: int = 3, min_chars: int = 500) -> bool:
+    """
+    Checks whether a PDF is born-digital, i.e. its first pages carry an embedded text layer, so OCR can be skipped.
+
+    Args:
+        file_path (str): Path to the input PDF file.
+        pages (int, optional): Number of leading pages to inspect. Defaults to 3.
+        min_chars (int, optional): Minimum number of embedded characters across the inspected pages. Defaults to 500.
+    Returns:
+        bool: True if the inspected pages contain at least min_chars embedded characters, otherwise False.
+    """
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        char_count = 0
+        for index in range(min(pages, len(pdf))):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            char_count += textpage.count_chars()
+            textpage.close()
+            page.close()
+        return char_count >= min_chars
+    finally:
+        pdf.close()
+
+def parse_pdf(file_path: str, num_threads: int = 4, do_ocr: bool = True, fast_tables: bool = False) -> tuple[str, DoclingDocument]:
+    """
+    Parses a PDF file to extract text and tables using Docling library.
 
-    # Parse the PDF
-    parsed_document = converter.convert(source=pdf_path)
+    Args:
+        file_path (str): Path to the input PDF file.
+        num_threads (int, optional): Number of threads used by the Docling models. Defaults to 4.
+        do_ocr (bool, optional): Whether to OCR bitmap content of the pages. Defaults to True.
+        fast_tables (bool, optional): Whether to use the fast instead of the accurate TableFormer mode. Defaults to False.
+    Returns:
+        tuple[str, DoclingDocument]: A tuple containing the filename (without extension) and the extracted document object.
+    Raises:
+        FileNotFoundError: If the specified file_path does not exist.
+    """
+    # Initialize the Path Object
+    pdf_path = Path(file_path)
+
+    # Parse the PDF with the shared Docling Document Converter
+    parsed_document = get_converter(num_threads, do_ocr, fast_tables).convert(source=pdf_path)
     document = parsed_document.document
     filename = parsed_document.input.file.stem
 
@@ -78,6 +130,30 @@ def export_as_markdown(document: DoclingDocument, filename: str, output_dir: str
     with open(output_path, "w", encoding="utf-8") as md_file:
         md_file.write(document.export_to_markdown(image_mode=ImageRefMode.PLACEHOLDER))
 
+def process_pdf(file_path: str, output_dir: str, num_threads: int = 4, skip_ocr_for_digital: bool = False, fast_tables: bool = False) -> tuple[str, str | None]:
+    """
+    Parses a PDF file and exports it as Markdown. Runs inside a worker process.
+
+    Args:
+        file_path (str): Path to the input PDF file.
+        output_dir (str): Directory where the output Markdown file will be saved.
+        num_threads (int, optional): Number of threads used by the Docling models. Defaults to 4.
+        skip_ocr_for_digital (bool, optional): Whether to skip OCR for PDFs with an embedded text layer. Defaults to False.
+        fast_tables (bool, optional): Whether to use the fast instead of the accurate TableFormer mode. Defaults to False.
+    Returns:
+        tuple[str, str | None]: The file path and the error message if processing failed, otherwise None.
+    """
+    try:
+        # Parse the PDF and extract content, without OCR for born-digital PDFs if enabled
+        do_ocr = not (skip_ocr_for_digital and has_text_layer(file_path))
+        base_filename, extracted_document = parse_pdf(file_path, num_threads, do_ocr, fast_tables)
+
+        # Export the extracted content to Markdown
+        export_as_markdown(extracted_document, base_filename, output_dir)
+        return file_path, None
+    except Exception as e:
+        return file_path, str(e)
+
 if __name__ == "__main__":
     """Main function to execute the PDF text extraction and export to Markdown."""
 
@@ -85,6 +161,11 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Extract text and tables from PDF files using Docling and export to Markdown.")
     parser.add_argument("--pdf_file_path", type=str, help="Directory containing PDF files to be processed.")
     parser.add_argument("--output_dir", type=str, help="Directory to save the extracted Markdown files.")
+    parser.add_argument("--max_workers", type=int, default=max(1, (os.cpu_count() or 1) // 4), help="Number of worker processes converting PDF files in parallel. Defaults to a quarter of the CPUs.")
+    parser.add_argument("--force", action="store_true", help="Convert all PDF files again, including those with an up-to-date Markdown file.")
+    parser.add_argument("--skip_ocr_for_digital", action="store_true", help="Skip OCR for born-digital PDFs whose first pages have an embedded text layer.")
+    parser.add_argument("--fast_tables", action="store_true", help="Use the fast instead of the accurate TableFormer mode for table structure recognition.")
+    parser.add_argument("--num_threads", type=int, default=4, help="Number of threads used by the Docling models in each worker process.")
 
     # Parse the arguments
     args = parser.parse_args()
@@ -96,6 +177,9 @@ if __name__ == "__main__":
     # PDF file path
     pdf_file_path = args.pdf_file_path if args.pdf_file_path else "../../../Scripts/results/atomic_limits_dataset/processed_grobid/ALE/pdf/experimental"
     logger.info(f"PDF files directory: {pdf_file_path}")
+    if not os.path.isdir(pdf_file_path):
+        logger.error(f"PDF files directory {pdf_file_path} does not exist.")
+        sys.exit(1)
 
     # Output directory for Markdown files
     output_dir = args.output_dir if args.output_dir else "../../../Scripts/results/atomic_limits_dataset/processed_grobid/ALE/markdown/experimental"
@@ -104,45 +188,73 @@ if __name__ == "__main__":
     # Empty list to hold not processed files
     not_processed_files = []
 
-    # Process each PDF file in the specified directory
-    for root, _, files in os.walk(pdf_file_path):
+    # PDF files to process with their output directories and sizes
+    pdf_jobs: list[tuple[str, str, int]] = []
 
-        # Skip if no files in the directory
-        if not files: continue
+    # Collect each PDF file in the specified directory, using the cached directory entries of the scan
+    for entry in iter_files(pdf_file_path):
 
-        # Get the internal directory path
-        internal_dir = root.split(pdf_file_path)[-1].lstrip(os.sep)
-        logger.info(f"Processing directory: {internal_dir}")
+        # Process only PDF files
+        if entry.name[-4:].lower() != ".pdf": continue
 
-        # Process each PDF file
-        for filename in files:
+        # Create output directory preserving internal structure
+        internal_dir = os.path.relpath(os.path.dirname(entry.path), pdf_file_path)
+        output_full_dir = os.path.join(output_dir, "" if internal_dir == os.curdir else internal_dir)
 
-            # Process only PDF files
-            if not filename.lower().endswith(".pdf"): continue
-            logger.info(f"Processing file: {filename}")
+        # Check if file already processed, i.e. its Markdown is not older than the PDF
+        pdf_stat = entry.stat()
+        try:
+            is_processed = not args.force and os.path.getmtime(os.path.join(output_full_dir, f"{Path(entry.name).stem}.md")) >= pdf_stat.st_mtime
+        except OSError:
+            is_processed = False
+        if is_processed:
+            logger.info(f"File {entry.name} already processed. Skipping...")
+            continue
 
-            # Full path to the PDF file
-            file_path = os.path.join(root, filename)
+        pdf_jobs.append((entry.path, output_full_dir, pdf_stat.st_size))
 
-            # Create output directory preserving internal structure
-            output_full_dir = os.path.join(output_dir, internal_dir)
+    # Convert byte-identical copies of a PDF only once. Only PDFs sharing their size with another PDF can be copies, so only those are hashed.
+    size_counts: dict[int, int] = {}
+    for _, _, size in pdf_jobs: size_counts[size] = size_counts.get(size, 0) + 1
+    unique_jobs: dict[bytes | str, tuple[str, str, int]] = {}
+    duplicate_jobs: list[tuple[tuple[str, str, int], tuple[str, str, int]]] = []
+    for job in pdf_jobs:
+        if size_counts[job[2]] == 1:
+            unique_jobs[job[0]] = job
+            continue
+        with open(job[0], "rb") as pdf_file:
+            digest = hashlib.file_digest(pdf_file, "sha1").digest()
+        if digest in unique_jobs:
+            duplicate_jobs.append((job, unique_jobs[digest]))
+        else:
+            unique_jobs[digest] = job
+    pdf_jobs = list(unique_jobs.values())
 
-            # Check if file already processed
-            if os.path.isfile(os.path.join(output_full_dir, f"{Path(filename).stem}.md")):
-                logger.info(f"File {filename} already processed. Skipping...")
-                continue
+    # Start the largest PDFs first, so a long conversion does not hold up the end of the run
+    pdf_jobs.sort(key=lambda job: job[2], reverse=True)
 
-            try:
-                # Parse the PDF and extract content
-                base_filename, extracted_document = parse_pdf(file_path)
-                logger.debug(f"Extracted document for {filename}: {extracted_document}")
+    # Convert the PDF files in parallel worker processes
+    logger.info(f"Processing {len(pdf_jobs)} PDF files with {args.max_workers} workers...")
 
-                # Export the extracted content to Markdown
-                export_as_markdown(extracted_document, base_filename, output_full_dir)
-                logger.info(f"Exported Markdown for {filename} to {output_full_dir}/{base_filename}.md")
-            except Exception as e:
-                logger.error(f"Error processing file {filename}: {e}")
+    # Each worker loads the Docling models once on start-up, before its first PDF
+    with ProcessPoolExecutor(max_workers=args.max_workers, initializer=get_converter, initargs=(args.num_threads, True, args.fast_tables)) as executor:
+        futures = [executor.submit(process_pdf, file_path, output_full_dir, args.num_threads, args.skip_ocr_for_digital, args.fast_tables) for file_path, output_full_dir, _ in pdf_jobs]
+        for future in as_completed(futures):
+            file_path, error = future.result()
+            if error:
+                logger.error(f"Error processing file {file_path}: {error}")
                 not_processed_files.append(file_path)
+            else:
+                logger.info(f"Exported Markdown for {file_path}")
+
+    # Copy the Markdown of each converted PDF to its byte-identical copies
+    for (file_path, output_full_dir, _), (source_path, source_dir, _) in duplicate_jobs:
+        if source_path in not_processed_files:
+            not_processed_files.append(file_path)
+            continue
+        os.makedirs(output_full_dir, exist_ok=True)
+        shutil.copyfile(os.path.join(source_dir, f"{Path(source_path).stem}.md"), os.path.join(output_full_dir, f"{Path(file_path).stem}.md"))
+        logger.info(f"Copied Markdown of identical file {source_path} for {file_path}")
 
     # Log any files that were not processed
-    if not_processed_files: logger.warning(f"Files not processed: {not_processed_files}")
\ No newline at end of file
+    if not_processed_files: logger.warning(f"Files not processed: {not_processed_files}")